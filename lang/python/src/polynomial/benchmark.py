@@ -0,0 +1,418 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Class for benchmarking the multiplication methods."""
+from __future__ import annotations
+
+import csv
+import json
+import math
+import os
+
+import multiplier  # type: ignore
+import numpy
+import sds_glob  # type: ignore
+import utils  # type: ignore
+from numpy import ndarray
+
+
+# pylint: disable=too-few-public-methods
+class Benchmark:
+    """Class for benchmarking the multiplication methods."""
+
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    # Methods of the benchmark: all methods multiplying one polynomial
+    # pair, the method 'batch' multiplies whole task files.
+    METHODS = (
+        sds_glob.ARG_METHOD_AUTO,
+        sds_glob.ARG_METHOD_FFT,
+        sds_glob.ARG_METHOD_KARATSUBA,
+        sds_glob.ARG_METHOD_KRONECKER,
+        sds_glob.ARG_METHOD_NTT,
+        sds_glob.ARG_METHOD_NUMPY,
+        sds_glob.ARG_METHOD_RFFT,
+        sds_glob.ARG_METHOD_SIMPLE,
+        sds_glob.ARG_METHOD_SPARSE,
+        sds_glob.ARG_METHOD_TOOM3,
+    )
+
+    # Seed of the random polynomial pairs, so that every run times the
+    # same polynomial pairs.
+    _SEED = 4711
+
+    # Significance level of the one-sided Mann-Whitney U test of the
+    # regression check: a slowdown beyond the tolerance is a regression
+    # only if it is significant at this level.
+    _SIGNIFICANCE = 0.01
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, file_name: str, baseline: str = "") -> None:
+        """Benchmark the methods and write the result files.
+
+        All methods of 'METHODS' are timed on random polynomial pairs
+        for every point of the benchmark grid ('benchmark_coef_bits' x
+        'benchmark_degrees'), without reading or parsing a task file.
+        The float64 based methods are only timed where their result is
+        guaranteed to be exact. Every method runs 'benchmark_warmups'
+        times untimed and then 'benchmark_repetitions' times timed with
+        'time.perf_counter_ns', with the garbage collection disabled.
+        The minimum, the median and the 95th percentile of the
+        durations are written with the durations to the JSON file and
+        without them to a CSV file of the same name with the suffix
+        '.csv'.
+
+        With a baseline results file of an earlier run the results are
+        checked for regressions, see '_check_baseline'.
+
+        Args:
+            file_name (str):
+                The name of the JSON file to output.
+            baseline (str, optional):
+                The name of the baseline results file to check the
+                results against. Defaults to no check.
+        """
+        # pylint: disable=duplicate-code
+        sds_glob.logger.debug(sds_glob.LOGGER_START)
+
+        # Provide progress messages.
+        utils.progress_msg("-" * 79)
+        # INFO.00.041 Start Benchmark
+        utils.progress_msg(sds_glob.INFO_00_041)
+        utils.progress_msg("-" * 79)
+
+        # The baseline is loaded ahead, as it may be the result file.
+        baseline_results: list[dict] = []
+        if baseline:
+            if not os.path.isfile(baseline):
+                # ERROR.00.934 The specified baseline file {file_name} does
+                # not exist
+                utils.terminate_fatal(
+                    sds_glob.ERROR_00_934.replace("{file_name}", baseline)
+                )
+
+            with open(
+                baseline, "r", encoding=sds_glob.FILE_ENCODING_DEFAULT
+            ) as file_handle:
+                baseline_results = json.load(file_handle)[sds_glob.JSON_NAME_RESULTS]
+
+        results: list[dict] = []
+
+        for coef_bits in sds_glob.inst_config.get_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS
+        ):
+            coef_max = (1 << coef_bits) - 1
+
+            for degree in sds_glob.inst_config.get_config_value(
+                sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES
+            ):
+                random_generator = numpy.random.default_rng(
+                    [Benchmark._SEED, coef_bits, degree]
+                )
+                poly_1 = random_generator.integers(
+                    -coef_max, coef_max, degree + 1, endpoint=True
+                )
+                poly_2 = random_generator.integers(
+                    -coef_max, coef_max, degree + 1, endpoint=True
+                )
+
+                point_results = Benchmark._time_methods(
+                    coef_bits, degree, poly_1, poly_2
+                )
+
+                fastest = min(
+                    point_results, key=lambda result: result[sds_glob.JSON_NAME_MEDIAN]
+                )
+                utils.progress_msg_time_elapsed(
+                    fastest[sds_glob.JSON_NAME_MEDIAN],
+                    f"benchmark (coef bits: {coef_bits:2d} - degree: {degree:5d}) "
+                    + f"fastest method {fastest[sds_glob.JSON_NAME_METHOD]}",
+                )
+
+                results.extend(point_results)
+
+        self._create_result_files(file_name, results)
+
+        if baseline:
+            self._check_baseline(baseline, baseline_results, results)
+
+        # Provide progress messages.
+        utils.progress_msg("-" * 79)
+        # INFO.00.042 End   Benchmark
+        utils.progress_msg(sds_glob.INFO_00_042)
+        utils.progress_msg("-" * 79)
+
+        sds_glob.logger.debug(sds_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Check the results against the baseline results.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_baseline(
+        file_name: str, baseline_results: list[dict], results: list[dict]
+    ) -> None:
+        """Check the results against the baseline results.
+
+        A result is a regression if its median duration exceeds the
+        median duration of the baseline by more than the tolerance of
+        its method and degree (see '_get_tolerance') and if the
+        one-sided Mann-Whitney U test of its durations against the
+        durations of the baseline is significant at the level
+        '_SIGNIFICANCE', which requires at least 5 repetitions each.
+        Every result is shown with the baseline in a table, the run
+        terminates if there is any regression.
+
+        Args:
+            file_name (str): The name of the baseline results file.
+            baseline_results (list[dict]): The baseline results.
+            results (list[dict]): The results of this run.
+        """
+        baselines = {
+            (
+                result[sds_glob.JSON_NAME_METHOD],
+                result[sds_glob.JSON_NAME_COEF_BITS],
+                result[sds_glob.JSON_NAME_DEGREE],
+            ): result
+            for result in baseline_results
+        }
+
+        utils.progress_msg_core(
+            f"{'method':10s} {'coef bits':>9s} {'degree':>7s} "
+            + f"{'baseline ns':>15s} {'median ns':>15s} {'ratio':>7s} "
+            + f"{'tolerance':>9s} {'p-value':>8s}  status"
+        )
+
+        no_regressions = 0
+
+        for result in results:
+            method = result[sds_glob.JSON_NAME_METHOD]
+            coef_bits = result[sds_glob.JSON_NAME_COEF_BITS]
+            degree = result[sds_glob.JSON_NAME_DEGREE]
+            median = result[sds_glob.JSON_NAME_MEDIAN]
+
+            row = f"{method:10s} {coef_bits:9d} {degree:7d} "
+
+            baseline = baselines.get((method, coef_bits, degree))
+            if baseline is None:
+                utils.progress_msg_core(row + f"{'-':>15s} {median:15,d}  no baseline")
+                continue
+
+            status, columns = Benchmark._compare_result(baseline, result)
+            if status == "REGRESSION":
+                no_regressions += 1
+
+            utils.progress_msg_core(row + columns + f"  {status}")
+
+        if no_regressions:
+            # ERROR.00.935 {no_regressions} regression(s) against the baseline
+            # file {file_name}
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_935.replace(
+                    "{no_regressions}", str(no_regressions)
+                ).replace("{file_name}", file_name)
+            )
+
+    # ------------------------------------------------------------------
+    # Compare a result with its baseline result.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _compare_result(baseline: dict, result: dict) -> tuple[str, str]:
+        """Compare a result with its baseline result.
+
+        Args:
+            baseline (dict): The baseline result.
+            result (dict): The result of this run.
+
+        Returns:
+            tuple[str, str]: The status 'REGRESSION', 'improved' or
+                'ok' and the columns of the comparison in the table.
+        """
+        median_baseline = baseline[sds_glob.JSON_NAME_MEDIAN]
+        median = result[sds_glob.JSON_NAME_MEDIAN]
+        ratio = median / max(median_baseline, 1)
+        tolerance = Benchmark._get_tolerance(
+            result[sds_glob.JSON_NAME_METHOD], result[sds_glob.JSON_NAME_DEGREE]
+        )
+        p_value = Benchmark._get_p_value(
+            baseline[sds_glob.JSON_NAME_DURATIONS],
+            result[sds_glob.JSON_NAME_DURATIONS],
+        )
+
+        if ratio > 1 + tolerance and p_value < Benchmark._SIGNIFICANCE:
+            status = "REGRESSION"
+        elif ratio * (1 + tolerance) < 1 and 1 - p_value < Benchmark._SIGNIFICANCE:
+            status = "improved"
+        else:
+            status = "ok"
+
+        return status, (
+            f"{median_baseline:15,d} {median:15,d} {ratio:6.2f}x "
+            + f"{tolerance:9.0%} {p_value:8.4f}"
+        )
+
+    # ------------------------------------------------------------------
+    # Create the result files.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _create_result_files(file_name: str, results: list[dict]) -> None:
+        """Create the result files.
+
+        Args:
+            file_name (str): The name of the JSON file.
+            results (list[dict]): The results per method and grid point.
+        """
+        with open(
+            file_name, "w", encoding=sds_glob.FILE_ENCODING_DEFAULT
+        ) as file_handle:
+            json.dump(
+                {
+                    sds_glob.JSON_NAME_WARMUPS: (
+                        sds_glob.inst_config.get_config_value(
+                            sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS
+                        )
+                    ),
+                    sds_glob.JSON_NAME_REPETITIONS: (
+                        sds_glob.inst_config.get_config_value(
+                            sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS
+                        )
+                    ),
+                    sds_glob.JSON_NAME_RESULTS: results,
+                },
+                file_handle,
+                indent=4,
+            )
+
+        field_names = [
+            sds_glob.JSON_NAME_METHOD,
+            sds_glob.JSON_NAME_COEF_BITS,
+            sds_glob.JSON_NAME_DEGREE,
+            sds_glob.JSON_NAME_MIN,
+            sds_glob.JSON_NAME_MEDIAN,
+            sds_glob.JSON_NAME_P95,
+        ]
+
+        with open(
+            os.path.splitext(file_name)[0] + sds_glob.BENCHMARK_SUFFIX_CSV,
+            "w",
+            encoding=sds_glob.FILE_ENCODING_DEFAULT,
+            newline="",
+        ) as file_handle:
+            writer = csv.DictWriter(
+                file_handle, fieldnames=field_names, extrasaction="ignore"
+            )
+            writer.writeheader()
+            writer.writerows(results)
+
+    # ------------------------------------------------------------------
+    # Determine the p-value of a slowdown.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_p_value(durations_baseline: list[int], durations: list[int]) -> float:
+        """Determine the p-value of a slowdown.
+
+        The one-sided Mann-Whitney U test checks whether the durations
+        tend to be longer than the durations of the baseline, with the
+        normal approximation of the U statistic and a continuity
+        correction. Ties get their mean rank.
+
+        Args:
+            durations_baseline (list[int]): The durations of the baseline.
+            durations (list[int]): The durations of this run.
+
+        Returns:
+            float: The probability of a U statistic at least as large
+                without a slowdown.
+        """
+        size = len(durations)
+        size_baseline = len(durations_baseline)
+
+        _, inverse, counts = numpy.unique(
+            numpy.concatenate((durations, durations_baseline)),
+            return_inverse=True,
+            return_counts=True,
+        )
+        ranks = (numpy.cumsum(counts) - (counts - 1) / 2)[inverse]
+
+        statistic = ranks[:size].sum() - size * (size + 1) / 2
+        deviation = math.sqrt(size * size_baseline * (size + size_baseline + 1) / 12)
+
+        return 0.5 * math.erfc(
+            (statistic - size * size_baseline / 2 - 0.5) / deviation / math.sqrt(2)
+        )
+
+    # ------------------------------------------------------------------
+    # Determine the tolerance of a method and degree.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_tolerance(method: str, degree: int) -> float:
+        """Determine the tolerance of a method and degree.
+
+        The configuration parameter 'benchmark_method_tolerances' takes
+        precedence per method and degree ('method:degree') over per
+        method ('method') over 'benchmark_tolerance'.
+
+        Args:
+            method (str): The method.
+            degree (int): The degree of the polynomials.
+
+        Returns:
+            float: The tolerated relative slowdown of the median duration.
+        """
+        method_tolerances = sds_glob.inst_config.get_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES
+        )
+
+        return method_tolerances.get(
+            f"{method}:{degree}",
+            method_tolerances.get(
+                method,
+                sds_glob.inst_config.get_config_value(
+                    sds_glob.CONFIG_PARAM_BENCHMARK_TOLERANCE
+                ),
+            ),
+        )
+
+    # ------------------------------------------------------------------
+    # Time the methods for a polynomial pair.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _time_methods(
+        coef_bits: int, degree: int, poly_1: ndarray, poly_2: ndarray
+    ) -> list[dict]:
+        """Time the methods for a polynomial pair.
+
+        Args:
+            coef_bits (int): The bit length of the coefficients.
+            degree (int): The degree of both polynomials.
+            poly_1 (ndarray): The coefficients of the first polynomial.
+            poly_2 (ndarray): The coefficients of the second polynomial.
+
+        Returns:
+            list[dict]: The results per method.
+        """
+        return [
+            {
+                sds_glob.JSON_NAME_METHOD: method,
+                sds_glob.JSON_NAME_COEF_BITS: coef_bits,
+                sds_glob.JSON_NAME_DEGREE: degree,
+                sds_glob.JSON_NAME_MIN: min(durations),
+                sds_glob.JSON_NAME_MEDIAN: round(numpy.median(durations)),
+                sds_glob.JSON_NAME_P95: round(numpy.percentile(durations, 95)),
+                sds_glob.JSON_NAME_DURATIONS: durations,
+            }
+            for method, durations in multiplier.Multiplier.time_methods(
+                Benchmark.METHODS,
+                poly_1,
+                poly_2,
+                sds_glob.inst_config.get_config_value(
+                    sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS
+                ),
+                sds_glob.inst_config.get_config_value(
+                    sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS
+                ),
+            ).items()
+        ]
@@ -0,0 +1,183 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Class for calibrating the crossover table of the method 'auto'."""
+from __future__ import annotations
+
+import configparser
+import math
+
+import multiplier  # type: ignore
+import numpy
+import sds_glob  # type: ignore
+import tuning_table  # type: ignore
+import utils  # type: ignore
+
+
+# pylint: disable=too-few-public-methods
+class Calibrator:
+    """Class for calibrating the crossover table of the method 'auto'."""
+
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    # A method that is this many times slower than the fastest one at
+    # a grid point and has fallen further behind since the previous
+    # size is no longer timed for larger sizes.
+    _SLOWDOWN_MAX = 20
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, file_name: str) -> None:
+        """Calibrate the crossover table and write the tuning file.
+
+        All candidate methods of the method 'auto' are timed on random
+        polynomial pairs for every point of the calibration grid
+        ('calibrate_coef_bits' x 'calibrate_sizes'). The float64 based
+        methods are only timed where their result is guaranteed to be
+        exact. A method is dropped for the larger sizes only if it is
+        far slower than the fastest one and its ratio to the fastest one
+        has grown with the size, so that methods with a high overhead
+        but a better scaling keep being timed up to their crossover.
+        The resulting ranking of the methods per grid point is written
+        to the tuning file, from which the method 'auto' selects its
+        method per task.
+
+        Args:
+            file_name (str):
+                The name of the tuning file to output.
+        """
+        # pylint: disable=duplicate-code
+        sds_glob.logger.debug(sds_glob.LOGGER_START)
+
+        # Provide progress messages.
+        utils.progress_msg("-" * 79)
+        # INFO.00.031 Start Calibrator
+        utils.progress_msg(sds_glob.INFO_00_031)
+        utils.progress_msg("-" * 79)
+
+        random_generator = numpy.random.default_rng()
+
+        table: dict[tuple[int, int], list[str]] = {}
+
+        for coef_bits in sds_glob.inst_config.get_config_value(
+            sds_glob.CONFIG_PARAM_CALIBRATE_COEF_BITS
+        ):
+            methods = list(tuning_table.AUTO_METHODS)
+            coef_max = (1 << coef_bits) - 1
+
+            # The ratio of every method to the fastest one at the
+            # previous size.
+            slowdowns: dict[str, float] = {}
+
+            for size in sorted(
+                sds_glob.inst_config.get_config_value(
+                    sds_glob.CONFIG_PARAM_CALIBRATE_SIZES
+                )
+            ):
+                poly_1 = random_generator.integers(
+                    -coef_max, coef_max, size, endpoint=True
+                )
+                poly_2 = random_generator.integers(
+                    -coef_max, coef_max, size, endpoint=True
+                )
+
+                durations = {
+                    method: min(method_durations)
+                    for method, method_durations in multiplier.Multiplier.time_methods(
+                        methods,
+                        poly_1,
+                        poly_2,
+                        0,
+                        sds_glob.inst_config.get_config_value(
+                            sds_glob.CONFIG_PARAM_CALIBRATE_REPETITIONS
+                        ),
+                    ).items()
+                }
+
+                ranking = sorted(durations, key=durations.__getitem__)
+                table[(coef_bits, size)] = ranking
+
+                utils.progress_msg_time_elapsed(
+                    durations[ranking[0]],
+                    f"calibration (coef bits: {coef_bits:2d} - size: {size:5d}) "
+                    + f"fastest method {ranking[0]}",
+                )
+
+                methods, slowdowns = Calibrator._prune_methods(
+                    durations, ranking, slowdowns
+                )
+
+        self._create_tuning_file(file_name, table)
+
+        # Provide progress messages.
+        utils.progress_msg("-" * 79)
+        # INFO.00.032 End   Calibrator
+        utils.progress_msg(sds_glob.INFO_00_032)
+        utils.progress_msg("-" * 79)
+
+        sds_glob.logger.debug(sds_glob.LOGGER_END)
+
+    # ------------------------------------------------------------------
+    # Select the methods to be timed at the next size.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _prune_methods(
+        durations: dict[str, int], ranking: list[str], slowdowns: dict[str, float]
+    ) -> tuple[list[str], dict[str, float]]:
+        """Select the methods to be timed at the next size.
+
+        A method is dropped only if it is more than '_SLOWDOWN_MAX'
+        times slower than the fastest one and its ratio to the fastest
+        one has grown since the previous size. A method that is slow at
+        small sizes but catches up, e.g. because of a high constant
+        overhead, is therefore timed until it has reached its crossover.
+
+        Args:
+            durations (dict[str, int]): The duration of every method.
+            ranking (list[str]): The methods, fastest first.
+            slowdowns (dict[str, float]): The ratio of every method to
+                the fastest one at the previous size.
+
+        Returns:
+            tuple[list[str], dict[str, float]]: The methods to be timed
+                and their ratios to the fastest one at this size.
+        """
+        slowdowns_new = {
+            method: durations[method] / durations[ranking[0]] for method in ranking
+        }
+
+        methods = [
+            method
+            for method in ranking
+            if slowdowns_new[method] <= Calibrator._SLOWDOWN_MAX
+            or slowdowns_new[method] < slowdowns.get(method, math.inf)
+        ]
+
+        return methods, slowdowns_new
+
+    # ------------------------------------------------------------------
+    # Create the tuning file.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _create_tuning_file(
+        file_name: str, table: dict[tuple[int, int], list[str]]
+    ) -> None:
+        """Create the tuning file.
+
+        Args:
+            file_name (str): The name of the tuning file.
+            table (dict[tuple[int, int], list[str]]): The crossover table.
+        """
+        config_parser = configparser.ConfigParser()
+        config_parser[sds_glob.TUNING_SECTION] = {
+            f"{coef_bits}_{size}": ",".join(ranking)
+            for (coef_bits, size), ranking in table.items()
+        }
+
+        with open(
+            file_name, "w", encoding=sds_glob.FILE_ENCODING_DEFAULT
+        ) as file_handle:
+            config_parser.write(file_handle)
@@ -0,0 +1,420 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Schoolbook and divide-and-conquer multiplication of polynomials."""
+from __future__ import annotations
+
+import numpy
+import sds_glob  # type: ignore
+import utils  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Upper bound for the coefficients of the int64 schoolbook and
+# divide-and-conquer methods, with a margin for the sums of the
+# interpolation.
+_INT64_LIMIT = 2**60
+
+# Size of the tiles of the blocked schoolbook multiplication.
+_SCHOOLBOOK_TILE = 1024
+
+
+# ------------------------------------------------------------------
+# Convert the coefficients into integer arrays.
+# ------------------------------------------------------------------
+def _get_operands(coefficients_1, coefficients_2) -> tuple[ndarray, ndarray, int]:
+    """Convert the coefficients into integer arrays.
+
+    If the product coefficients could exceed '_INT64_LIMIT', object
+    arrays with Python integers are used instead of int64, so that the
+    schoolbook and the divide-and-conquer methods stay exact.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        tuple[ndarray, ndarray, int]: The coefficients of both
+            polynomials and the product of their largest absolute
+            coefficients.
+    """
+    coef_bound = utils.get_abs_max(coefficients_1) * utils.get_abs_max(coefficients_2)
+
+    if min(len(coefficients_1), len(coefficients_2)) * coef_bound < _INT64_LIMIT:
+        dtype: type = numpy.int64
+    else:
+        dtype = object
+
+    return (
+        numpy.array(coefficients_1, dtype=dtype),
+        numpy.array(coefficients_2, dtype=dtype),
+        coef_bound,
+    )
+
+
+# ------------------------------------------------------------------
+# Karatsuba multiplication.
+# ------------------------------------------------------------------
+def _karatsuba(poly_1: ndarray, poly_2: ndarray, coef_bound: int) -> ndarray:
+    """Karatsuba multiplication.
+
+    With a = a_0 + a_1 * x**h and b = b_0 + b_1 * x**h the product is
+    z_0 + (z_1 - z_0 - z_2) * x**h + z_2 * x**2h, where z_0 = a_0 * b_0,
+    z_2 = a_1 * b_1 and z_1 = (a_0 + a_1) * (b_0 + b_1).
+
+    The recursion stops at the cutoff degree of the configuration or
+    when the sums a_0 + a_1 and b_0 + b_1 could overflow int64.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the first polynomial.
+        poly_2 (ndarray): The coefficients of the second polynomial.
+        coef_bound (int): The product of the largest absolute
+            coefficients of both polynomials.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    if len(poly_1) < len(poly_2):
+        poly_1, poly_2 = poly_2, poly_1
+
+    if len(poly_2) <= sds_glob.inst_config.get_config_value(
+        sds_glob.CONFIG_PARAM_CUTOFF_DEGREE
+    ):
+        return _schoolbook(poly_1, poly_2)
+
+    if len(poly_1) >= 2 * len(poly_2):
+        return _unbalanced(poly_1, poly_2, coef_bound, _karatsuba)
+
+    half = (len(poly_1) + 1) // 2
+
+    if poly_1.dtype != object and half * 4 * coef_bound >= _INT64_LIMIT:
+        return _schoolbook(poly_1, poly_2)
+
+    poly_1_low = poly_1[:half]
+    poly_1_high = poly_1[half:]
+    poly_2_low = poly_2[:half]
+    poly_2_high = poly_2[half:]
+
+    size = len(poly_1) + len(poly_2) - 1
+    result = numpy.zeros(size, dtype=poly_1.dtype)
+
+    z_0 = _karatsuba(poly_1_low, poly_2_low, coef_bound)
+    z_1 = _karatsuba(
+        _pad_add(poly_1_low, poly_1_high),
+        _pad_add(poly_2_low, poly_2_high),
+        4 * coef_bound,
+    )
+    z_1[: len(z_0)] -= z_0
+
+    result[: len(z_0)] += z_0
+
+    if len(poly_2_high) > 0:
+        z_2 = _karatsuba(poly_1_high, poly_2_high, coef_bound)
+        z_1[: len(z_2)] -= z_2
+        offset = 2 * half
+        result[offset:][: len(z_2)] += z_2
+
+    # The coefficients of z_1 beyond the product size are zero.
+    z_1 = z_1[: size - half]
+    result[half:][: len(z_1)] += z_1
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Add two arrays of possibly different size.
+# ------------------------------------------------------------------
+def _pad_add(poly_1: ndarray, poly_2: ndarray) -> ndarray:
+    """Add two arrays of possibly different size.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the longer polynomial.
+        poly_2 (ndarray): The coefficients of the shorter polynomial.
+
+    Returns:
+        ndarray: The sum of the polynomials.
+    """
+    result = poly_1.copy()
+    result[: len(poly_2)] += poly_2
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Vectorized schoolbook multiplication.
+# ------------------------------------------------------------------
+def _schoolbook(poly_1: ndarray, poly_2: ndarray) -> ndarray:
+    """Vectorized schoolbook multiplication.
+
+    Both polynomials are cut into tiles of '_SCHOOLBOOK_TILE'
+    coefficients. The tile products are computed by numpy.convolve
+    within the cache and accumulated at their shifted position.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the first polynomial.
+        poly_2 (ndarray): The coefficients of the second polynomial.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    tile = _SCHOOLBOOK_TILE
+
+    if len(poly_1) <= tile and len(poly_2) <= tile:
+        return numpy.convolve(poly_1, poly_2)
+
+    result = numpy.zeros(len(poly_1) + len(poly_2) - 1, dtype=poly_1.dtype)
+
+    for start_1 in range(0, len(poly_1), tile):
+        end_1 = start_1 + tile
+        for start_2 in range(0, len(poly_2), tile):
+            end_2 = start_2 + tile
+            partial = numpy.convolve(poly_1[start_1:end_1], poly_2[start_2:end_2])
+            offset = start_1 + start_2
+            result[offset:][: len(partial)] += partial
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Toom-3 multiplication.
+# ------------------------------------------------------------------
+def _toom3(poly_1: ndarray, poly_2: ndarray, coef_bound: int) -> ndarray:
+    """Toom-3 multiplication.
+
+    Both polynomials are split into three parts of size k and evaluated
+    at the points 0, 1, -1, -2 and infinity. The five pointwise products
+    are interpolated with the sequence of Bodrato into the five parts
+    r_0 ... r_4 of the product
+    r_0 + r_1 * x**k + r_2 * x**2k + r_3 * x**3k + r_4 * x**4k.
+    All divisions of the interpolation are exact.
+
+    The recursion stops at the cutoff degree of the configuration. If
+    the evaluation at -2 could overflow int64, the Karatsuba method
+    takes over.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the first polynomial.
+        poly_2 (ndarray): The coefficients of the second polynomial.
+        coef_bound (int): The product of the largest absolute
+            coefficients of both polynomials.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    if len(poly_1) < len(poly_2):
+        poly_1, poly_2 = poly_2, poly_1
+
+    if len(poly_2) <= sds_glob.inst_config.get_config_value(
+        sds_glob.CONFIG_PARAM_CUTOFF_DEGREE
+    ):
+        return _schoolbook(poly_1, poly_2)
+
+    if len(poly_1) >= 2 * len(poly_2):
+        return _unbalanced(poly_1, poly_2, coef_bound, _toom3)
+
+    part = (len(poly_1) + 2) // 3
+
+    if poly_1.dtype != object and part * 49 * coef_bound >= _INT64_LIMIT:
+        return _karatsuba(poly_1, poly_2, coef_bound)
+
+    return _toom3_interpolate(
+        _toom3_evaluate(poly_1, poly_2, part, coef_bound),
+        part,
+        len(poly_1) + len(poly_2) - 1,
+    )
+
+
+# ------------------------------------------------------------------
+# Multiply the polynomials at the evaluation points of Toom-3.
+# ------------------------------------------------------------------
+def _toom3_evaluate(
+    poly_1: ndarray, poly_2: ndarray, part: int, coef_bound: int
+) -> tuple[ndarray, ...]:
+    """Multiply the polynomials at the evaluation points of Toom-3.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the first polynomial.
+        poly_2 (ndarray): The coefficients of the second polynomial.
+        part (int): The size of a part.
+        coef_bound (int): The product of the largest absolute
+            coefficients of both polynomials.
+
+    Returns:
+        tuple[ndarray, ...]: The pointwise products at the points 0, 1,
+            -1, -2 and infinity.
+    """
+    a_0, a_1, a_2 = _toom3_split(poly_1, part)
+    b_0, b_1, b_2 = _toom3_split(poly_2, part)
+
+    a_02 = a_0 + a_2
+    b_02 = b_0 + b_2
+
+    return (
+        _toom3(a_0, b_0, coef_bound),
+        _toom3(a_02 + a_1, b_02 + b_1, 9 * coef_bound),
+        _toom3(a_02 - a_1, b_02 - b_1, 9 * coef_bound),
+        _toom3(a_0 - 2 * a_1 + 4 * a_2, b_0 - 2 * b_1 + 4 * b_2, 49 * coef_bound),
+        _toom3(a_2, b_2, coef_bound),
+    )
+
+
+# ------------------------------------------------------------------
+# Interpolate the product from the pointwise products of Toom-3.
+# ------------------------------------------------------------------
+def _toom3_interpolate(products: tuple[ndarray, ...], part: int, size: int) -> ndarray:
+    """Interpolate the product from the pointwise products of Toom-3.
+
+    Args:
+        products (tuple[ndarray, ...]): The pointwise products at the
+            points 0, 1, -1, -2 and infinity.
+        part (int): The size of a part.
+        size (int): The size of the product.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    r_0, r_1, r_m1, r_m2, r_4 = products
+
+    r_3 = (r_m2 - r_1) // 3
+    r_1 = (r_1 - r_m1) // 2
+    r_2 = r_m1 - r_0
+    r_3 = (r_2 - r_3) // 2 + 2 * r_4
+    r_2 = r_2 + r_1 - r_4
+    r_1 = r_1 - r_3
+
+    result = numpy.zeros(4 * part + 2 * part - 1, dtype=r_0.dtype)
+
+    for no_part, r_part in enumerate((r_0, r_1, r_2, r_3, r_4)):
+        offset = no_part * part
+        result[offset:][: len(r_part)] += r_part
+
+    # The coefficients beyond the product size are zero.
+    return result[:size]
+
+
+# ------------------------------------------------------------------
+# Split the coefficients into three parts.
+# ------------------------------------------------------------------
+def _toom3_split(polynomial: ndarray, part: int) -> tuple[ndarray, ...]:
+    """Split the coefficients into three parts.
+
+    Args:
+        polynomial (ndarray): The coefficients of the polynomial.
+        part (int): The size of a part.
+
+    Returns:
+        tuple[ndarray, ...]: The three parts, padded with zeros.
+    """
+    padded = numpy.zeros(3 * part, dtype=polynomial.dtype)
+    padded[: len(polynomial)] = polynomial
+
+    return tuple(padded.reshape(3, part))
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials of unbalanced size.
+# ------------------------------------------------------------------
+def _unbalanced(poly_1: ndarray, poly_2: ndarray, coef_bound: int, engine) -> ndarray:
+    """Multiply two polynomials of unbalanced size.
+
+    The longer polynomial is cut into slices of the size of the shorter
+    one, the slices are multiplied with 'engine' and the partial
+    products are added up.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the longer polynomial.
+        poly_2 (ndarray): The coefficients of the shorter polynomial.
+        coef_bound (int): The product of the largest absolute
+            coefficients of both polynomials.
+        engine: The multiplication method for balanced polynomials.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    size_2 = len(poly_2)
+
+    result = numpy.zeros(len(poly_1) + size_2 - 1, dtype=poly_1.dtype)
+
+    for start in range(0, len(poly_1), size_2):
+        end = start + size_2
+        partial = engine(poly_1[start:end], poly_2, coef_bound)
+        end = start + len(partial)
+        result[start:end] += partial
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the Karatsuba method.
+# ------------------------------------------------------------------
+def multiply_karatsuba(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the Karatsuba method.
+
+    Below the cutoff degree of the configuration the vectorized
+    schoolbook kernel is used.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    return utils.delete_leading_zero_terms(
+        _karatsuba(*_get_operands(coefficients_1, coefficients_2))
+    )
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the simple method.
+# ------------------------------------------------------------------
+def multiply_simple(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the simple method.
+
+    All terms are multiplied with each other and the like terms are
+    collected by the vectorized schoolbook kernel. The products are
+    accumulated in int64 unless the sums could overflow, then with
+    Python integers.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    poly_1, poly_2, _ = _get_operands(coefficients_1, coefficients_2)
+
+    return utils.delete_leading_zero_terms(_schoolbook(poly_1, poly_2))
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the Toom-3 method.
+# ------------------------------------------------------------------
+def multiply_toom3(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the Toom-3 method.
+
+    Below the cutoff degree of the configuration the vectorized
+    schoolbook kernel is used.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    return utils.delete_leading_zero_terms(
+        _toom3(*_get_operands(coefficients_1, coefficients_2))
+    )
@@ -0,0 +1,425 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Multiplication of polynomials in float64 with Fast Fourier transforms."""
+from __future__ import annotations
+
+import cmath
+
+import kronecker_engine  # type: ignore
+import numpy
+import utils  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Upper bound for the magnitude of a coefficient of a float64
+# convolution, including the log2(FFT size) error growth, below which
+# rounding the result is guaranteed to be exact.
+_EXACT_LIMIT = 2**49
+
+# Bit-reversal permutation and twiddle factors per FFT size.
+_tables: dict[int, tuple[list[int], list[complex]]] = {}
+
+
+# ------------------------------------------------------------------
+# Computing the complex conjugates.
+# ------------------------------------------------------------------
+def _complex_conjugate(polynomial) -> list[complex]:
+    """Computing the complex conjugates.
+
+    The complex conjugate of a complex number is obtained by changing
+    the sign of its imaginary part. Applying the forward transform to
+    the conjugated values yields the inverse transform, so that the
+    cached twiddle factors of the forward transform are reused here.
+
+    Args:
+        polynomial (list[int]): The coefficients of the polynomial.
+
+    Returns:
+        list[complex]: The complex conjugates.
+    """
+    result = _iterative([coeff.conjugate() for coeff in polynomial])
+
+    size = len(polynomial)
+
+    return [coeff.conjugate() / size for coeff in result]
+
+
+# ------------------------------------------------------------------
+# Provide the bit-reversal permutation and the twiddle factors
+# of a transform size.
+# ------------------------------------------------------------------
+def _get_tables(size: int) -> tuple[list[int], list[complex]]:
+    """Provide the bit-reversal permutation and the twiddle factors.
+
+    Both tables depend only on the transform size. They are computed
+    once per size and kept in a module-level cache, so that all tasks
+    of a file with the same padded size share them.
+
+    Args:
+        size (int): The transform size, a power of 2.
+
+    Returns:
+        tuple[list[int], list[complex]]:
+            The bit-reversal permutation and the twiddle factors
+            omega**k for k in range(size // 2).
+    """
+    tables = _tables.get(size)
+
+    if tables is None:
+        no_bits = size.bit_length() - 1
+        bit_reversal = [0] * size
+        for index in range(1, size):
+            bit_reversal[index] = (bit_reversal[index >> 1] >> 1) | (
+                (index & 1) << (no_bits - 1)
+            )
+
+        twiddles = [
+            cmath.exp((2.0 * cmath.pi * 1j * degree) / size)
+            for degree in range(size // 2)
+        ]
+
+        tables = (bit_reversal, twiddles)
+        _tables[size] = tables
+
+    return tables
+
+
+# ------------------------------------------------------------------
+# Iterative FFT.
+# ------------------------------------------------------------------
+def _iterative(polynomial: list) -> list[complex]:
+    """Iterative FFT.
+
+    Radix-2 transform: the values are arranged in bit-reversed order
+    and then combined by butterflies of growing length, which overwrite
+    their two values in place, so that no level allocates new lists.
+    Every twiddle factor of a level is taken once from the cached
+    twiddle factors of the transform size and applied to all
+    butterflies using it.
+
+    Args:
+        polynomial (list): The coefficients of a polynomial, the number
+            of coefficients is a power of 2.
+
+    Returns:
+        list[complex]: The transformed values.
+    """
+    polynomial_size = len(polynomial)
+
+    bit_reversal, twiddles = _get_tables(polynomial_size)
+
+    values = [polynomial[index] for index in bit_reversal]
+
+    length = 2
+    while length <= polynomial_size:
+        half = length // 2
+        step = polynomial_size // length
+
+        for offset in range(half):
+            twiddle = twiddles[offset * step]
+
+            for index_even in range(offset, polynomial_size, length):
+                index_odd = index_even + half
+                value_even = values[index_even]
+                value_odd = values[index_odd] * twiddle
+                values[index_even] = value_even + value_odd
+                values[index_odd] = value_even - value_odd
+
+        length = length * 2
+
+    return values
+
+
+# ------------------------------------------------------------------
+# Polynomial multiplication.
+# ------------------------------------------------------------------
+def _multiply_polynomials(polynomial_a, polynomial_b):
+    """Polynomial multiplication.
+
+    Args:
+        polynomial_a (list[int]):
+            The coefficients of the first polynomial.
+        polynomial_b (list[int]):
+            The coefficients of the second polynomial.
+
+    Returns:
+        list[int]: Resulting product of the two polynomials.
+    """
+    size_total = len(polynomial_a) + len(polynomial_b)
+
+    degree = 1
+
+    while degree < size_total:
+        degree = degree * 2
+
+    for _ in range(degree - len(polynomial_a)):
+        polynomial_a.append(0)
+    for _ in range(degree - len(polynomial_b)):
+        polynomial_b.append(0)
+
+    polynomial_a_fft = _iterative(polynomial_a)
+    polynomial_b_fft = _iterative(polynomial_b)
+
+    polynomial_c = [
+        value_a * value_b
+        for value_a, value_b in zip(polynomial_a_fft, polynomial_b_fft)
+    ]
+
+    polynomial_d = _complex_conjugate(polynomial_c)
+
+    return [round(value.real) for value in polynomial_d]
+
+
+# ------------------------------------------------------------------
+# Recombine the product from the transformed limbs.
+# ------------------------------------------------------------------
+def _rfft_combine_limbs(
+    limbs_1: list[ndarray],
+    limbs_2: list[ndarray],
+    limb_bits: int,
+    size: int,
+    size_min: int,
+) -> ndarray:
+    """Recombine the product from the transformed limbs.
+
+    The limb products with the same weight are accumulated in the
+    frequency domain, transformed back, rounded and shifted into the
+    product.
+
+    Args:
+        limbs_1 (list[ndarray]): The transformed limbs of the first
+            polynomial.
+        limbs_2 (list[ndarray]): The transformed limbs of the second
+            polynomial.
+        limb_bits (int): The number of bits per limb.
+        size (int): The number of coefficients of the product.
+        size_min (int): The size of the smaller polynomial.
+
+    Returns:
+        ndarray: The coefficients of the product.
+    """
+    no_limbs = len(limbs_1)
+    fft_size = 1 << (size - 1).bit_length()
+
+    # Fit all shifted partial convolutions and their sum into int64?
+    if (2 * no_limbs * no_limbs * size_min << (2 * no_limbs * limb_bits)) < 2**63:
+        result = numpy.zeros(size, dtype=numpy.int64)
+    else:
+        result = numpy.zeros(size, dtype=object)
+
+    for weight in range(2 * no_limbs - 1):
+        spectrum = sum(
+            limbs_1[limb] * limbs_2[weight - limb]
+            for limb in range(
+                max(0, weight - no_limbs + 1), min(weight, no_limbs - 1) + 1
+            )
+        )
+        partial = numpy.rint(numpy.fft.irfft(spectrum, fft_size)[:size]).astype(
+            numpy.int64
+        )
+        if result.dtype == object:
+            partial = partial.astype(object)
+        result += partial << (weight * limb_bits)
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Determine the smallest number of limbs with an exact result.
+# ------------------------------------------------------------------
+def _rfft_get_no_limbs(coef_bits: int, size_min: int, fft_size: int) -> tuple[int, int]:
+    """Determine the smallest number of limbs with an exact result.
+
+    Args:
+        coef_bits (int): The bit length of the largest coefficient.
+        size_min (int): The size of the smaller polynomial.
+        fft_size (int): The size of the transform.
+
+    Returns:
+        tuple[int, int]: The number of limbs and the number of bits per
+            limb.
+    """
+    no_limbs = 1
+    limb_bits = coef_bits
+    while (
+        no_limbs * size_min * (1 << (2 * limb_bits)) * fft_size.bit_length()
+        > _EXACT_LIMIT
+    ):
+        no_limbs += 1
+        limb_bits = -(-coef_bits // no_limbs)
+
+    return no_limbs, limb_bits
+
+
+# ------------------------------------------------------------------
+# Split the coefficients into limbs and transform them.
+# ------------------------------------------------------------------
+def _rfft_split_limbs(
+    polynomial: ndarray, no_limbs: int, limb_bits: int, fft_size: int
+) -> list[ndarray]:
+    """Split the coefficients into limbs and transform them.
+
+    Args:
+        polynomial (ndarray): The coefficients of the polynomial.
+        no_limbs (int): The number of limbs.
+        limb_bits (int): The number of bits per limb.
+        fft_size (int): The size of the real FFT.
+
+    Returns:
+        list[ndarray]: The real FFT of every limb, lowest limb first.
+    """
+    limbs = []
+    mask = (1 << limb_bits) - 1
+
+    for limb in range(no_limbs):
+        shifted = polynomial >> (limb * limb_bits)
+        if limb < no_limbs - 1:
+            shifted = shifted & mask
+        limbs.append(numpy.fft.rfft(shifted.astype(numpy.float64), fft_size))
+
+    return limbs
+
+
+# ------------------------------------------------------------------
+# Check if a float64 based method is exact for two polynomials.
+# ------------------------------------------------------------------
+def is_exact(coefficients_1, coefficients_2) -> bool:
+    """Check if a float64 based method is exact for two polynomials.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        bool: True if the rounded float64 convolution of the polynomials
+            is guaranteed to be exact.
+    """
+    size_1 = len(coefficients_1)
+    size_2 = len(coefficients_2)
+
+    coef_bound = (
+        min(size_1, size_2)
+        * utils.get_abs_max(coefficients_1)
+        * utils.get_abs_max(coefficients_2)
+    )
+
+    return coef_bound * (size_1 + size_2).bit_length() <= _EXACT_LIMIT
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the Fast Fourier transform.
+# ------------------------------------------------------------------
+def multiply_fft(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the Fast Fourier transform.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    # The FFT pads its operands in place, hence it gets copies of the
+    # coefficients as lists of Python integers.
+    return utils.delete_leading_zero_terms(
+        _multiply_polynomials(
+            numpy.asarray(coefficients_1).tolist(),
+            numpy.asarray(coefficients_2).tolist(),
+        )
+    )
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the NumPy polynomial methods.
+# ------------------------------------------------------------------
+def multiply_numpy(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the NumPy polynomial methods.
+
+    The float64 coefficients of the product are rounded to integers,
+    beyond the int64 range to Python integers.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    product = numpy.rint(
+        (
+            numpy.polynomial.Polynomial(coefficients_1)
+            * numpy.polynomial.Polynomial(coefficients_2)
+        ).coef
+    )
+
+    if numpy.abs(product).max() < 2**63:
+        return utils.delete_leading_zero_terms(product.astype(numpy.int64))
+
+    return utils.delete_leading_zero_terms(
+        numpy.array([int(coeff) for coeff in product], dtype=object)
+    )
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the NumPy real FFT.
+# ------------------------------------------------------------------
+def multiply_rfft(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the NumPy real FFT.
+
+    The convolution is computed in float64 on whole arrays. To keep the
+    rounded result exact, the coefficients are split into limbs of
+    'limb_bits' bits if necessary: the low limbs are unsigned, the
+    highest limb carries the sign. The limb products with the same
+    weight are accumulated in the frequency domain, so that every
+    inverse transform stays below '_EXACT_LIMIT'. The exact integer
+    product is then recombined from the rounded partial convolutions.
+    Coefficients beyond the int64 range are multiplied with the
+    Kronecker substitution instead.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    try:
+        poly_1 = numpy.asarray(coefficients_1, dtype=numpy.int64)
+        poly_2 = numpy.asarray(coefficients_2, dtype=numpy.int64)
+    except OverflowError:
+        return kronecker_engine.multiply_kronecker(coefficients_1, coefficients_2)
+
+    size = len(poly_1) + len(poly_2) - 1
+    fft_size = 1 << (size - 1).bit_length()
+    size_min = min(len(poly_1), len(poly_2))
+
+    # The bit length of the smallest int64 exceeds 63 bits.
+    coef_bits = max(
+        utils.get_abs_max(poly_1).bit_length(),
+        utils.get_abs_max(poly_2).bit_length(),
+        1,
+    )
+
+    no_limbs, limb_bits = _rfft_get_no_limbs(coef_bits, size_min, fft_size)
+
+    result = _rfft_combine_limbs(
+        _rfft_split_limbs(poly_1, no_limbs, limb_bits, fft_size),
+        _rfft_split_limbs(poly_2, no_limbs, limb_bits, fft_size),
+        limb_bits,
+        size,
+        size_min,
+    )
+
+    return utils.delete_leading_zero_terms(result)
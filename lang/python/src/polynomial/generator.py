@@ -2,37 +2,79 @@
 # Use of this source code is governed by the GNU LESSER GENERAL
 # PUBLIC LICENSE, that can be found in the LICENSE.md file.
 
-"""Class for generating a JSON file with tasks."""
+"""Class for generating a JSON or binary task file."""
 from __future__ import annotations
 
 import json
-import random
+import os
 import time
+from typing import Any
+from typing import Callable
+from typing import Iterator
 from typing import Tuple
 
+import kronecker_engine  # type: ignore
 import numpy
 import sds_glob  # type: ignore
+import sparse_engine  # type: ignore
+import task_reader  # type: ignore
 import utils  # type: ignore
-from numpy.polynomial import Polynomial
+import worker_pool  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Upper bound for the magnitude of the product coefficients below which
+# every partial sum of a float64 convolution is an exact integer.
+_FLOAT_EXACT_LIMIT = 2**53
 
 
 # pylint: disable=too-few-public-methods
 class Generator:
-    """Class for generating a JSON file with tasks."""
+    """Class for generating a JSON or binary task file."""
 
     # ------------------------------------------------------------------
     # Initialise the instance.
     # ------------------------------------------------------------------
-    def __init__(self, file_name) -> None:
+    def __init__(
+        self,
+        file_name,
+        file_format: str = sds_glob.ARG_FORMAT_JSON,
+        workers: int = 1,
+        task_queue: task_reader.TaskQueue | None = None,
+    ) -> None:
         """Generate the tasks.
 
         Using configuration parameters in the 'setup.cfg' file, a JSON file
-        containing polynomial pairs and their product as tasks can be
-        generated with an instance of this class.
+        or a binary task file containing polynomial pairs and their
+        product as tasks can be generated with an instance of this class.
+        With more than one shard ('no_shards'), the tasks are split into
+        shard files and the file gets a manifest of the shard files.
+        Every task draws its random numbers from a PCG64 generator of
+        its own, derived from the seed 'seed', so that the same seed
+        always produces the same file, independent of the number of
+        worker processes. Without a seed (-1) a new seed is drawn and
+        reported. The products are calculated exactly with integers; if
+        a product coefficient of the configuration could exceed the
+        int64 range, the JSON file gets arbitrary-precision integers.
+        With a density ('density') below 1, only this share of the
+        coefficients is non-zero and sparse polynomials get the sparse
+        encoding in the JSON file. With a task queue, the tasks are put
+        into the queue for the 'Multiplier' class instead and no file
+        is written.
 
         Args:
             file_name (str):
-                The name of the JSON file to output.
+                The name of the task file or manifest to output, not
+                used with a task queue.
+            file_format (str):
+                The format of the task file, 'json' or 'binary'.
+            workers (int):
+                The number of worker processes generating the tasks.
+            task_queue (task_reader.TaskQueue, optional):
+                The queue taking the tasks instead of a file. Defaults
+                to None.
         """
         # pylint: disable=duplicate-code
         sds_glob.logger.debug(sds_glob.LOGGER_START)
@@ -43,19 +85,36 @@ class Generator:
         utils.progress_msg(sds_glob.INFO_00_011)
         utils.progress_msg("-" * 79)
 
+        Generator.check_config()
+
         self._file_name = file_name
+        self._workers = workers
 
-        # Create polynomial pairs with random values and calculate
-        # the product. Each generated triple defines a task for the
-        # 'Multiplier' class.
-        self._tasks = []
+        self._seed = sds_glob.inst_config.get_config_value(sds_glob.CONFIG_PARAM_SEED)
+        if self._seed == -1:
+            self._seed = numpy.random.SeedSequence().entropy
 
-        for no_task in range(sds_glob.inst_config.get_no_tasks()):
-            self._tasks.append(self._generate_task(no_task))
+        # INFO.00.013 The tasks are generated with the seed {seed}
+        utils.progress_msg(sds_glob.INFO_00_013.replace("{seed}", str(self._seed)))
 
-        # Write the generated polynomials along with their product
-        # to a JSON file for use in the 'Multiplier' class.
-        self._create_json_file()
+        # Create polynomial pairs with random values and calculate
+        # the product. Each generated triple defines a task for the
+        # 'Multiplier' class and is written to the task file as soon
+        # as it is generated.
+        if task_queue is not None:
+            task_queue.put_tasks(
+                self._generate_parallel(
+                    Generator._generate_chunk_tasks,
+                    0,
+                    sds_glob.inst_config.get_no_tasks(),
+                )
+            )
+        elif sds_glob.inst_config.get_config_value(sds_glob.CONFIG_PARAM_NO_SHARDS) > 1:
+            self._create_shards(file_format)
+        else:
+            self._create_task_file(
+                file_format, file_name, 0, sds_glob.inst_config.get_no_tasks()
+            )
 
         # Provide progress messages.
         utils.progress_msg("-" * 79)
@@ -65,137 +124,642 @@ class Generator:
 
         sds_glob.logger.debug(sds_glob.LOGGER_END)
 
+    # ------------------------------------------------------------------
+    # Create the binary task file.
+    # ------------------------------------------------------------------
+    def _create_binary_file(
+        self, file_name: str, task_no_first: int, no_tasks: int
+    ) -> None:
+        """Create the binary task file.
+
+        The header and the table of the tasks are written first, the
+        coefficient arrays follow task by task as they are generated.
+        The file is written strictly front to back, so that it can be
+        compressed while writing: the degrees for the table are taken
+        from a first pass that only draws the random polynomials, the
+        second pass draws the same polynomials again and multiplies
+        them. The coefficients are stored as int32 if every possible
+        product coefficient of the configuration fits, otherwise as
+        int64.
+
+        Args:
+            file_name (str): The name of the binary task file.
+            task_no_first (int): The number of the first task, starting
+                with zero.
+            no_tasks (int): The number of tasks.
+        """
+        coef_bound = max(
+            abs(sds_glob.inst_config.get_coef_min()),
+            abs(sds_glob.inst_config.get_coef_max()),
+        )
+        coef_bound = max(
+            coef_bound, sds_glob.inst_config.get_degree_max() * coef_bound**2
+        )
+
+        if coef_bound >= 2**63:
+            # ERROR.00.920 The product coefficients up to {coef_bound}
+            # exceed the int64 range of the binary task file
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_920.replace("{coef_bound}", str(coef_bound))
+            )
+
+        coef_bytes = 4 if coef_bound < 2**31 else 8
+
+        header = numpy.zeros(1, dtype=task_reader.BINARY_HEADER)
+        header["magic"] = task_reader.BINARY_MAGIC
+        header["version"] = task_reader.BINARY_VERSION
+        header["coef_bytes"] = coef_bytes
+        header["no_tasks"] = no_tasks
+
+        table = numpy.zeros(no_tasks, dtype=task_reader.BINARY_TABLE)
+
+        offset = header.nbytes + table.nbytes
+
+        for task_no, degrees in enumerate(
+            self._generate_parallel(
+                Generator._generate_chunk_degrees, task_no_first, no_tasks
+            )
+        ):
+            for field, degree in zip(("1", "2", "product"), degrees):
+                table["offset_" + field][task_no] = offset
+                table["degree_" + field][task_no] = degree
+                offset += (degree + 1) * coef_bytes
+
+        with task_reader.open_task_file(file_name, "wb") as file_handle:
+            file_handle.write(header.tobytes())
+            file_handle.write(table.tobytes())
+
+            for data in self._generate_parallel(
+                Generator._generate_chunk_binary, task_no_first, no_tasks, coef_bytes
+            ):
+                file_handle.write(data)
+
     # ------------------------------------------------------------------
     # Create the JSON file.
     # ------------------------------------------------------------------
-    def _create_json_file(self) -> None:
+    def _create_json_file(
+        self, file_name: str, task_no_first: int, no_tasks: int
+    ) -> None:
         """Create the JSON file.
 
-        The file structure looks as follows:
+        The tasks are generated one by one and every task is written
+        immediately in compact form on a line of its own, so that the
+        memory requirement does not depend on the number of tasks. The
+        file structure looks as follows:
 
-            {
-                "moTasks": 999,
-                "tasks": [
-                    {
-                        "taskNo": 999,
-                        "polynom1": {
-                            "degree": 999,
-                            "coefficients": [
-                                999,
-                                ...
-                            ]
-                        },
-                        "polynom2": {
-                            "degree": 999,
-                            "coefficients": [
-                                999,
-                                ...
-                            ]
-                        },
-                        "product": {
-                            "degree": 999,
-                            "coefficients": [
-                                999,
-                                ...
-                            ]
-                        }
-                    },
-                    ...
-                ]
-            }
+            {"moTasks":999,"tasks":[
+            {"taskNo":999,"polynom1":{"degree":999,"coefficients":[999,...]},
+                "polynom2":{"degree":999,"coefficients":[999,...]},
+                "product":{"degree":999,"coefficients":[999,...]}},
+            ...
+            ]}
+
+        The byte range of every task is recorded in the index file of
+        the JSON file for the random access to selected tasks.
+
+        Args:
+            file_name (str): The name of the JSON file.
+            task_no_first (int): The number of the first task, starting
+                with zero.
+            no_tasks (int): The number of tasks.
         """
-        tasks = []
-        for task_no, (polynom_1, polynom_2, product) in enumerate(self._tasks):
-            tasks.append(
+        index = numpy.zeros(no_tasks, dtype=task_reader.INDEX_ENTRY)
+
+        # Without newline translation the positions are byte positions
+        # on every platform, in a compressed file of the uncompressed
+        # data.
+        with task_reader.open_task_file(
+            file_name, "wt", encoding=sds_glob.FILE_ENCODING_DEFAULT, newline=""
+        ) as file_handle:
+            text = (
+                "{"
+                + json.dumps(sds_glob.JSON_NAME_NO_TASKS)
+                + ":"
+                + str(no_tasks)
+                + ","
+                + json.dumps(sds_glob.JSON_NAME_TASKS)
+                + ":[\n"
+            )
+            file_handle.write(text)
+
+            # The JSON output is pure ASCII, one character per byte.
+            offset = len(text)
+
+            for task_no, text in enumerate(
+                self._generate_parallel(
+                    Generator._generate_chunk_json, task_no_first, no_tasks
+                )
+            ):
+                index[task_no] = (offset, len(text))
+
+                text += ",\n" if task_no < no_tasks - 1 else "\n"
+                file_handle.write(text)
+                offset += len(text)
+
+            file_handle.write("]}\n")
+
+        task_reader.write_index(file_name, index)
+
+    # ------------------------------------------------------------------
+    # Create the shard files and their manifest.
+    # ------------------------------------------------------------------
+    def _create_shards(self, file_format: str) -> None:
+        """Create the shard files and their manifest.
+
+        The tasks are split into consecutive ranges of almost equal size,
+        one per shard file. The shard file names are derived from the
+        name of the manifest, e.g. 'polynom_data.001.json' for the
+        manifest 'polynom_data.json' or 'polynom_data.001.json.gz' for
+        the manifest 'polynom_data.json.gz'.
+
+        Args:
+            file_format (str): The format of the shard files, 'json' or
+                'binary'.
+        """
+        no_tasks = sds_glob.inst_config.get_no_tasks()
+        no_shards = min(
+            sds_glob.inst_config.get_config_value(sds_glob.CONFIG_PARAM_NO_SHARDS),
+            no_tasks,
+        )
+
+        base, compression = self._file_name, ""
+        if task_reader.is_compressed(base):
+            base, compression = os.path.splitext(base)
+        base, extension = os.path.splitext(base)
+
+        shards = []
+
+        for shard_no in range(no_shards):
+            task_no_first = shard_no * no_tasks // no_shards
+            shard_no_tasks = (shard_no + 1) * no_tasks // no_shards - task_no_first
+            shard_file_name = f"{base}.{shard_no + 1:03d}{extension}{compression}"
+
+            self._create_task_file(
+                file_format, shard_file_name, task_no_first, shard_no_tasks
+            )
+
+            shards.append(
                 {
-                    sds_glob.JSON_NAME_TASK_NO: task_no + 1,
-                    sds_glob.JSON_NAME_POLYNOM_1: {
-                        sds_glob.JSON_NAME_DEGREE: polynom_1.degree(),
-                        sds_glob.JSON_NAME_COEFFICIENTS: list(
-                            int(x) for x in polynom_1.coef
-                        ),
-                    },
-                    sds_glob.JSON_NAME_POLYNOM_2: {
-                        sds_glob.JSON_NAME_DEGREE: polynom_2.degree(),
-                        sds_glob.JSON_NAME_COEFFICIENTS: list(
-                            int(x) for x in polynom_2.coef
-                        ),
-                    },
-                    sds_glob.JSON_NAME_PRODUCT: {
-                        sds_glob.JSON_NAME_DEGREE: product.degree(),
-                        sds_glob.JSON_NAME_COEFFICIENTS: list(
-                            int(x) for x in product.coef
-                        ),
-                    },
+                    sds_glob.JSON_NAME_FILE_NAME: os.path.basename(shard_file_name),
+                    sds_glob.JSON_NAME_TASK_NO_FIRST: task_no_first + 1,
+                    sds_glob.JSON_NAME_NO_TASKS: shard_no_tasks,
                 }
             )
 
-        with open(
-            self._file_name, "w", encoding=sds_glob.FILE_ENCODING_DEFAULT
+        # The member 'shards' comes first, it identifies the manifest.
+        with task_reader.open_task_file(
+            self._file_name, "wt", encoding=sds_glob.FILE_ENCODING_DEFAULT
         ) as file_handle:
             json.dump(
                 {
-                    sds_glob.JSON_NAME_NO_TASKS: sds_glob.inst_config.get_no_tasks(),
-                    sds_glob.JSON_NAME_TASKS: tasks,
+                    sds_glob.JSON_NAME_SHARDS: shards,
+                    sds_glob.JSON_NAME_FORMAT: file_format,
+                    sds_glob.JSON_NAME_NO_TASKS: no_tasks,
                 },
                 file_handle,
                 indent=4,
-                sort_keys=False,
             )
 
+    # ------------------------------------------------------------------
+    # Create a task file.
+    # ------------------------------------------------------------------
+    def _create_task_file(
+        self, file_format: str, file_name: str, task_no_first: int, no_tasks: int
+    ) -> None:
+        """Create a task file.
+
+        Args:
+            file_format (str): The format of the task file, 'json' or
+                'binary'.
+            file_name (str): The name of the task file.
+            task_no_first (int): The number of the first task, starting
+                with zero.
+            no_tasks (int): The number of tasks.
+        """
+        if file_format == sds_glob.ARG_FORMAT_BINARY:
+            self._create_binary_file(file_name, task_no_first, no_tasks)
+        else:
+            self._create_json_file(file_name, task_no_first, no_tasks)
+
+    # ------------------------------------------------------------------
+    # Generate a chunk of tasks for the binary task file.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _generate_chunk_binary(
+        seed: int, task_no_first: int, no_tasks: int, coef_bytes: int
+    ) -> list[bytes]:
+        """Generate a chunk of tasks for the binary task file.
+
+        Args:
+            seed (int): The seed of the task generation.
+            task_no_first (int): The number of the first task of the
+                chunk, starting with zero.
+            no_tasks (int): The number of tasks of the chunk.
+            coef_bytes (int): The number of bytes per coefficient.
+
+        Returns:
+            list[bytes]: Per task the coefficient arrays of Polynomial 1,
+                Polynomial 2 and the product.
+        """
+        dtype = numpy.dtype(f"<i{coef_bytes}")
+
+        return [
+            b"".join(
+                coefficients.astype(dtype).tobytes()
+                for coefficients in Generator._generate_task(seed, task_no)
+            )
+            for task_no in range(task_no_first, task_no_first + no_tasks)
+        ]
+
+    # ------------------------------------------------------------------
+    # Provide the degrees of a chunk of tasks.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _generate_chunk_degrees(
+        seed: int, task_no_first: int, no_tasks: int
+    ) -> list[tuple[int, int, int]]:
+        """Provide the degrees of a chunk of tasks.
+
+        Only the polynomial pairs are drawn, the degree of the product
+        is derived from them without multiplying.
+
+        Args:
+            seed (int): The seed of the task generation.
+            task_no_first (int): The number of the first task of the
+                chunk, starting with zero.
+            no_tasks (int): The number of tasks of the chunk.
+
+        Returns:
+            list[tuple[int, int, int]]: Per task the degrees of
+                Polynomial 1, Polynomial 2 and the product.
+        """
+        degrees = []
+
+        for task_no in range(task_no_first, task_no_first + no_tasks):
+            polynom_1, polynom_2 = Generator._generate_polynomials(seed, task_no)
+            degrees.append(
+                (
+                    len(polynom_1) - 1,
+                    len(polynom_2) - 1,
+                    Generator._get_product_degree(polynom_1, polynom_2),
+                )
+            )
+
+        return degrees
+
+    # ------------------------------------------------------------------
+    # Generate a chunk of tasks for the JSON file.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _generate_chunk_json(seed: int, task_no_first: int, no_tasks: int) -> list[str]:
+        """Generate a chunk of tasks for the JSON file.
+
+        Args:
+            seed (int): The seed of the task generation.
+            task_no_first (int): The number of the first task of the
+                chunk, starting with zero.
+            no_tasks (int): The number of tasks of the chunk.
+
+        Returns:
+            list[str]: Per task its JSON object in compact form.
+        """
+        texts = []
+
+        for task_no in range(task_no_first, task_no_first + no_tasks):
+            polynom_1, polynom_2, product = Generator._generate_task(seed, task_no)
+            texts.append(
+                json.dumps(
+                    {
+                        sds_glob.JSON_NAME_TASK_NO: task_no + 1,
+                        sds_glob.JSON_NAME_POLYNOM_1: Generator._get_json_polynom(
+                            polynom_1
+                        ),
+                        sds_glob.JSON_NAME_POLYNOM_2: Generator._get_json_polynom(
+                            polynom_2
+                        ),
+                        sds_glob.JSON_NAME_PRODUCT: Generator._get_json_polynom(
+                            product
+                        ),
+                    },
+                    separators=(",", ":"),
+                )
+            )
+
+        return texts
+
+    # ------------------------------------------------------------------
+    # Generate a chunk of tasks for the task queue.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _generate_chunk_tasks(
+        seed: int, task_no_first: int, no_tasks: int
+    ) -> list[tuple[int, dict]]:
+        """Generate a chunk of tasks for the task queue.
+
+        The tasks have the structure of the tasks of a binary task
+        file, the coefficients stay arrays.
+
+        Args:
+            seed (int): The seed of the task generation.
+            task_no_first (int): The number of the first task of the
+                chunk, starting with zero.
+            no_tasks (int): The number of tasks of the chunk.
+
+        Returns:
+            list[tuple[int, dict]]: Per task its number, starting with
+                zero, and the task.
+        """
+        tasks = []
+
+        for task_no in range(task_no_first, task_no_first + no_tasks):
+            task: dict[str, Any] = {sds_glob.JSON_NAME_TASK_NO: task_no + 1}
+
+            for name, coefficients in zip(
+                (
+                    sds_glob.JSON_NAME_POLYNOM_1,
+                    sds_glob.JSON_NAME_POLYNOM_2,
+                    sds_glob.JSON_NAME_PRODUCT,
+                ),
+                Generator._generate_task(seed, task_no),
+            ):
+                task[name] = {
+                    sds_glob.JSON_NAME_DEGREE: len(coefficients) - 1,
+                    sds_glob.JSON_NAME_COEFFICIENTS: coefficients,
+                }
+
+            tasks.append((task_no, task))
+
+        return tasks
+
+    # ------------------------------------------------------------------
+    # Generate the tasks in chunks, with a process pool if requested.
+    # ------------------------------------------------------------------
+    def _generate_parallel(
+        self, function: Callable, task_no_first: int, no_tasks: int, *args
+    ) -> Iterator:
+        """Generate the tasks in chunks, with a process pool if requested.
+
+        The tasks are split into chunks of consecutive tasks with about
+        'CHUNK_ELEMENTS' coefficients of the polynomial pairs, which are
+        generated with 'worker_pool.map_ordered'. The results are
+        provided in task order in any case.
+
+        Args:
+            function (Callable): The function generating a chunk, called
+                with the seed, the number of the first task, the number
+                of tasks of the chunk and the further arguments.
+            task_no_first (int): The number of the first task, starting
+                with zero.
+            no_tasks (int): The number of tasks.
+            *args: The further arguments of the function.
+
+        Yields:
+            The results of the tasks in task order.
+        """
+        chunk_size = max(
+            1,
+            min(
+                worker_pool.CHUNK_ELEMENTS
+                // (2 * sds_glob.inst_config.get_degree_max()),
+                -(-no_tasks // (self._workers * worker_pool.CHUNKS_AHEAD)),
+            ),
+        )
+        task_no_end = task_no_first + no_tasks
+
+        jobs = (
+            (self._seed, chunk_start, min(chunk_size, task_no_end - chunk_start)) + args
+            for chunk_start in range(task_no_first, task_no_end, chunk_size)
+        )
+
+        for result in worker_pool.map_ordered(function, jobs, self._workers):
+            yield from result
+
+    # ------------------------------------------------------------------
+    # Generate the random polynomial pair of a task.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _generate_polynomials(seed: int, task_no: int) -> Tuple[ndarray, ndarray]:
+        """Generate the random polynomial pair of a task.
+
+        The random numbers of a task come from a PCG64 generator of its
+        own, seeded with the child no. 'task_no' of the seed sequence of
+        'seed', as created by 'SeedSequence.spawn()'. The task can thus
+        be generated in any process and in any order. The number of
+        coefficients of the polynomials and the coefficients are
+        determined in a given range as random integers, with one call
+        for both numbers of coefficients and one call for all
+        coefficients. With a density ('density') below 1, the other
+        coefficients are set to zero. The leading coefficients are then
+        drawn from the non-zero values of the range, so that both
+        polynomials have the drawn degrees and the product the sum of
+        these degrees.
+
+        Args:
+            seed (int): The seed of the task generation.
+            task_no (int): The number of the task, starting with zero.
+
+        Returns:
+            Tuple[ndarray, ndarray]: The coefficients of Polynomial 1 and
+                Polynomial 2 as int64.
+        """
+        rng = numpy.random.Generator(
+            numpy.random.PCG64(numpy.random.SeedSequence(seed, spawn_key=(task_no,)))
+        )
+
+        coef_min = sds_glob.inst_config.get_coef_min()
+        coef_max = sds_glob.inst_config.get_coef_max()
+
+        sizes = rng.integers(
+            sds_glob.inst_config.get_degree_min(),
+            sds_glob.inst_config.get_degree_max(),
+            size=2,
+            endpoint=True,
+        )
+        coefficients = rng.integers(coef_min, coef_max, size=int(sizes.sum()))
+
+        # Below the density 1 a coefficient is kept with the probability
+        # 'density', the random numbers for density 1 are unchanged.
+        density = sds_glob.inst_config.get_config_value(sds_glob.CONFIG_PARAM_DENSITY)
+        if density < 1:
+            coefficients[rng.random(len(coefficients)) >= density] = 0
+
+        size_1 = int(sizes[0])
+
+        # The zero is skipped by shifting the non-negative values by one.
+        has_zero = coef_min <= 0 < coef_max
+        no_values = coef_max - coef_min - has_zero
+        if no_values > 0:
+            leading = rng.integers(coef_min, coef_min + no_values, size=2)
+            if has_zero:
+                leading[leading >= 0] += 1
+            coefficients[[size_1 - 1, len(coefficients) - 1]] = leading
+
+        return coefficients[:size_1], coefficients[size_1:]
+
     # ------------------------------------------------------------------
     # Generation a task consisting of a polynomial pair and
     # their product.
     # ------------------------------------------------------------------
     @staticmethod
-    def _generate_task(no_task: int) -> Tuple[Polynomial, Polynomial, Polynomial]:
+    def _generate_task(seed: int, task_no: int) -> Tuple[ndarray, ndarray, ndarray]:
         """Generation a task consisting of a polynomial pair and their product.
 
-        The degree of the polynomials and the coefficients are
-        determined in a given range as random integers
+        The product is calculated exactly, see '_multiply'.
 
         Args:
-            no_task (int): The task number
+            seed (int): The seed of the task generation.
+            task_no (int): The number of the task, starting with zero.
 
         Returns:
-            Tuple[Polynomial, Polynomial, Polynomial]:
-                Polynomial 1, Polynomial 2 and Polynomial 1 * Polynomial 2.
+            Tuple[ndarray, ndarray, ndarray]: The coefficients of
+                Polynomial 1, Polynomial 2 and Polynomial 1 * Polynomial 2,
+                those of the product as int64 or, beyond the int64 range,
+                as Python integers.
         """
         # Start time measurement.
         start_time = time.time_ns()
 
-        # Creation of the first polynomial.
-        polynom_1 = Polynomial(
-            numpy.random.randint(
-                sds_glob.inst_config.get_coef_min(),
-                sds_glob.inst_config.get_coef_max(),
-                random.randint(  # nosec
-                    sds_glob.inst_config.get_degree_min(),
-                    sds_glob.inst_config.get_degree_max(),
-                ),
-            )
-        )
-
-        # Creation of the second polynomial.
-        polynom_2 = Polynomial(
-            numpy.random.randint(
-                sds_glob.inst_config.get_coef_min(),
-                sds_glob.inst_config.get_coef_max(),
-                random.randint(  # nosec
-                    sds_glob.inst_config.get_degree_min(),
-                    sds_glob.inst_config.get_degree_max(),
-                ),
-            )
-        )
+        # Creation of the polynomial pair.
+        polynom_1, polynom_2 = Generator._generate_polynomials(seed, task_no)
 
         # Calculation of the product.
-        product = polynom_1 * polynom_2
+        product = Generator._multiply(polynom_1, polynom_2)
 
         # Stop time measurement and store the results.
         utils.progress_msg_time_elapsed(
             time.time_ns() - start_time,
-            f"task no. {no_task + 1:2d} (degrees: {polynom_1.degree():5d} - "
-            + f"{polynom_2.degree():5d} - {product.degree():5d}) generated",
+            f"task no. {task_no + 1:2d} (degrees: {len(polynom_1) - 1:5d} - "
+            + f"{len(polynom_2) - 1:5d} - {len(product) - 1:5d}) generated",
         )
 
         return polynom_1, polynom_2, product
+
+    # ------------------------------------------------------------------
+    # Provide the JSON representation of a polynomial.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_json_polynom(coefficients: ndarray) -> dict:
+        """Provide the JSON representation of a polynomial.
+
+        With a density ('density') below 1, a polynomial with fewer
+        non-zero terms than half its coefficients gets the sparse
+        encoding: the exponents of the non-zero terms, ascending, and
+        their coefficients.
+
+        Args:
+            coefficients (ndarray): The coefficients of the polynomial.
+
+        Returns:
+            dict: The degree and the coefficients of the polynomial.
+        """
+        if sds_glob.inst_config.get_config_value(sds_glob.CONFIG_PARAM_DENSITY) < 1:
+            exponents = numpy.flatnonzero(coefficients)
+
+            if 2 * len(exponents) < len(coefficients):
+                return {
+                    sds_glob.JSON_NAME_DEGREE: len(coefficients) - 1,
+                    sds_glob.JSON_NAME_EXPONENTS: exponents.tolist(),
+                    sds_glob.JSON_NAME_COEFFICIENTS: coefficients[exponents].tolist(),
+                }
+
+        return {
+            sds_glob.JSON_NAME_DEGREE: len(coefficients) - 1,
+            sds_glob.JSON_NAME_COEFFICIENTS: coefficients.tolist(),
+        }
+
+    # ------------------------------------------------------------------
+    # Provide the degree of the product of a polynomial pair.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_product_degree(polynom_1: ndarray, polynom_2: ndarray) -> int:
+        """Provide the degree of the product of a polynomial pair.
+
+        The product drops its highest zero coefficients, these are the
+        products of the highest zero coefficients of the factors. The
+        degree is thus the sum of the degrees without the highest zero
+        coefficients, without multiplying.
+
+        Args:
+            polynom_1 (ndarray): The coefficients of Polynomial 1.
+            polynom_2 (ndarray): The coefficients of Polynomial 2.
+
+        Returns:
+            int: The degree of Polynomial 1 * Polynomial 2.
+        """
+        non_zero_1 = numpy.flatnonzero(polynom_1)
+        non_zero_2 = numpy.flatnonzero(polynom_2)
+
+        if len(non_zero_1) == 0 or len(non_zero_2) == 0:
+            return 0
+
+        return int(non_zero_1[-1]) + int(non_zero_2[-1])
+
+    # ------------------------------------------------------------------
+    # Multiply a polynomial pair exactly.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _multiply(polynom_1: ndarray, polynom_2: ndarray) -> ndarray:
+        """Multiply a polynomial pair exactly.
+
+        Sparse polynomials are multiplied by their non-zero terms. As
+        long as the bound of the product coefficients stays below
+        '_FLOAT_EXACT_LIMIT', the fast float64 convolution is exact,
+        otherwise the Kronecker substitution on arbitrary-precision
+        integers is used. The highest zero coefficients of the product
+        are dropped, a zero product keeps one coefficient.
+
+        Args:
+            polynom_1 (ndarray): The coefficients of Polynomial 1.
+            polynom_2 (ndarray): The coefficients of Polynomial 2.
+
+        Returns:
+            ndarray: The coefficients of Polynomial 1 * Polynomial 2, as
+                int64 or, beyond the int64 range, as Python integers.
+        """
+        # Without 'abs', which overflows for the smallest integer.
+        coef_bound = (
+            min(len(polynom_1), len(polynom_2))
+            * max(-int(polynom_1.min()), int(polynom_1.max()))
+            * max(-int(polynom_2.min()), int(polynom_2.max()))
+        )
+
+        if sparse_engine.is_sparse(polynom_1, polynom_2):
+            product = sparse_engine.multiply_sparse(polynom_1, polynom_2)
+        elif coef_bound < _FLOAT_EXACT_LIMIT:
+            product = numpy.trim_zeros(
+                numpy.convolve(
+                    polynom_1.astype(numpy.float64), polynom_2.astype(numpy.float64)
+                ).astype(numpy.int64),
+                "b",
+            )
+        else:
+            product = kronecker_engine.multiply_kronecker(polynom_1, polynom_2)
+
+        if len(product) == 0:
+            return numpy.zeros(1, dtype=numpy.int64)
+
+        return product
+
+    # ------------------------------------------------------------------
+    # Check the configuration parameters of the generator.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def check_config() -> None:
+        """Check the configuration parameters of the generator.
+
+        The check is done before any task is generated, so that the
+        action 'stream' can do it before the 'Generator' is started in
+        a thread of its own.
+        """
+        coef_min = sds_glob.inst_config.get_coef_min()
+        coef_max = sds_glob.inst_config.get_coef_max()
+
+        # The coefficients are drawn as int64 values.
+        if coef_min < -(2**63) or coef_max > 2**63 - 1:
+            # ERROR.00.925 The coefficients from {coef_min} to {coef_max}
+            # exceed the int64 range of the generator
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_925.replace("{coef_min}", str(coef_min)).replace(
+                    "{coef_max}", str(coef_max)
+                )
+            )
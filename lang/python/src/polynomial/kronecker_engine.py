@@ -0,0 +1,164 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Exact multiplication of polynomials by the Kronecker substitution."""
+from __future__ import annotations
+
+import numpy
+import utils  # type: ignore
+from numpy import ndarray
+
+
+# ------------------------------------------------------------------
+# Provide the big integer of the bias of all slots.
+# ------------------------------------------------------------------
+def _get_offset(no_slots: int, slot_bytes: int) -> int:
+    """Provide the big integer of the bias of all slots.
+
+    Every slot contains the bias 2**(8 * slot_bytes - 1).
+
+    Args:
+        no_slots (int): The number of slots.
+        slot_bytes (int): The number of bytes per slot.
+
+    Returns:
+        int: The packed bias values.
+    """
+    return int.from_bytes(
+        (1 << (8 * slot_bytes - 1)).to_bytes(slot_bytes, "little") * no_slots,
+        "little",
+    )
+
+
+# ------------------------------------------------------------------
+# Pack the coefficients into a big integer.
+# ------------------------------------------------------------------
+def _pack(coefficients: list[int], slot_bytes: int) -> int:
+    """Pack the coefficients into a big integer.
+
+    The coefficients are stored with the bias 2**(8 * slot_bytes - 1)
+    in little-endian slots of 'slot_bytes' bytes, so that every slot is
+    non-negative. The caller removes the bias again by subtracting the
+    result of '_get_offset'.
+
+    Args:
+        coefficients (list[int]): The coefficients of the polynomial.
+        slot_bytes (int): The number of bytes per slot.
+
+    Returns:
+        int: The packed coefficients including the bias.
+    """
+    bias = 1 << (8 * slot_bytes - 1)
+
+    if slot_bytes > 8:
+        return int.from_bytes(
+            b"".join(
+                (int(coeff) + bias).to_bytes(slot_bytes, "little")
+                for coeff in coefficients
+            ),
+            "little",
+        )
+
+    slots = (
+        numpy.asarray(coefficients, dtype=numpy.int64).astype("<u8")
+        + numpy.uint64(bias)
+    ).view(numpy.uint8)
+
+    return int.from_bytes(
+        slots.reshape(-1, 8)[:, :slot_bytes].tobytes(),
+        "little",
+    )
+
+
+# ------------------------------------------------------------------
+# Unpack the coefficients from a big integer.
+# ------------------------------------------------------------------
+def _unpack(value: int, no_slots: int, slot_bytes: int) -> ndarray:
+    """Unpack the coefficients from a big integer.
+
+    The inverse of '_pack': every slot contains a coefficient plus the
+    bias 2**(8 * slot_bytes - 1).
+
+    Args:
+        value (int): The packed coefficients including the bias.
+        no_slots (int): The number of slots.
+        slot_bytes (int): The number of bytes per slot.
+
+    Returns:
+        ndarray: The coefficients.
+    """
+    bias = 1 << (8 * slot_bytes - 1)
+
+    packed = value.to_bytes(no_slots * slot_bytes, "little")
+
+    if slot_bytes > 8:
+        return numpy.array(
+            [
+                int.from_bytes(packed[start:end], "little") - bias
+                for start, end in zip(
+                    range(0, len(packed), slot_bytes),
+                    range(slot_bytes, len(packed) + 1, slot_bytes),
+                )
+            ],
+            dtype=object,
+        )
+
+    slots = numpy.zeros((no_slots, 8), dtype=numpy.uint8)
+    slots[:, :slot_bytes] = numpy.frombuffer(packed, dtype=numpy.uint8).reshape(
+        no_slots, slot_bytes
+    )
+
+    return (slots.view("<u8").reshape(no_slots) - numpy.uint64(bias)).astype(
+        numpy.int64
+    )
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials exactly by the Kronecker substitution.
+# ------------------------------------------------------------------
+def multiply_kronecker(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials exactly by the Kronecker substitution.
+
+    Both polynomials are evaluated at 2**(8 * slot_bytes), which packs
+    their coefficients into one big integer each. A single
+    multiplication of these integers with the arbitrary-precision
+    arithmetic of Python then yields the packed coefficients of the
+    product. The slot size is chosen so that every coefficient of the
+    product fits into a slot with its sign, hence the result is exact
+    for coefficients of any size.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The coefficients of the product without leading zero
+            terms, as int64 if every slot fits into 8 bytes, otherwise
+            as Python integers.
+    """
+    size_1 = len(coefficients_1)
+    size_2 = len(coefficients_2)
+    size = size_1 + size_2 - 1
+
+    coef_max_1 = utils.get_abs_max(coefficients_1)
+    coef_max_2 = utils.get_abs_max(coefficients_2)
+
+    # Upper bound of the absolute value of a product coefficient.
+    coef_max = max(
+        min(size_1, size_2) * coef_max_1 * coef_max_2, coef_max_1, coef_max_2
+    )
+    slot_bytes = (coef_max.bit_length() + 1 + 7) // 8
+
+    value_1 = _pack(coefficients_1, slot_bytes) - _get_offset(size_1, slot_bytes)
+    value_2 = _pack(coefficients_2, slot_bytes) - _get_offset(size_2, slot_bytes)
+
+    return utils.delete_leading_zero_terms(
+        _unpack(
+            value_1 * value_2 + _get_offset(size, slot_bytes),
+            size,
+            slot_bytes,
+        )
+    )
@@ -12,18 +12,27 @@ import argparse
 import locale
 import os
 import sys
+import threading
 import time
 
+import benchmark
+import calibrator
 import generator
 import multiplier
 import sds_glob
+import task_reader
 import utils
 
 # -----------------------------------------------------------------------------
 # Global variables.
 # -----------------------------------------------------------------------------
 _ARG_ACTION = "action"
+_ARG_BASELINE = "baseline"
+_ARG_FORMAT = "format"
 _ARG_METHOD = "method"
+_ARG_TASKS = "tasks"
+_ARG_VERIFY = "verify"
+_ARG_WORKERS = "workers"
 
 _LOCALE = "en_US.UTF-8"
 
@@ -34,21 +43,82 @@ _LOCALE = "en_US.UTF-8"
 def _get_args() -> dict[str, str]:
     """Load the command line arguments into the memory.
 
-    The two possible command line arguments are 'action' and 'method'.
-
-    'action' is mandatory and determines with the values 'generate'
-    and 'multiply' the action to be executed. With 'generate' a JSON
-    file with a given number of polynomial pairs and their product
-    is generated.  With 'multiply', the polynomial pairs present in
-    the JSON file are multiplied and the result is checked against
-    the sample solution present in the JSON file.
+    The possible command line arguments are 'action', 'baseline',
+    'format', 'method', 'tasks', 'verify' and 'workers'.
+
+    'action' is mandatory and determines with the values 'benchmark',
+    'calibrate', 'generate', 'multiply' and 'stream' the action to be
+    executed. With 'benchmark' the multiplication methods are timed
+    with warmup runs and repetitions on a grid of degrees and
+    coefficient bit lengths and the minimum, median and 95th
+    percentile of the durations are written to the files
+    'benchmark.json' and 'benchmark.csv'. With 'calibrate' the
+    multiplication methods are timed on this machine and the resulting
+    crossover table for the method 'auto' is written to the tuning
+    file. With 'generate' a JSON file with a given number
+    of polynomial pairs and their product is generated.  With
+    'multiply', the polynomial pairs present in the JSON file are
+    multiplied and the result is checked against the sample solution
+    present in the JSON file. With 'stream' the generated tasks are
+    passed through a bounded in-memory queue directly to the
+    multiplication and checked there, no file is written or read.
+
+    'baseline' is optional and names a results file of an earlier run
+    of the action 'benchmark'. The new results are compared with it
+    per method and grid point, and the run terminates with a table of
+    the differences if a median duration exceeds the tolerance of the
+    configuration and the slowdown is statistically significant.
+
+    'format' is optional and defines the format of the task file for
+    the actions 'generate' and 'multiply'. 'json', the default value,
+    is the JSON file. 'binary' is a binary task file with a header, a
+    table with the offset and the degree of every polynomial and the
+    coefficients as little-endian int32 or int64 arrays, which are
+    multiplied directly from the memory-mapped file.
 
     'method' is optional and defines the method to be used for the
-    polynomial multiplication. 'fft' is the default value at which
-    a Fast Fourier Transform is performed. For 'numpy' the polynomial
-    module of NumPy is used for the calculation of the product. With
-    'simple' all terms of the two polynomials are simply multiplied
+    polynomial multiplication.
+    'auto' selects the fastest method per task from the crossover table.
+    'batch' multiplies all tasks with the same transform size at once
+    with one real Fast Fourier Transform of NumPy on 2-D arrays.
+    'fft' is the default value at which a Fast Fourier Transform is
+    performed.
+    'karatsuba' and 'toom3' apply the divide-and-conquer methods of
+    Karatsuba and Toom-Cook down to a configurable cutoff degree.
+    'kronecker' packs the coefficients into big integers and multiplies
+    these exactly with the integer arithmetic of Python.
+    'ntt' applies number-theoretic transforms modulo several primes and
+    reconstructs the exact product with the Chinese Remainder Theorem.
+    For 'numpy' the polynomial module of NumPy is used for the
+    calculation of the product.
+    'rfft' applies the real Fast Fourier Transform of NumPy to whole
+    arrays and splits large coefficients so that the product stays
+    exact.
+    With 'simple' all terms of the two polynomials are simply multiplied
     and the like terms are added up.
+    'sparse' multiplies only the non-zero terms and is selected by
+    'auto' for sparse polynomials.
+
+    'tasks' is optional and selects the tasks of the action 'multiply'
+    with task numbers and ranges of task numbers, e.g. '120-180,500'.
+    The selected tasks are read directly at their position in the task
+    file, for a JSON file via its index file, which the action
+    'generate' writes and which is otherwise created on the first use.
+    By default all tasks are processed.
+
+    'verify' is optional and defines how the calculated products are
+    checked against the products in the JSON file. With 'first', the
+    default value, the processing terminates at the first difference.
+    With 'all' every difference in degree or coefficient is collected
+    and all of them are reported at the end of the run. With
+    'probabilistic' the products are not calculated: the given products
+    are checked by evaluating all polynomials at random points modulo a
+    prime, and all differences are reported at the end of the run.
+
+    'workers' is optional and defines the number of worker processes for
+    the actions 'generate', 'multiply' and 'stream'. The default value 1
+    processes the tasks one after another, with more workers the tasks
+    are distributed in chunks over a process pool.
 
     Returns:
         dict[str, str]: The command line arguments.
@@ -71,29 +141,114 @@ def _get_args() -> dict[str, str]:
         "-a",
         "--action",
         help="the action to process: '"
+        + sds_glob.ARG_ACTION_BENCHMARK
+        + "' (the methods on a grid of degrees) or '"
+        + sds_glob.ARG_ACTION_CALIBRATE
+        + "' (the methods on this machine) or '"
         + sds_glob.ARG_ACTION_GENERATE
         + "' (a JSON file with polynomials) or '"
         + sds_glob.ARG_ACTION_MULTIPLY
-        + "' (the polynomials from a JSON file)",
+        + "' (the polynomials from a JSON file) or '"
+        + sds_glob.ARG_ACTION_STREAM
+        + "' (generated polynomials without a file)",
         metavar="ACTION",
         type=str,
     )
 
+    parser.add_argument(
+        "--baseline",
+        default="",
+        help="the baseline results file of the action '"
+        + sds_glob.ARG_ACTION_BENCHMARK
+        + "' to check the results for regressions (default: no check)",
+        metavar="BASELINE",
+        type=str,
+    )
+
+    parser.add_argument(
+        "-f",
+        "--format",
+        default=sds_glob.ARG_FORMAT_JSON,
+        help="the format of the task file: '"
+        + sds_glob.ARG_FORMAT_BINARY
+        + "' (memory-mapped binary file) or '"
+        + sds_glob.ARG_FORMAT_JSON
+        + "' (JSON file)",
+        metavar="FORMAT",
+        type=str,
+    )
+
     parser.add_argument(
         "-m",
         "--method",
         default=sds_glob.ARG_METHOD_FFT,
         help="the method to apply: '"
+        + sds_glob.ARG_METHOD_AUTO
+        + "' (fastest method per task) or '"
+        + sds_glob.ARG_METHOD_BATCH
+        + "' (batched NumPy real Fast Fourier Transform) or '"
         + sds_glob.ARG_METHOD_FFT
         + "' (Fast Fourier Transform) or '"
+        + sds_glob.ARG_METHOD_KARATSUBA
+        + "' (Karatsuba) or '"
+        + sds_glob.ARG_METHOD_KRONECKER
+        + "' (Kronecker substitution) or '"
+        + sds_glob.ARG_METHOD_NTT
+        + "' (number-theoretic transform) or '"
         + sds_glob.ARG_METHOD_NUMPY
         + "' (NumPy Polynomials) or '"
+        + sds_glob.ARG_METHOD_RFFT
+        + "' (NumPy real Fast Fourier Transform) or '"
         + sds_glob.ARG_METHOD_SIMPLE
-        + "' (simple multiplication)",
+        + "' (simple multiplication) or '"
+        + sds_glob.ARG_METHOD_SPARSE
+        + "' (non-zero terms only) or '"
+        + sds_glob.ARG_METHOD_TOOM3
+        + "' (Toom-3)",
         metavar="METHOD",
         type=str,
     )
 
+    parser.add_argument(
+        "-t",
+        "--tasks",
+        default="",
+        help="the task numbers and ranges of task numbers for the action '"
+        + sds_glob.ARG_ACTION_MULTIPLY
+        + "', e.g. '120-180,500' (default: all tasks)",
+        metavar="TASKS",
+        type=str,
+    )
+
+    parser.add_argument(
+        "--verify",
+        default=sds_glob.ARG_VERIFY_FIRST,
+        help="the verification of the products: '"
+        + sds_glob.ARG_VERIFY_ALL
+        + "' (report all differences) or '"
+        + sds_glob.ARG_VERIFY_FIRST
+        + "' (terminate at the first difference) or '"
+        + sds_glob.ARG_VERIFY_PROBABILISTIC
+        + "' (check the given products at random points)",
+        metavar="VERIFY",
+        type=str,
+    )
+
+    parser.add_argument(
+        "-w",
+        "--workers",
+        default=1,
+        help="the number of worker processes for the actions '"
+        + sds_glob.ARG_ACTION_GENERATE
+        + "', '"
+        + sds_glob.ARG_ACTION_MULTIPLY
+        + "' and '"
+        + sds_glob.ARG_ACTION_STREAM
+        + "'",
+        metavar="WORKERS",
+        type=int,
+    )
+
     # -------------------------------------------------------------------------
     # Load and check the command line arguments.
     # -------------------------------------------------------------------------
@@ -103,36 +258,115 @@ def _get_args() -> dict[str, str]:
 
     if not (
         args[_ARG_ACTION]
-        in [sds_glob.ARG_ACTION_GENERATE, sds_glob.ARG_ACTION_MULTIPLY]
+        in [
+            sds_glob.ARG_ACTION_BENCHMARK,
+            sds_glob.ARG_ACTION_CALIBRATE,
+            sds_glob.ARG_ACTION_GENERATE,
+            sds_glob.ARG_ACTION_MULTIPLY,
+            sds_glob.ARG_ACTION_STREAM,
+        ]
     ):
         utils.terminate_fatal(
             "The specified action is neither '"
+            + sds_glob.ARG_ACTION_BENCHMARK
+            + "', '"
+            + sds_glob.ARG_ACTION_CALIBRATE
+            + "', '"
             + sds_glob.ARG_ACTION_GENERATE
-            + "' nor '"
+            + "', '"
             + sds_glob.ARG_ACTION_MULTIPLY
+            + "' nor '"
+            + sds_glob.ARG_ACTION_STREAM
             + f"': {args[_ARG_ACTION]}",
         )
 
+    args[_ARG_BASELINE] = parsed_args.baseline
+
+    args[_ARG_FORMAT] = parsed_args.format.lower()
+
+    if not (
+        args[_ARG_FORMAT]
+        in [
+            sds_glob.ARG_FORMAT_BINARY,
+            sds_glob.ARG_FORMAT_JSON,
+        ]
+    ):
+        utils.terminate_fatal(
+            "The specified format is neither '"
+            + sds_glob.ARG_FORMAT_BINARY
+            + "' nor '"
+            + sds_glob.ARG_FORMAT_JSON
+            + f"': {args[_ARG_FORMAT]}",
+        )
+
     args[_ARG_METHOD] = parsed_args.method.lower()
 
     if not (
         args[_ARG_METHOD]
         in [
+            sds_glob.ARG_METHOD_AUTO,
+            sds_glob.ARG_METHOD_BATCH,
             sds_glob.ARG_METHOD_FFT,
+            sds_glob.ARG_METHOD_KARATSUBA,
+            sds_glob.ARG_METHOD_KRONECKER,
+            sds_glob.ARG_METHOD_NTT,
             sds_glob.ARG_METHOD_NUMPY,
+            sds_glob.ARG_METHOD_RFFT,
             sds_glob.ARG_METHOD_SIMPLE,
+            sds_glob.ARG_METHOD_SPARSE,
+            sds_glob.ARG_METHOD_TOOM3,
         ]
     ):
         utils.terminate_fatal(
             "The specified method is neither '"
+            + sds_glob.ARG_METHOD_AUTO
+            + "', '"
+            + sds_glob.ARG_METHOD_BATCH
+            + "', '"
             + sds_glob.ARG_METHOD_FFT
             + "', '"
+            + sds_glob.ARG_METHOD_KARATSUBA
+            + "', '"
+            + sds_glob.ARG_METHOD_KRONECKER
+            + "', '"
+            + sds_glob.ARG_METHOD_NTT
+            + "', '"
             + sds_glob.ARG_METHOD_NUMPY
-            + "' nor '"
+            + "', '"
+            + sds_glob.ARG_METHOD_RFFT
+            + "', '"
             + sds_glob.ARG_METHOD_SIMPLE
+            + "', '"
+            + sds_glob.ARG_METHOD_SPARSE
+            + "' nor '"
+            + sds_glob.ARG_METHOD_TOOM3
             + f"': {args[_ARG_METHOD]}",
         )
 
+    args[_ARG_TASKS] = parsed_args.tasks
+
+    args[_ARG_VERIFY] = parsed_args.verify.lower()
+
+    if not (
+        args[_ARG_VERIFY]
+        in [
+            sds_glob.ARG_VERIFY_ALL,
+            sds_glob.ARG_VERIFY_FIRST,
+            sds_glob.ARG_VERIFY_PROBABILISTIC,
+        ]
+    ):
+        utils.terminate_fatal(
+            "The specified verification is neither '"
+            + sds_glob.ARG_VERIFY_ALL
+            + "', '"
+            + sds_glob.ARG_VERIFY_FIRST
+            + "' nor '"
+            + sds_glob.ARG_VERIFY_PROBABILISTIC
+            + f"': {args[_ARG_VERIFY]}",
+        )
+
+    args[_ARG_WORKERS] = str(parsed_args.workers)
+
     # --------------------------------------------------------------------------
     # Display the command line arguments.
     # --------------------------------------------------------------------------
@@ -142,17 +376,88 @@ def _get_args() -> dict[str, str]:
             "{value}", args[_ARG_ACTION]
         )
     )
+    utils.progress_msg(
+        sds_glob.INFO_00_005.replace("{arg}", _ARG_BASELINE).replace(
+            "{value}", args[_ARG_BASELINE]
+        )
+    )
+    utils.progress_msg(
+        sds_glob.INFO_00_005.replace("{arg}", _ARG_FORMAT).replace(
+            "{value}", args[_ARG_FORMAT]
+        )
+    )
     utils.progress_msg(
         sds_glob.INFO_00_005.replace("{arg}", _ARG_METHOD).replace(
             "{value}", args[_ARG_METHOD]
         )
     )
+    utils.progress_msg(
+        sds_glob.INFO_00_005.replace("{arg}", _ARG_TASKS).replace(
+            "{value}", args[_ARG_TASKS]
+        )
+    )
+    utils.progress_msg(
+        sds_glob.INFO_00_005.replace("{arg}", _ARG_VERIFY).replace(
+            "{value}", args[_ARG_VERIFY]
+        )
+    )
+    utils.progress_msg(
+        sds_glob.INFO_00_005.replace("{arg}", _ARG_WORKERS).replace(
+            "{value}", args[_ARG_WORKERS]
+        )
+    )
 
     sds_glob.logger.debug(sds_glob.LOGGER_END)
 
     return args
 
 
+# -----------------------------------------------------------------------------
+# Generate and multiply the tasks without a task file.
+# -----------------------------------------------------------------------------
+def _stream(method: str, workers: int, verify: str) -> None:
+    """Generate and multiply the tasks without a task file.
+
+    The 'Generator' runs in a thread of its own and puts the tasks into
+    a bounded task queue, from which the 'Multiplier' takes them. An
+    error of the 'Generator' is raised after the 'Multiplier' has
+    processed the tasks generated so far, an error of the 'Multiplier'
+    stops the 'Generator'.
+
+    Args:
+        method (str): The processing method of the 'Multiplier'.
+        workers (int): The number of worker processes of the
+            'Generator' and of the 'Multiplier' each.
+        verify (str): The verification mode of the 'Multiplier'.
+    """
+    # A faulty configuration is reported before any thread is started.
+    generator.Generator.check_config()
+
+    task_queue = task_reader.TaskQueue()
+    errors: list[BaseException] = []
+
+    def generate() -> None:
+        try:
+            generator.Generator("", workers=workers, task_queue=task_queue)
+        except BaseException as exc:  # pylint: disable=broad-except
+            errors.append(exc)
+            # Otherwise the 'Multiplier' waits forever if the 'Generator'
+            # fails before it puts any task.
+            task_queue.finish()
+
+    thread = threading.Thread(target=generate, name="generator")
+    thread.start()
+
+    try:
+        multiplier.Multiplier(task_queue, method, workers=workers, verify=verify)
+    finally:
+        task_queue.close()
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+
 # -----------------------------------------------------------------------------
 # Initialising the logging functionality.
 # -----------------------------------------------------------------------------
@@ -187,10 +492,25 @@ def main(argv: list[str]) -> None:
     file_name = os.getenv(sds_glob.POLYNOMIAL_FILE_NAME)
 
     # Perform the processing
-    if args[_ARG_ACTION] == sds_glob.ARG_ACTION_GENERATE:
-        generator.Generator(file_name)
+    if args[_ARG_ACTION] == sds_glob.ARG_ACTION_BENCHMARK:
+        benchmark.Benchmark(sds_glob.BENCHMARK_FILE, baseline=args[_ARG_BASELINE])
+    elif args[_ARG_ACTION] == sds_glob.ARG_ACTION_CALIBRATE:
+        calibrator.Calibrator(sds_glob.TUNING_FILE)
+    elif args[_ARG_ACTION] == sds_glob.ARG_ACTION_GENERATE:
+        generator.Generator(
+            file_name,
+            file_format=args[_ARG_FORMAT],
+            workers=int(args[_ARG_WORKERS]),
+        )
     elif args[_ARG_ACTION] == sds_glob.ARG_ACTION_MULTIPLY:
-        multiplier.Multiplier(file_name, args[_ARG_METHOD])
+        multiplier.Multiplier(
+            task_reader.TaskFile(file_name, args[_ARG_FORMAT], args[_ARG_TASKS]),
+            args[_ARG_METHOD],
+            workers=int(args[_ARG_WORKERS]),
+            verify=args[_ARG_VERIFY],
+        )
+    elif args[_ARG_ACTION] == sds_glob.ARG_ACTION_STREAM:
+        _stream(args[_ARG_METHOD], int(args[_ARG_WORKERS]), args[_ARG_VERIFY])
 
     # Stop time measurement.
     utils.progress_msg_time_elapsed(
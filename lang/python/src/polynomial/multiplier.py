@@ -5,16 +5,33 @@
 """Class for multiplying the polynomials and checking the result."""
 from __future__ import annotations
 
-import cmath
-import json
+import gc
 import os
 import time
+from typing import Iterable
 
+import dac_engine  # type: ignore
+import fft_engine  # type: ignore
+import kronecker_engine  # type: ignore
+import ntt_engine  # type: ignore
 import numpy
 import sds_glob  # type: ignore
+import sparse_engine  # type: ignore
+import task_decoder  # type: ignore
+import task_reader  # type: ignore
+import tuning_table  # type: ignore
 import utils  # type: ignore
+import verifier  # type: ignore
+import worker_pool  # type: ignore
 from numpy import ndarray
 
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Statistics of a task: task number, duration, degrees of both
+# polynomials and of the product and the durations of the phases.
+Statistic = tuple[int, int, int, int, int, tuple[int, int, int, int]]
+
 
 # pylint: disable=too-few-public-methods
 # pylint: disable=too-many-instance-attributes
@@ -22,28 +39,83 @@ class Multiplier:
     """Class for multiplying the polynomials and checking the resulting
     product."""
 
+    # ------------------------------------------------------------------
+    # Class variables.
+    # ------------------------------------------------------------------
+    # Maximum number of float64 elements of an operand array of the
+    # method 'batch': larger size classes are transformed in chunks.
+    _BATCH_ELEMENTS_MAX = 2**22
+
+    # Phases of the processing of a task and percentiles of their
+    # durations in the statistics.
+    _PHASES = ("parse", "convert", "multiply", "verify")
+    _PERCENTILES = (50, 95, 99)
+
     # ------------------------------------------------------------------
     # Initialise the instance.
     # ------------------------------------------------------------------
-    def __init__(self, file_name: str, method: str) -> None:
+    def __init__(
+        self,
+        source: task_reader.TaskFile | task_reader.TaskQueue,
+        method: str,
+        workers: int = 1,
+        verify: str = sds_glob.ARG_VERIFY_FIRST,
+    ) -> None:
         """Perform the tasks from the JSON file.
 
         An instance of this class processes a JSON file created by the
-        'Generator' class. Three different methods for calculating the
+        'Generator' class, a binary task file, a manifest of shard
+        files or the tasks that the 'Generator' class puts into a task
+        queue. The following methods for calculating the
         polynomial products are provided:
 
-            'fft'    - a Fast Fourier Transform oriented method.
-            'numpy'  - the polynomial multiplication of the polynomial
-                       module of NumPy
-            'simple' - a sequential multiplication of all terms of
-                       the two polynomials with each other and then
-                       a summation of the like terms
+            'auto'      - the fastest of the following methods per task,
+                          based on the crossover table of the calibration,
+                          or 'sparse' for sparse polynomials
+            'batch'     - the real Fast Fourier Transform of NumPy applied
+                          to all tasks with the same transform size at
+                          once
+            'fft'       - a Fast Fourier Transform oriented method.
+            'karatsuba' - the divide-and-conquer method of Karatsuba
+                          with three half-size products per step
+            'kronecker' - a Kronecker substitution: both polynomials
+                          are packed into one big integer each and
+                          multiplied with the integer multiplication
+                          of Python
+            'ntt'       - a number-theoretic transform modulo up to three
+                          primes with the Chinese Remainder Theorem
+            'numpy'     - the polynomial multiplication of the polynomial
+                          module of NumPy
+            'rfft'      - the real Fast Fourier Transform of NumPy with
+                          an exact integer result
+            'simple'    - a sequential multiplication of all terms of
+                          the two polynomials with each other and then
+                          a summation of the like terms
+            'sparse'    - the products of the non-zero terms only, merged
+                          into the terms of the product by their exponent
+            'toom3'     - the divide-and-conquer method of Toom-Cook
+                          with five third-size products per step
 
         Args:
-            file_name (str):
-                The name of the JSON file to process.
+            source (task_reader.TaskFile | task_reader.TaskQueue):
+                The task file with its format and the selection of its
+                tasks, see 'task_reader.TaskFile', or the queue providing
+                the tasks instead of a file, all of which are processed.
             method (str):
-                The processing method: fft, numpy or simple.
+                The processing method: auto, batch, fft, karatsuba,
+                kronecker, ntt, numpy, rfft, simple, sparse or toom3.
+            workers (int, optional):
+                The number of worker processes. With more than one, the
+                tasks are distributed in chunks over a process pool, the
+                shard files of a manifest one per worker process.
+                Defaults to 1.
+            verify (str, optional):
+                The verification mode: 'first' terminates at the first
+                difference to the given product, 'all' reports all
+                differences at the end of the run, 'probabilistic'
+                checks the given products at random points without
+                calculating them and reports all differences at the end
+                of the run. Defaults to 'first'.
         """
         # pylint: disable=duplicate-code
         # Start the run-related time measurement.
@@ -57,73 +129,57 @@ class Multiplier:
         utils.progress_msg(sds_glob.INFO_00_021.replace("{method}", method))
         utils.progress_msg("-" * 79)
 
-        self._file_name = file_name
-        self._method = method
+        self._workers = workers
+
+        # A task file is a named tuple, checked as such so that it is
+        # recognised whichever way the module 'task_reader' is imported.
+        is_task_file = isinstance(source, tuple)
 
         # Check if the specified JSON file with the polynomials exists.
-        if not os.path.isfile(file_name):
+        if is_task_file and not os.path.isfile(source.file_name):
             # ERROR.00.902 The specified JSON file {file_name} does not exist
             utils.terminate_fatal(
-                sds_glob.ERROR_00_902.replace("{file_name}", file_name)
+                sds_glob.ERROR_00_902.replace("{file_name}", source.file_name)
             )
 
-        self._poly_1_coeff: list[int] = []
-        self._poly_1_degree = 0
-        self._poly_2_coeff: list[int] = []
-        self._poly_2_degree = 0
-        self._poly_no_coeff = 0
-        self._prod_coeff: list[int] = []
-        self._prod_degree = 0
-        self._statistics: list[tuple[int, int, int, int]] = []
-        self._task_no = 0
+        if workers < 1:
+            # ERROR.00.914 The number of workers must be at least 1 and not
+            # {workers}
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_914.replace("{workers}", str(workers))
+            )
 
-        # Process the polynomial multiplication tasks contained in the JSON file.
-        with open(
-            self._file_name, "r", encoding=sds_glob.FILE_ENCODING_DEFAULT
-        ) as file_handle:
-            json_data = json.load(file_handle)
-            for task_no, task in enumerate(json_data[sds_glob.JSON_NAME_TASKS]):
-                # Start the task-related time measurement.
-                start_time_task = time.time_ns()
-
-                # Store the data from the JSON file for polynomial multiplication
-                # in instance variables
-                self._poly_1_coeff = task[sds_glob.JSON_NAME_POLYNOM_1][
-                    sds_glob.JSON_NAME_COEFFICIENTS
-                ]
-                self._poly_1_degree = task[sds_glob.JSON_NAME_POLYNOM_1][
-                    sds_glob.JSON_NAME_DEGREE
-                ]
-                self._poly_2_coeff = task[sds_glob.JSON_NAME_POLYNOM_2][
-                    sds_glob.JSON_NAME_COEFFICIENTS
-                ]
-                self._poly_2_degree = task[sds_glob.JSON_NAME_POLYNOM_2][
-                    sds_glob.JSON_NAME_DEGREE
-                ]
-                self._prod_coeff = task[sds_glob.JSON_NAME_PRODUCT][
-                    sds_glob.JSON_NAME_COEFFICIENTS
-                ]
-                self._prod_degree = task[sds_glob.JSON_NAME_PRODUCT][
-                    sds_glob.JSON_NAME_DEGREE
-                ]
-                self._task_no = task_no
-
-                # Calculate and check the polynomial product.
-                self._process_task()
-
-                # Stop the timing and save the measurement results.
-                duration_task = time.time_ns() - start_time_task
-                self._statistics.append(
-                    (
-                        duration_task,
-                        self._poly_1_degree,
-                        self._poly_2_degree,
-                        self._prod_degree,
-                    )
-                )
+        self._init_task_data(method, verify)
+
+        # Start the processing-related time measurement.
+        start_time_processing = time.perf_counter_ns()
+
+        # Process the polynomial multiplication tasks contained in the task
+        # file, which are read one by one.
+        if is_task_file:
+            self._process_task_file(source)
+        else:
+            self._process_selected_tasks(source.get_tasks())
 
         # Print the statistics data for this run.
-        self._show_statistics()
+        self._show_statistics(time.perf_counter_ns() - start_time_processing)
+
+        # Report the differences collected with the verification mode 'all'.
+        if self._differences:
+            for _, difference in sorted(
+                self._differences, key=lambda difference: difference[0]
+            ):
+                utils.progress_msg_core(difference)
+
+            # ERROR.00.916 {no_differences} difference(s) in {no_tasks} task(s)
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_916.replace(
+                    "{no_differences}", str(len(self._differences))
+                ).replace(
+                    "{no_tasks}",
+                    str(len({task_no for task_no, _ in self._differences})),
+                )
+            )
 
         # Provide progress messages.
         utils.progress_msg("-" * 79)
@@ -140,220 +196,795 @@ class Multiplier:
         sds_glob.logger.debug(sds_glob.LOGGER_END)
 
     # ------------------------------------------------------------------
-    # Eliminate the leading zero terms and determine the final degree
-    # of the polynomial product.
+    # Check the calculated product of the current task.
     # ------------------------------------------------------------------
-    @staticmethod
-    def _delete_leading_zero_terms(result) -> ndarray:
-        """Eliminate the leading zero terms and determine the final degree."""
-        zeros = []
-
-        for degree in range(len(result) - 1, -1, -1):
-            if result[degree] == 0:
-                zeros.append(degree)
-            else:
-                break
+    def _check_product(self, result) -> None:
+        """Check the calculated product of the current task.
 
-        if zeros:
-            result = numpy.delete(result, zeros)
+        Args:
+            result: The calculated coefficients of the product.
+        """
+        self._report_differences(
+            self._verifier.check_product(
+                self._task_no, result, (self._prod_coeff, self._prod_degree)
+            )
+        )
 
-        return result
+    # ------------------------------------------------------------------
+    # Check the product of the current task probabilistically.
+    # ------------------------------------------------------------------
+    def _check_product_probabilistic(self) -> None:
+        """Check the product of the current task probabilistically."""
+        self._report_differences(
+            self._verifier.check_product_probabilistic(
+                self._task_no,
+                (self._poly_1_coeff, self._poly_2_coeff),
+                (self._prod_coeff, self._prod_degree),
+            )
+        )
 
     # ------------------------------------------------------------------
-    # Computing the complex conjugates.
+    # Convert the coefficients of the current task into arrays.
     # ------------------------------------------------------------------
-    def _fft_complex_conjugate(self, polynomial) -> list[complex]:
-        """Computing the complex conjugates.
+    def _convert_operands(self) -> None:
+        """Convert the coefficients of the current task into arrays.
 
-        The complex conjugate of a complex number is obtained by changing
-        the sign of its imaginary part.
+        The coefficients of both polynomials are converted once into
+        int64 arrays, beyond the int64 range into object arrays with
+        Python integers, as they are provided by a binary task file.
+        Arrays are kept as they are.
+        """
+        for name in ("_poly_1_coeff", "_poly_2_coeff"):
+            coefficients = getattr(self, name)
 
-        Args:
-            polynomial (list[int]): The coefficients of the polynomial.
+            if isinstance(coefficients, ndarray):
+                continue
 
-        Returns:
-            list[complex]: The complex conjugates.
+            values = numpy.array(coefficients)
+            if values.dtype != numpy.int64:
+                values = numpy.array(coefficients, dtype=object)
+
+            setattr(self, name, values)
+
+    # ------------------------------------------------------------------
+    # Initialise the task-related instance variables.
+    # ------------------------------------------------------------------
+    def _init_task_data(self, method: str, verify: str) -> None:
+        """Initialise the task-related instance variables.
+
+        Args:
+            method (str): The processing method.
+            verify (str): The verification mode.
         """
-        result = self._fft_recursive([coeff.conjugate() for coeff in polynomial])
+        self._differences: list[tuple[int, str]] = []
+        self._method = method
+        self._poly_1_coeff: list[int] | ndarray = []
+        self._poly_1_degree = 0
+        self._poly_2_coeff: list[int] | ndarray = []
+        self._poly_2_degree = 0
+        self._poly_no_coeff = 0
+        self._prod_coeff: list[int] = []
+        self._prod_degree = 0
+        self._statistics: list[Statistic] = []
+        self._task_no = 0
+        self._verifier = verifier.Verifier(verify)
+        self._verify = verify
 
-        return [coeff.conjugate() / len(polynomial) for coeff in result]
+    # ------------------------------------------------------------------
+    # Store the data of a task in the instance variables.
+    # ------------------------------------------------------------------
+    def _load_task(self, task_no: int, task: dict) -> None:
+        """Store the data of a task in the instance variables.
+
+        Args:
+            task_no (int): The number of the task, starting with zero.
+            task (dict): The task from the JSON file.
+        """
+        self._set_task_data(task_decoder.get_task_data(task_no, task))
 
     # ------------------------------------------------------------------
-    # Polynomial multiplication.
+    # Multiply the polynomials by applying the given method.
     # ------------------------------------------------------------------
-    def _fft_multiply_polynomials(self, polynomial_a, polynomial_b):
-        """Polynomial multiplication.
+    def _multiply(self, method: str):
+        """Multiply the polynomials by applying the given method.
 
         Args:
-            polynomial_a (list[int]):
-                The coefficients of the first polynomial.
-            polynomial_b (list[int]):
-                The coefficients of the second polynomial.
+            method (str): The processing method.
 
         Returns:
-            list[int]: Resulting product of the two polynomials.
+            The product of the polynomials.
         """
-        size_total = len(polynomial_a) + len(polynomial_b)
-
-        degree = 1
+        if method == sds_glob.ARG_METHOD_AUTO:
+            return self._multiply_auto()
+
+        engines = {
+            sds_glob.ARG_METHOD_FFT: fft_engine.multiply_fft,
+            sds_glob.ARG_METHOD_KARATSUBA: dac_engine.multiply_karatsuba,
+            sds_glob.ARG_METHOD_KRONECKER: kronecker_engine.multiply_kronecker,
+            sds_glob.ARG_METHOD_NTT: ntt_engine.multiply_ntt,
+            sds_glob.ARG_METHOD_NUMPY: fft_engine.multiply_numpy,
+            sds_glob.ARG_METHOD_RFFT: fft_engine.multiply_rfft,
+            sds_glob.ARG_METHOD_SPARSE: sparse_engine.multiply_sparse,
+            sds_glob.ARG_METHOD_TOOM3: dac_engine.multiply_toom3,
+        }
+
+        return engines.get(method, dac_engine.multiply_simple)(
+            self._poly_1_coeff, self._poly_2_coeff
+        )
 
-        while degree < size_total:
-            degree = degree * 2
+    # ------------------------------------------------------------------
+    # Multiply the polynomials by applying the fastest method.
+    # ------------------------------------------------------------------
+    def _multiply_auto(self) -> ndarray:
+        """Multiply the polynomials by applying the fastest method.
 
-        for _ in range(degree - len(polynomial_a)):
-            polynomial_a.append(0)
-        for _ in range(degree - len(polynomial_b)):
-            polynomial_b.append(0)
+        Sparse polynomials are multiplied with the method 'sparse', see
+        'sparse_engine.is_sparse'. Otherwise the fastest method of the crossover
+        table, which guarantees an exact result for the current task,
+        is applied. The float64 based methods 'fft' and 'numpy' only
+        qualify if their rounded result is guaranteed to be exact.
 
-        polynomial_a_fft = self._fft_recursive(polynomial_a)
-        polynomial_b_fft = self._fft_recursive(polynomial_b)
+        Returns:
+            ndarray: The product of the polynomials.
+        """
+        if sparse_engine.is_sparse(self._poly_1_coeff, self._poly_2_coeff):
+            sds_glob.logger.debug(
+                "task no. %d method %s", self._task_no + 1, sds_glob.ARG_METHOD_SPARSE
+            )
 
-        polynomial_c = []
+            return sparse_engine.multiply_sparse(self._poly_1_coeff, self._poly_2_coeff)
 
-        for i in range(degree):
-            polynomial_c.append(polynomial_a_fft[i] * polynomial_b_fft[i])
+        is_float_exact = fft_engine.is_exact(self._poly_1_coeff, self._poly_2_coeff)
 
-        polynomial_d = self._fft_complex_conjugate(polynomial_c)
+        for method in tuning_table.get_ranking(self._poly_1_coeff, self._poly_2_coeff):
+            if method in (sds_glob.ARG_METHOD_FFT, sds_glob.ARG_METHOD_NUMPY):
+                if not is_float_exact:
+                    continue
 
-        result = []
+            sds_glob.logger.debug("task no. %d method %s", self._task_no + 1, method)
 
-        for _, value in enumerate(polynomial_d):
-            result.append(round(value.real))
+            return self._multiply(method)
 
-        return result
+        return kronecker_engine.multiply_kronecker(
+            self._poly_1_coeff, self._poly_2_coeff
+        )
 
     # ------------------------------------------------------------------
-    # Recursive FFT.
+    # Perform the processing of all tasks in batches.
     # ------------------------------------------------------------------
-    def _fft_recursive(self, polynomial: list[int]):
-        """Recursive FFT.
+    def _process_batch(
+        self, tasks: list[tuple[int, dict]], duration_read: int = 0
+    ) -> None:
+        """Perform the processing of all tasks in batches.
+
+        The tasks are grouped by the size of their real FFT. The
+        operands of a group are stacked row by row into 2-D arrays and
+        multiplied with one forward and one inverse real FFT along
+        axis 1, in chunks of at most '_BATCH_ELEMENTS_MAX' elements.
+        Tasks whose rounded float64 convolution is not guaranteed to be
+        exact are processed individually with the method 'rfft'. Every
+        row is checked against the product of its task. The statistics
+        assign each task of a chunk an equal share of the durations of
+        its phases, stacking the rows counts as operand conversion.
 
         Args:
-            polynomial (list[int]): The coefficients of a polynomial.
-
-        Returns:
-            list[int]: The coefficients of a new polynomial.
+            tasks (list[tuple[int, dict]]): The numbers of the tasks and
+                the tasks from the task file.
+            duration_read (int, optional): The duration in ns of reading
+                the tasks, assigned in equal shares. Defaults to 0.
         """
-        polynomial_size = len(polynomial)  # n is a power of 2
+        statistics: dict[int, Statistic] = {}
 
-        if polynomial_size == 1:
-            return polynomial
+        # Group the tasks by the size of their real FFT, every task is
+        # loaded once and keeps its data for stacking and checking.
+        groups: dict[int, list[tuple[int, int, task_decoder.TaskData]]] = {}
+        for position, task_item in enumerate(tasks):
+            start_time_task = time.perf_counter_ns()
 
-        omega = cmath.exp((2.0 * cmath.pi * 1j) / polynomial_size)
+            task_data = task_decoder.get_task_data(*task_item)
+            self._set_task_data(task_data)
 
-        polynomial_even = polynomial[0::2]
-        polynomial_odd = polynomial[1::2]
+            duration_parse = (
+                time.perf_counter_ns() - start_time_task + duration_read // len(tasks)
+            )
 
-        polynomial_next_even = self._fft_recursive(polynomial_even)
-        polynomial_next_odd = self._fft_recursive(polynomial_odd)
+            if fft_engine.is_exact(self._poly_1_coeff, self._poly_2_coeff):
+                fft_size = (
+                    1
+                    << (
+                        len(self._poly_1_coeff) + len(self._poly_2_coeff) - 2
+                    ).bit_length()
+                )
+                groups.setdefault(fft_size, []).append(
+                    (position, duration_parse, task_data)
+                )
+                continue
 
-        polynomial_next = [0] * polynomial_size
+            durations = self._process_task(sds_glob.ARG_METHOD_RFFT)
 
-        for degree in range(polynomial_size // 2):
-            polynomial_next[degree] = (
-                polynomial_next_even[degree]
-                + omega**degree * polynomial_next_odd[degree]
-            )
-            polynomial_next[degree + polynomial_size // 2] = (
-                polynomial_next_even[degree]
-                - omega**degree * polynomial_next_odd[degree]
+            statistics[position] = (
+                self._task_no,
+                duration_parse + sum(durations),
+                self._poly_1_degree,
+                self._poly_2_degree,
+                self._prod_degree,
+                (duration_parse, *durations),
             )
 
-        return polynomial_next
+        for fft_size, group in sorted(groups.items()):
+            no_rows = max(1, Multiplier._BATCH_ELEMENTS_MAX // fft_size)
+
+            for start in range(0, len(group), no_rows):
+                statistics.update(
+                    self._process_batch_chunk(fft_size, group[start:][:no_rows])
+                )
+
+        self._statistics.extend(statistics[position] for position in range(len(tasks)))
 
     # ------------------------------------------------------------------
-    # Multiply the polynomials by applying the Fast Fourier transform.
+    # Perform the processing of a chunk of tasks of the same FFT size.
     # ------------------------------------------------------------------
-    def _multiply_fft(self) -> ndarray:
-        """Multiply the polynomials by applying Fast Fourier transform.
+    def _process_batch_chunk(
+        self, fft_size: int, chunk: list[tuple[int, int, task_decoder.TaskData]]
+    ) -> dict[int, Statistic]:
+        """Perform the processing of a chunk of tasks of the same FFT size.
+
+        Args:
+            fft_size (int): The size of the real FFT of the tasks.
+            chunk (list[tuple[int, int, task_decoder.TaskData]]): The
+                positions of the tasks, the durations in ns of their
+                phase 'parse' and their data.
 
         Returns:
-            ndarray: The product of the polynomials.
+            dict[int, Statistic]: The statistics of the tasks per
+                position.
         """
-        return self._delete_leading_zero_terms(
-            self._fft_multiply_polynomials(self._poly_1_coeff, self._poly_2_coeff)
+        start_time_chunk = time.perf_counter_ns()
+
+        poly_1 = numpy.zeros((len(chunk), fft_size))
+        poly_2 = numpy.zeros((len(chunk), fft_size))
+        for row, (_, _, task_data) in enumerate(chunk):
+            poly_1[row][: len(task_data[1])] = task_data[1]
+            poly_2[row][: len(task_data[3])] = task_data[3]
+
+        time_converted = time.perf_counter_ns()
+
+        products = numpy.rint(
+            numpy.fft.irfft(
+                numpy.fft.rfft(poly_1, axis=1) * numpy.fft.rfft(poly_2, axis=1),
+                fft_size,
+                axis=1,
+            )
+        ).astype(numpy.int64)
+
+        time_multiplied = time.perf_counter_ns()
+
+        # Check every row against the product of its task.
+        for row, (_, _, task_data) in enumerate(chunk):
+            self._set_task_data(task_data)
+            self._check_product(
+                utils.delete_leading_zero_terms(
+                    products[row][: len(task_data[1]) + len(task_data[3]) - 1]
+                )
+            )
+
+        durations = (
+            (time_converted - start_time_chunk) // len(chunk),
+            (time_multiplied - time_converted) // len(chunk),
+            (time.perf_counter_ns() - time_multiplied) // len(chunk),
         )
 
+        return {
+            position: (
+                task_data[0],
+                duration_parse + sum(durations),
+                task_data[2],
+                task_data[4],
+                task_data[6],
+                (duration_parse, *durations),
+            )
+            for position, duration_parse, task_data in chunk
+        }
+
     # ------------------------------------------------------------------
-    # Multiply the polynomials by applying the NumPy polynomial methods.
+    # Perform the processing of a chunk of tasks in a worker process.
     # ------------------------------------------------------------------
-    def _multiply_numpy(self) -> ndarray:
-        """Multiply the polynomials by applying the NumPy polynomial methods.
+    @staticmethod
+    def _process_chunk(
+        method: str, verify: str, tasks: Iterable[tuple[int, dict]]
+    ) -> tuple[list[Statistic], list[tuple[int, str]]]:
+        """Perform the processing of a chunk of tasks in a worker process.
+
+        Args:
+            method (str): The processing method.
+            verify (str): The verification mode.
+            tasks (Iterable[tuple[int, dict]]): The numbers of the tasks
+                and the tasks of the chunk.
 
         Returns:
-            ndarray: The product of the polynomials.
+            tuple[list[Statistic], list[tuple[int, str]]]:
+                The statistics of the tasks and the differences found.
         """
-        return numpy.polynomial.Polynomial(
-            self._poly_1_coeff
-        ) * numpy.polynomial.Polynomial(self._poly_2_coeff)
+        return Multiplier.__new__(Multiplier).process_chunk(method, verify, tasks)
 
     # ------------------------------------------------------------------
-    # Multiply the polynomials by applying the simple method.
+    # Take over the result of a chunk of tasks.
     # ------------------------------------------------------------------
-    def _multiply_simple(
+    def _process_chunk_result(
         self,
-    ) -> ndarray:
-        """Multiply the polynomials by applying the simple method.
+        result: tuple[list[Statistic], list[tuple[int, str]]],
+    ) -> None:
+        """Take over the result of a chunk of tasks.
 
-        Returns:
-            ndarray: The product of the polynomials.
+        Args:
+            result (tuple[list[Statistic], list[tuple[int, str]]]):
+                The statistics of the tasks and the differences found.
         """
-        result = numpy.zeros(
-            len(self._poly_1_coeff) + len(self._poly_2_coeff), dtype=numpy.int64
-        )
+        statistics, differences = result
+
+        self._statistics.extend(statistics)
+        self._differences.extend(differences)
+
+    # ------------------------------------------------------------------
+    # Perform the processing of all tasks with a process pool.
+    # ------------------------------------------------------------------
+    def _process_parallel(self, function, jobs: Iterable[tuple]) -> None:
+        """Perform the processing of all tasks with a process pool.
+
+        A job is either a chunk of tasks of about 'CHUNK_ELEMENTS'
+        coefficients or a shard file, see 'worker_pool.map_ordered'.
+        The results are consumed in task order, so that the statistics
+        keep the task order and a difference (ERROR.00.911) is reported
+        for the first faulty task.
+
+        Args:
+            function: The function processing a job in a worker
+                process, called with the method, the verification mode
+                and the arguments of the job.
+            jobs (Iterable[tuple]): The arguments of the jobs.
+        """
+        for result in worker_pool.map_ordered(
+            function,
+            ((self._method, self._verify, *job) for job in jobs),
+            self._workers,
+        ):
+            self._process_chunk_result(result)
+
+    # ------------------------------------------------------------------
+    # Process the selected tasks, in chunks over a process pool with
+    # more than one worker.
+    # ------------------------------------------------------------------
+    def _process_selected_tasks(
+        self, selected_tasks: Iterable[tuple[int, dict]]
+    ) -> None:
+        """Process the selected tasks.
+
+        Args:
+            selected_tasks (Iterable[tuple[int, dict]]): The task numbers and
+                the tasks.
+        """
+        if self._workers > 1:
+            self._process_parallel(
+                Multiplier._process_chunk,
+                (
+                    (chunk,)
+                    for chunk in task_decoder.split_tasks(
+                        selected_tasks, worker_pool.CHUNK_ELEMENTS
+                    )
+                ),
+            )
+        else:
+            self._process_tasks(selected_tasks)
+
+    # ------------------------------------------------------------------
+    # Perform the processing of a shard file in a worker process.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _process_shard(
+        method: str, verify: str, file_name: str, file_format: str, task_no_first: int
+    ) -> tuple[list[Statistic], list[tuple[int, str]]]:
+        """Perform the processing of a shard file in a worker process.
 
-        # Multiply abd collect the like terms
-        for degree_1, coeff_1 in enumerate(self._poly_1_coeff):
-            if coeff_1 != 0:
-                for degree_2, coeff_2 in enumerate(self._poly_2_coeff):
-                    if coeff_2 != 0:
-                        result[degree_1 + degree_2] += coeff_1 * coeff_2
+        Args:
+            method (str): The processing method.
+            verify (str): The verification mode.
+            file_name (str): The name of the shard file.
+            file_format (str): The format of the shard file.
+            task_no_first (int): The number of the first task of the
+                shard file, starting with zero.
 
-        return self._delete_leading_zero_terms(result)
+        Returns:
+            tuple[list[Statistic], list[tuple[int, str]]]:
+                The statistics of the tasks and the differences found.
+        """
+        return Multiplier._process_chunk(
+            method,
+            verify,
+            enumerate(task_reader.read_tasks(file_name, file_format), task_no_first),
+        )
 
     # ------------------------------------------------------------------
     # Perform the processing of a polynomial multiplication task.
     # ------------------------------------------------------------------
-    def _process_task(self):
-        """Perform the processing of a polynomial multiplication task."""
-        result = []
+    def _process_task(self, method: str) -> tuple[int, int, int]:
+        """Perform the processing of a polynomial multiplication task.
+
+        Args:
+            method (str): The processing method.
 
-        if self._method == sds_glob.ARG_METHOD_FFT:
-            self._multiply_fft()
-        elif self._method == sds_glob.ARG_METHOD_NUMPY:
-            self._multiply_numpy()
+        Returns:
+            tuple[int, int, int]: The durations in ns of the operand
+                conversion, the multiplication and the verification.
+        """
+        start_time = time.perf_counter_ns()
+
+        self._convert_operands()
+
+        time_converted = time.perf_counter_ns()
+
+        if self._verify == sds_glob.ARG_VERIFY_PROBABILISTIC:
+            time_multiplied = time_converted
+            self._check_product_probabilistic()
         else:
-            result = self._multiply_simple()
-
-        # Compare the new calculated product with the given product
-        # in the JSON file.
-        for degree, coeff in enumerate(result):
-            if coeff != self._prod_coeff[degree]:
-                # ERROR.00.911 Difference in task no. {task_no} degree {degree}
-                # got {got} instead of {instead}
-                utils.terminate_fatal(
-                    sds_glob.ERROR_00_911.replace("{task_no}", str(self._task_no + 1))
-                    .replace("{degree}", str(degree))
-                    .replace("{got}", str(coeff))
-                    .replace(
-                        "{instead}",
-                        str(self._prod_coeff[degree]),
+            result = self._multiply(method)
+            time_multiplied = time.perf_counter_ns()
+            self._check_product(result)
+
+        return (
+            time_converted - start_time,
+            time_multiplied - time_converted,
+            time.perf_counter_ns() - time_multiplied,
+        )
+
+    # ------------------------------------------------------------------
+    # Process the selected tasks of a task file or manifest of shard
+    # files.
+    # ------------------------------------------------------------------
+    def _process_task_file(self, task_file: task_reader.TaskFile) -> None:
+        """Process the selected tasks of a task file or manifest.
+
+        Without a selection, every worker process streams its own shard
+        files of a manifest.
+
+        Args:
+            task_file (task_reader.TaskFile): The task file with its format
+                and the selection of its tasks.
+        """
+        file_format = task_file.file_format
+        task_nos = (
+            task_reader.parse_task_selection(task_file.tasks)
+            if task_file.tasks
+            else None
+        )
+
+        if not task_reader.is_manifest(task_file.file_name):
+            if task_nos:
+                self._process_selected_tasks(
+                    task_reader.read_selected_tasks(
+                        task_file.file_name, file_format, task_nos
                     )
                 )
+            else:
+                self._process_selected_tasks(
+                    enumerate(task_reader.read_tasks(task_file.file_name, file_format))
+                )
+            return
+
+        file_format, shards = task_reader.read_manifest(task_file.file_name)
+
+        if self._workers > 1 and task_nos is None:
+            # Every worker process streams its own shard files.
+            self._process_parallel(
+                Multiplier._process_shard,
+                (
+                    (shard_file_name, file_format, task_no_first)
+                    for shard_file_name, task_no_first, _ in shards
+                ),
+            )
+        else:
+            self._process_selected_tasks(
+                task_reader.read_shard_tasks(shards, file_format, task_nos)
+            )
+
+    # ------------------------------------------------------------------
+    # Perform the processing of a sequence of tasks.
+    # ------------------------------------------------------------------
+    def _process_tasks(self, tasks: Iterable[tuple[int, dict]]) -> None:
+        """Perform the processing of a sequence of tasks.
+
+        The method 'batch' processes the tasks in blocks of about
+        '_BATCH_ELEMENTS_MAX' coefficients. The phase 'parse' of a task
+        comprises reading it from the task file or queue and decoding
+        its coefficients.
+
+        Args:
+            tasks (Iterable[tuple[int, dict]]): The numbers of the tasks
+                and the tasks to process.
+        """
+        if (
+            self._method == sds_glob.ARG_METHOD_BATCH
+            and self._verify != sds_glob.ARG_VERIFY_PROBABILISTIC
+        ):
+            blocks = task_decoder.split_tasks(tasks, Multiplier._BATCH_ELEMENTS_MAX)
+            while True:
+                start_time_block = time.perf_counter_ns()
+                block = next(blocks, None)
+                if block is None:
+                    return
+                self._process_batch(block, time.perf_counter_ns() - start_time_block)
+
+        tasks_iterator = iter(tasks)
+
+        while True:
+            # Start the task-related time measurement.
+            start_time_task = time.perf_counter_ns()
+
+            task_item = next(tasks_iterator, None)
+            if task_item is None:
+                return
+
+            # Store the data from the JSON file for polynomial
+            # multiplication in instance variables.
+            self._load_task(*task_item)
+
+            duration_parse = time.perf_counter_ns() - start_time_task
+
+            # Calculate and check the polynomial product.
+            durations = self._process_task(self._method)
+
+            # Stop the timing and save the measurement results.
+            self._statistics.append(
+                (
+                    self._task_no,
+                    time.perf_counter_ns() - start_time_task,
+                    self._poly_1_degree,
+                    self._poly_2_degree,
+                    self._prod_degree,
+                    (duration_parse, *durations),
+                )
+            )
+
+    # ------------------------------------------------------------------
+    # Report the differences found for the current task.
+    # ------------------------------------------------------------------
+    def _report_differences(self, differences: list[str]) -> None:
+        """Report the differences found for the current task.
+
+        With the verification mode 'first' the processing terminates at
+        the first difference, otherwise the differences are collected
+        and reported at the end of the run.
+
+        Args:
+            differences (list[str]): The error messages of the differences.
+        """
+        if not differences:
+            return
+
+        if self._verify == sds_glob.ARG_VERIFY_FIRST:
+            utils.terminate_fatal(differences[0])
+
+        self._differences.extend(
+            (self._task_no, difference) for difference in differences
+        )
+
+    # ------------------------------------------------------------------
+    # Store the data of a task in the instance variables.
+    # ------------------------------------------------------------------
+    def _set_task_data(self, task_data: task_decoder.TaskData) -> None:
+        """Store the data of a task in the instance variables.
+
+        Args:
+            task_data (task_decoder.TaskData): The task number and the
+                coefficients and the degree of both polynomials and of
+                the product.
+        """
+        (
+            self._task_no,
+            self._poly_1_coeff,
+            self._poly_1_degree,
+            self._poly_2_coeff,
+            self._poly_2_degree,
+            self._prod_coeff,
+            self._prod_degree,
+        ) = task_data
 
     # ------------------------------------------------------------------
     # Display the statistics.
     # ------------------------------------------------------------------
-    def _show_statistics(self):
-        """Display the statistics."""
-        for task_no, (
-            duration,
+    def _show_statistics(self, duration: int) -> None:
+        """Display the statistics.
+
+        After the duration of every task follow the total duration of
+        every phase over all tasks with the percentiles of its duration
+        per task: 'parse' reads and decodes the task, 'convert' converts
+        the coefficients into arrays, 'multiply' calculates the product
+        and 'verify' checks it. The throughput of the run is derived
+        from its duration: tasks and operand coefficients per second
+        and the effective GFLOP/s, which count the 2 * (degree_1 + 1) *
+        (degree_2 + 1) operations of the schoolbook method for every
+        method.
+
+        Args:
+            duration (int): The duration in ns of processing all tasks.
+        """
+        for (
+            task_no,
+            duration_task,
             poly_1_degree,
             poly_2_degree,
             prod_degree,
-        ) in enumerate(self._statistics):
+            _,
+        ) in self._statistics:
             utils.progress_msg_time_elapsed(
-                duration,
+                duration_task,
                 f"task no. {task_no + 1:2d} (degrees: {poly_1_degree:5d} - "
                 + f"{poly_2_degree:5d} - {prod_degree:5d}) executed",
             )
+
+        if not self._statistics:
+            return
+
+        utils.progress_msg("-" * 79)
+
+        # The percentiles by the nearest rank are durations of tasks.
+        durations = numpy.sort(
+            numpy.array(
+                [(statistic[1], *statistic[5]) for statistic in self._statistics],
+                dtype=numpy.int64,
+            ),
+            axis=0,
+        )
+        ranks = [
+            max(0, -(-percentile * len(durations) // 100) - 1)
+            for percentile in Multiplier._PERCENTILES
+        ]
+
+        for phase, durations_phase in zip(
+            ("task", *Multiplier._PHASES), durations.T, strict=True
+        ):
+            utils.progress_msg_time_elapsed(
+                int(durations_phase.sum()),
+                f"phase {phase:8s} ("
+                + " - ".join(
+                    f"p{percentile}: {durations_phase[rank]:,} ns"
+                    for percentile, rank in zip(
+                        Multiplier._PERCENTILES, ranks, strict=True
+                    )
+                )
+                + f" - max: {durations_phase[-1]:,} ns)",
+            )
+
+        degrees = numpy.array(
+            [statistic[2:4] for statistic in self._statistics], dtype=numpy.float64
+        )
+        seconds = max(duration, 1) / 1e9
+
+        utils.progress_msg(
+            f"throughput: {len(self._statistics) / seconds:,.1f} tasks/s - "
+            + f"{(degrees + 1).sum() / seconds:,.0f} coefficients/s - "
+            + f"{2 * (degrees + 1).prod(axis=1).sum() / seconds / 1e9:,.3f} "
+            + "GFLOP/s effective"
+        )
+
+    # ------------------------------------------------------------------
+    # Time a method for the polynomial pair.
+    # ------------------------------------------------------------------
+    def _time_method(self, method: str, warmups: int, repetitions: int) -> list[int]:
+        """Time a method for the polynomial pair.
+
+        Args:
+            method (str): The method to be timed.
+            warmups (int): The number of untimed runs.
+            repetitions (int): The number of timed runs.
+
+        Returns:
+            list[int]: The durations in ns of the timed runs.
+        """
+        durations = []
+
+        for run in range(warmups + repetitions):
+            start_time = time.perf_counter_ns()
+            self._multiply(method)
+            duration = time.perf_counter_ns() - start_time
+
+            if run >= warmups:
+                durations.append(duration)
+
+        return durations
+
+    # ------------------------------------------------------------------
+    # Perform the processing of a chunk of tasks in a worker process.
+    # ------------------------------------------------------------------
+    def process_chunk(
+        self, method: str, verify: str, tasks: Iterable[tuple[int, dict]]
+    ) -> tuple[list[Statistic], list[tuple[int, str]]]:
+        """Perform the processing of a chunk of tasks in a worker process.
+
+        The entry point of a worker process into an instance, which is
+        created without processing a task file and gets only the
+        task-related instance variables.
+
+        Args:
+            method (str): The processing method.
+            verify (str): The verification mode.
+            tasks (Iterable[tuple[int, dict]]): The numbers of the tasks
+                and the tasks of the chunk.
+
+        Returns:
+            tuple[list[Statistic], list[tuple[int, str]]]:
+                The statistics of the tasks and the differences found.
+        """
+        self._init_task_data(method, verify)
+        self._process_tasks(tasks)
+
+        return self._statistics, self._differences
+
+    # ------------------------------------------------------------------
+    # Time the methods for a polynomial pair.
+    # ------------------------------------------------------------------
+    @classmethod
+    def time_methods(
+        cls,
+        methods: Iterable[str],
+        poly_1: ndarray,
+        poly_2: ndarray,
+        warmups: int,
+        repetitions: int,
+    ) -> dict[str, list[int]]:
+        """Time the methods for a polynomial pair.
+
+        The shared timing of the actions 'benchmark' and 'calibrate',
+        on an instance which is created without processing a task file
+        and gets only the task-related instance variables. The operands
+        are int32 arrays if every product coefficient fits into int32,
+        otherwise int64 arrays, as the tasks of a binary task file. The
+        float64 based methods are skipped where their result is not
+        guaranteed to be exact. Every method runs 'warmups' times untimed and then
+        'repetitions' times timed with 'time.perf_counter_ns', with the
+        garbage collection disabled.
+
+        Args:
+            methods (Iterable[str]): The methods to be timed.
+            poly_1 (ndarray): The coefficients of the first polynomial.
+            poly_2 (ndarray): The coefficients of the second polynomial.
+            warmups (int): The number of untimed runs per method.
+            repetitions (int): The number of timed runs per method.
+
+        Returns:
+            dict[str, list[int]]: The durations in ns of the timed runs
+                per timed method.
+        """
+        coef_bound = (
+            min(len(poly_1), len(poly_2))
+            * utils.get_abs_max(poly_1)
+            * utils.get_abs_max(poly_2)
+        )
+        dtype = numpy.int32 if coef_bound < 2**31 else numpy.int64
+
+        instance = cls.__new__(cls)
+        instance._init_task_data(sds_glob.ARG_METHOD_AUTO, sds_glob.ARG_VERIFY_FIRST)
+        instance._poly_1_coeff = numpy.asarray(poly_1, dtype=dtype)
+        instance._poly_2_coeff = numpy.asarray(poly_2, dtype=dtype)
+        is_float_exact = fft_engine.is_exact(
+            instance._poly_1_coeff, instance._poly_2_coeff
+        )
+
+        durations: dict[str, list[int]] = {}
+
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+
+        try:
+            for method in methods:
+                if not is_float_exact and method in (
+                    sds_glob.ARG_METHOD_FFT,
+                    sds_glob.ARG_METHOD_NUMPY,
+                ):
+                    continue
+
+                durations[method] = instance._time_method(method, warmups, repetitions)
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+
+        return durations
@@ -0,0 +1,265 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Exact multiplication of polynomials by number-theoretic transforms."""
+from __future__ import annotations
+
+import kronecker_engine  # type: ignore
+import numpy
+import utils  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# NTT-friendly primes p = c * 2**k + 1 with k >= 25 and their
+# primitive roots, and the largest supported transform size.
+_PRIMES = ((2013265921, 31), (469762049, 3), (167772161, 3))
+_SIZE_MAX = 2**25
+
+# Bit-reversal permutation, twiddle factors and inverse twiddle factors
+# per NTT prime and size.
+_tables: dict[tuple[int, int], tuple[ndarray, ndarray, ndarray]] = {}
+
+
+# ------------------------------------------------------------------
+# Convolve two polynomials modulo a prime.
+# ------------------------------------------------------------------
+def _convolve(
+    poly_1: ndarray, poly_2: ndarray, prime: int, root: int, size: int
+) -> ndarray:
+    """Convolve two polynomials modulo a prime.
+
+    Args:
+        poly_1 (ndarray): The coefficients of the first polynomial.
+        poly_2 (ndarray): The coefficients of the second polynomial.
+        prime (int): The NTT prime.
+        root (int): A primitive root modulo the prime.
+        size (int): The number of coefficients of the product.
+
+    Returns:
+        ndarray: The coefficients of the product modulo the prime.
+    """
+    ntt_size = 1 << (size - 1).bit_length()
+
+    bit_reversal, twiddles, twiddles_inverse = _get_tables(prime, root, ntt_size)
+
+    values_1 = numpy.zeros(ntt_size, dtype=numpy.int64)
+    values_1[: len(poly_1)] = poly_1 % prime
+    values_2 = numpy.zeros(ntt_size, dtype=numpy.int64)
+    values_2[: len(poly_2)] = poly_2 % prime
+
+    values = (
+        _transform(values_1, prime, twiddles, bit_reversal)
+        * _transform(values_2, prime, twiddles, bit_reversal)
+        % prime
+    )
+    values = _transform(values, prime, twiddles_inverse, bit_reversal)
+
+    return values[:size] * pow(ntt_size, prime - 2, prime) % prime
+
+
+# ------------------------------------------------------------------
+# Reconstruct the signed coefficients from their residues.
+# ------------------------------------------------------------------
+def _crt(residues: list[ndarray], primes: list[int]) -> ndarray:
+    """Reconstruct the signed coefficients from their residues.
+
+    Garner's algorithm computes the mixed-radix digits of the
+    coefficients in int64. The coefficients are then assembled in int64
+    if the product of the primes allows it, otherwise with Python
+    integers, and mapped into the symmetric range.
+
+    Args:
+        residues (list[ndarray]): The residues per prime.
+        primes (list[int]): The primes.
+
+    Returns:
+        ndarray: The coefficients.
+    """
+    digits: list[ndarray] = []
+
+    for no_prime, prime in enumerate(primes):
+        digit = residues[no_prime]
+        for no_digit, digit_prev in enumerate(digits):
+            digit = (
+                (digit - digit_prev)
+                % prime
+                * pow(primes[no_digit], prime - 2, prime)
+                % prime
+            )
+        digits.append(digit)
+
+    modulus = 1
+    for prime in primes:
+        modulus *= prime
+
+    dtype = numpy.int64 if modulus < 2**62 else object
+
+    result = digits[-1].astype(dtype)
+    for prime, digit in zip(reversed(primes[:-1]), reversed(digits[:-1])):
+        result = result * prime + digit.astype(dtype)
+
+    return numpy.where(result > modulus // 2, result - modulus, result)
+
+
+# ------------------------------------------------------------------
+# Provide the bit-reversal permutation and the twiddle factors
+# of an NTT prime and size.
+# ------------------------------------------------------------------
+def _get_tables(prime: int, root: int, size: int) -> tuple[ndarray, ndarray, ndarray]:
+    """Provide the bit-reversal permutation and the twiddle factors.
+
+    The tables are computed once per prime and size and kept in a
+    module-level cache.
+
+    Args:
+        prime (int): The NTT prime.
+        root (int): A primitive root modulo the prime.
+        size (int): The transform size, a power of 2.
+
+    Returns:
+        tuple[ndarray, ndarray, ndarray]:
+            The bit-reversal permutation, the twiddle factors and the
+            inverse twiddle factors.
+    """
+    tables = _tables.get((prime, size))
+
+    if tables is None:
+        no_bits = size.bit_length() - 1
+        index = numpy.arange(size, dtype=numpy.int64)
+        bit_reversal = numpy.zeros(size, dtype=numpy.int64)
+        for bit in range(no_bits):
+            bit_reversal |= ((index >> bit) & 1) << (no_bits - 1 - bit)
+
+        omega = pow(root, (prime - 1) // size, prime)
+
+        twiddle_tables = []
+        for base in (omega, pow(omega, prime - 2, prime)):
+            twiddles = numpy.ones(1, dtype=numpy.int64)
+            while len(twiddles) < size // 2:
+                twiddles = numpy.concatenate(
+                    (
+                        twiddles,
+                        twiddles * pow(base, len(twiddles), prime) % prime,
+                    )
+                )
+            twiddle_tables.append(twiddles)
+
+        tables = (bit_reversal, twiddle_tables[0], twiddle_tables[1])
+        _tables[(prime, size)] = tables
+
+    return tables
+
+
+# ------------------------------------------------------------------
+# Select the NTT primes for a bound of the product coefficients.
+# ------------------------------------------------------------------
+def _select_primes(coef_bound: int) -> list[tuple[int, int]]:
+    """Select the NTT primes for a bound of the product coefficients.
+
+    Args:
+        coef_bound (int): The bound of the magnitude of the product
+            coefficients.
+
+    Returns:
+        list[tuple[int, int]]: The first primes of '_PRIMES' with their
+            roots whose product exceeds twice the bound, or no primes if
+            all of them together are too small.
+    """
+    primes = []
+    modulus = 1
+    for prime, root in _PRIMES:
+        primes.append((prime, root))
+        modulus *= prime
+        if modulus > 2 * coef_bound:
+            return primes
+
+    return []
+
+
+# ------------------------------------------------------------------
+# Iterative number-theoretic transform.
+# ------------------------------------------------------------------
+def _transform(
+    values: ndarray, prime: int, twiddles: ndarray, bit_reversal: ndarray
+) -> ndarray:
+    """Iterative number-theoretic transform.
+
+    Radix-2 transform: all butterflies of a stage are computed with one
+    vectorized operation. All intermediate values are below
+    prime**2 < 2**62.
+
+    Args:
+        values (ndarray): The values modulo the prime.
+        prime (int): The NTT prime.
+        twiddles (ndarray): The twiddle factors of the transform size.
+        bit_reversal (ndarray): The bit-reversal permutation.
+
+    Returns:
+        ndarray: The transformed values.
+    """
+    size = len(values)
+
+    values = values[bit_reversal]
+
+    length = 2
+    while length <= size:
+        half = length // 2
+        blocks = values.reshape(-1, length)
+        even = blocks[:, :half]
+        odd = blocks[:, half:] * twiddles[:: size // length] % prime
+        values = numpy.hstack(((even + odd) % prime, (even - odd) % prime))
+        length = length * 2
+
+    return values.reshape(size)
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials by applying the number-theoretic transform.
+# ------------------------------------------------------------------
+def multiply_ntt(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials by applying the number-theoretic
+    transform.
+
+    The cyclic convolution is computed with vectorized NTTs modulo as
+    many primes of '_PRIMES' as the product of the primes must exceed
+    twice the bound of the product coefficients. The signed
+    coefficients are then reconstructed exactly with the Chinese
+    Remainder Theorem. Products beyond the capacity of the primes are
+    delegated to the Kronecker substitution.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The product of the polynomials.
+    """
+    size_1 = len(coefficients_1)
+    size_2 = len(coefficients_2)
+    size = size_1 + size_2 - 1
+    ntt_size = 1 << (size - 1).bit_length()
+
+    coef_max_1 = utils.get_abs_max(coefficients_1)
+    coef_max_2 = utils.get_abs_max(coefficients_2)
+    coef_bound = min(size_1, size_2) * coef_max_1 * coef_max_2
+
+    primes = _select_primes(coef_bound)
+
+    if not primes or ntt_size > _SIZE_MAX:
+        return kronecker_engine.multiply_kronecker(coefficients_1, coefficients_2)
+
+    dtype = numpy.int64 if max(coef_max_1, coef_max_2) < 2**63 else object
+
+    poly_1 = numpy.array(coefficients_1, dtype=dtype)
+    poly_2 = numpy.array(coefficients_2, dtype=dtype)
+
+    residues = [_convolve(poly_1, poly_2, prime, root, size) for prime, root in primes]
+
+    return utils.delete_leading_zero_terms(
+        _crt(residues, [prime for prime, _ in primes])
+    )
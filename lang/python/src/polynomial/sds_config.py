@@ -7,10 +7,20 @@ from __future__ import annotations
 
 import configparser
 import os
+from typing import Any
+from typing import Callable
 
 import sds_glob
 import utils
 
+# Definition of a configuration parameter of the parameter table: the
+# default value, the conversion of a given value, the validity check,
+# the error message and its placeholders with the names of the
+# parameters whose values replace them.
+ConfigParam = tuple[
+    Any, Callable[[Any], Any], Callable[[Any], bool], str, dict[str, str]
+]
+
 
 # pylint: disable=too-few-public-methods
 class Config:
@@ -61,6 +71,11 @@ class Config:
         self._is_verbose = True
         self._no_tasks = 10
 
+        # The parameters of the parameter table, see '_get_param_table'.
+        self._params: dict[str, Any] = {
+            name: param[0] for name, param in Config._get_param_table().items()
+        }
+
         # ------------------------------------------------------------------
         # Update optionally the configuration parameters from a
         # configuration file.
@@ -118,6 +133,26 @@ class Config:
                 )
             )
 
+        for name in self._params:
+            self._check_config_param(name)
+
+    # ------------------------------------------------------------------
+    # Check a configuration parameter of the parameter table.
+    # ------------------------------------------------------------------
+    def _check_config_param(self, name: str) -> None:
+        """Check a configuration parameter of the parameter table.
+
+        Args:
+            name (str):
+                The name of the configuration parameter.
+        """
+        _, _, is_valid, error, placeholders = Config._get_param_table()[name]
+
+        if not is_valid(self._params[name]):
+            for placeholder, param_name in placeholders.items():
+                error = error.replace(placeholder, str(self._params[param_name]))
+            utils.terminate_fatal(error)
+
     # ------------------------------------------------------------------
     # Check a boolean configuration parameter value.
     # ------------------------------------------------------------------
@@ -148,6 +183,33 @@ class Config:
 
         return True
 
+    # ------------------------------------------------------------------
+    # Check a float configuration parameter value.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_config_value_float(
+        value: float | int | str,
+    ) -> float:
+        """Check a float configuration parameter value.
+
+        Args:
+            value (float|int|str):
+                The configuration parameter value to be checked.
+
+        Returns:
+            float:
+                The float configuration parameter value.
+        """
+        if isinstance(value, str):
+            try:
+                return float(value)
+            except ValueError:
+                # ERROR.00.926 Illegal configuration parameter value '{value}' -
+                # only numbers are allowed
+                utils.terminate_fatal(sds_glob.ERROR_00_926.replace("{value}", value))
+
+        return float(value)
+
     # ------------------------------------------------------------------
     # Check an integer configuration parameter value.
     # ------------------------------------------------------------------
@@ -175,16 +237,85 @@ class Config:
 
         return value
 
+    # ------------------------------------------------------------------
+    # Check an integer list configuration parameter value.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_config_value_int_list(
+        value: list[int] | str,
+    ) -> list[int]:
+        """Check an integer list configuration parameter value.
+
+        Args:
+            value (list[int]|str):
+                The configuration parameter value to be checked, e.g.
+                '16,256,4096'.
+
+        Returns:
+            list[int]:
+                The integer list configuration parameter value.
+        """
+        if isinstance(value, str):
+            try:
+                return [int(part) for part in value.split(",")]
+            except ValueError:
+                # ERROR.00.928 Illegal configuration parameter value '{value}' -
+                # only comma-separated integers are allowed
+                utils.terminate_fatal(sds_glob.ERROR_00_928.replace("{value}", value))
+
+        return list(value)
+
+    # ------------------------------------------------------------------
+    # Check a tolerance mapping configuration parameter value.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _check_config_value_tolerances(
+        value: dict[str, float] | str,
+    ) -> dict[str, float]:
+        """Check a tolerance mapping configuration parameter value.
+
+        Args:
+            value (dict[str, float]|str):
+                The configuration parameter value to be checked, e.g.
+                'fft=0.5,simple:4096=1.0'.
+
+        Returns:
+            dict[str, float]:
+                The tolerance per method or per method and degree, with
+                the keys 'method' or 'method:degree'.
+        """
+        if not isinstance(value, str):
+            return dict(value)
+
+        tolerances = {}
+
+        for entry in filter(None, (part.strip() for part in value.split(","))):
+            key, _, tolerance = entry.partition("=")
+            method, _, degree = key.strip().lower().partition(":")
+            try:
+                if degree:
+                    method = f"{method}:{int(degree)}"
+                tolerances[method] = float(tolerance)
+            except ValueError:
+                # ERROR.00.932 Illegal configuration parameter value '{value}' -
+                # only comma-separated 'method=tolerance' or
+                # 'method:degree=tolerance' are allowed
+                utils.terminate_fatal(sds_glob.ERROR_00_932.replace("{value}", value))
+
+        return tolerances
+
     # ------------------------------------------------------------------
     # Check a single configuration parameter.
     # ------------------------------------------------------------------
-    def _check_single_config_param(self, key: str, value: bool | int | str) -> None:
+    def _check_single_config_param(
+        self, key: str, value: bool | dict[str, float] | float | int | list[int] | str
+    ) -> None:
         """Check a single configuration parameter.
 
         Args:
             key (str):
                 The name of the configuration parameter.
-            value (bool | int | str):
+            value (bool | dict[str, float] | float | int | list[int] | str):
                 The given value of the configuration parameter.
         """
         key_int = key.lower()
@@ -208,10 +339,184 @@ class Config:
             self._is_verbose = self._check_config_value_bool(value)
             return
 
-        # ERROR.00.903 Unknown configuration parameter: Key='{key}' Value='{value}
-        utils.terminate_fatal(
-            sds_glob.ERROR_00_903.replace("{key}", key).replace("{value}", str(value))
-        )
+        self._check_table_config_param(key, value)
+
+    # ------------------------------------------------------------------
+    # Check a single configuration parameter of the parameter table.
+    # ------------------------------------------------------------------
+    def _check_table_config_param(
+        self, key: str, value: bool | dict[str, float] | float | int | list[int] | str
+    ) -> None:
+        """Check a single configuration parameter of the parameter table.
+
+        Args:
+            key (str):
+                The name of the configuration parameter.
+            value (bool | dict[str, float] | float | int | list[int] | str):
+                The given value of the configuration parameter.
+        """
+        key_int = key.lower()
+
+        if key_int not in self._params:
+            # ERROR.00.903 Unknown configuration parameter: Key='{key}' Value='{value}
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_903.replace("{key}", key).replace(
+                    "{value}", str(value)
+                )
+            )
+
+        self._params[key_int] = Config._get_param_table()[key_int][1](value)
+
+    # ------------------------------------------------------------------
+    # Get the table of the configuration parameters.
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _get_param_table() -> dict[str, ConfigParam]:
+        """Get the table of the configuration parameters.
+
+        The parameters of the table are stored in '_params' and are
+        converted and checked generically, a new parameter needs only a
+        new entry. The table is created on demand, because the module
+        'sds_glob' with the error messages imports this module.
+
+        Returns:
+            dict[str, ConfigParam]:
+                The definition of every configuration parameter by name.
+        """
+        benchmark_grid = {
+            "{coef_bits}": sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS,
+            "{degrees}": sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES,
+        }
+        calibration_grid = {
+            "{coef_bits}": sds_glob.CONFIG_PARAM_CALIBRATE_COEF_BITS,
+            "{sizes}": sds_glob.CONFIG_PARAM_CALIBRATE_SIZES,
+        }
+        tolerances = {
+            "{tolerance}": sds_glob.CONFIG_PARAM_BENCHMARK_TOLERANCE,
+            "{method_tolerances}": sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES,
+        }
+
+        return {
+            # ERROR.00.929 The benchmark grid needs coefficient bits from 1
+            # to 63 and degrees of at least 1 and not {coef_bits} and {degrees}
+            sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS: (
+                [14, 31],
+                Config._check_config_value_int_list,
+                lambda value: bool(value) and all(1 <= bits <= 63 for bits in value),
+                sds_glob.ERROR_00_929,
+                benchmark_grid,
+            ),
+            sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES: (
+                [16, 256, 4096],
+                Config._check_config_value_int_list,
+                lambda value: bool(value) and all(degree >= 1 for degree in value),
+                sds_glob.ERROR_00_929,
+                benchmark_grid,
+            ),
+            # ERROR.00.933 The benchmark tolerances must be at least 0 and not
+            # {tolerance} and {method_tolerances}
+            sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES: (
+                {},
+                Config._check_config_value_tolerances,
+                lambda value: all(tolerance >= 0 for tolerance in value.values()),
+                sds_glob.ERROR_00_933,
+                tolerances,
+            ),
+            # ERROR.00.930 The number of benchmark repetitions must be at
+            # least 1 and not {repetitions}
+            sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS: (
+                10,
+                Config._check_config_value_int,
+                lambda value: value >= 1,
+                sds_glob.ERROR_00_930,
+                {"{repetitions}": sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS},
+            ),
+            sds_glob.CONFIG_PARAM_BENCHMARK_TOLERANCE: (
+                0.25,
+                Config._check_config_value_float,
+                lambda value: value >= 0,
+                sds_glob.ERROR_00_933,
+                tolerances,
+            ),
+            # ERROR.00.931 The number of benchmark warmups must be at least 0
+            # and not {warmups}
+            sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS: (
+                2,
+                Config._check_config_value_int,
+                lambda value: value >= 0,
+                sds_glob.ERROR_00_931,
+                {"{warmups}": sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS},
+            ),
+            # ERROR.00.936 The calibration grid needs coefficient bits from 1
+            # to 63 and sizes of at least 1 and not {coef_bits} and {sizes}
+            sds_glob.CONFIG_PARAM_CALIBRATE_COEF_BITS: (
+                [14, 31],
+                Config._check_config_value_int_list,
+                lambda value: bool(value) and all(1 <= bits <= 63 for bits in value),
+                sds_glob.ERROR_00_936,
+                calibration_grid,
+            ),
+            # ERROR.00.937 The number of calibration repetitions must be at
+            # least 1 and not {repetitions}
+            sds_glob.CONFIG_PARAM_CALIBRATE_REPETITIONS: (
+                3,
+                Config._check_config_value_int,
+                lambda value: value >= 1,
+                sds_glob.ERROR_00_937,
+                {"{repetitions}": sds_glob.CONFIG_PARAM_CALIBRATE_REPETITIONS},
+            ),
+            sds_glob.CONFIG_PARAM_CALIBRATE_SIZES: (
+                [16, 64, 256, 1024, 4096, 16384],
+                Config._check_config_value_int_list,
+                lambda value: bool(value) and all(size >= 1 for size in value),
+                sds_glob.ERROR_00_936,
+                calibration_grid,
+            ),
+            # ERROR.00.912 The cutoff degree must be at least 1 and not
+            # {cutoff_degree}
+            sds_glob.CONFIG_PARAM_CUTOFF_DEGREE: (
+                256,
+                Config._check_config_value_int,
+                lambda value: value >= 1,
+                sds_glob.ERROR_00_912,
+                {"{cutoff_degree}": sds_glob.CONFIG_PARAM_CUTOFF_DEGREE},
+            ),
+            # ERROR.00.927 The density must be greater than 0 and at most 1
+            # and not {density}
+            sds_glob.CONFIG_PARAM_DENSITY: (
+                1.0,
+                Config._check_config_value_float,
+                lambda value: 0 < value <= 1,
+                sds_glob.ERROR_00_927,
+                {"{density}": sds_glob.CONFIG_PARAM_DENSITY},
+            ),
+            # ERROR.00.923 The number of shards must be at least 1 and not
+            # {no_shards}
+            sds_glob.CONFIG_PARAM_NO_SHARDS: (
+                1,
+                Config._check_config_value_int,
+                lambda value: value >= 1,
+                sds_glob.ERROR_00_923,
+                {"{no_shards}": sds_glob.CONFIG_PARAM_NO_SHARDS},
+            ),
+            # ERROR.00.924 The seed must be at least -1 and not {seed}
+            sds_glob.CONFIG_PARAM_SEED: (
+                -1,
+                Config._check_config_value_int,
+                lambda value: value >= -1,
+                sds_glob.ERROR_00_924,
+                {"{seed}": sds_glob.CONFIG_PARAM_SEED},
+            ),
+            # ERROR.00.917 The number of error bits must be at least 1 and
+            # not {verify_error_bits}
+            sds_glob.CONFIG_PARAM_VERIFY_ERROR_BITS: (
+                64,
+                Config._check_config_value_int,
+                lambda value: value >= 1,
+                sds_glob.ERROR_00_917,
+                {"{verify_error_bits}": sds_glob.CONFIG_PARAM_VERIFY_ERROR_BITS},
+            ),
+        }
 
     # ------------------------------------------------------------------
     # Getter method: _coef_max.
@@ -235,6 +540,22 @@ class Config:
         """
         return self._coef_min
 
+    # ------------------------------------------------------------------
+    # Getter method: a parameter of the parameter table.
+    # ------------------------------------------------------------------
+    def get_config_value(self, key: str) -> Any:
+        """Getter method: a parameter of the parameter table.
+
+        Args:
+            key (str):
+                The name of the configuration parameter, e.g.
+                'sds_glob.CONFIG_PARAM_SEED'.
+
+        Returns:
+            Any: The value of the configuration parameter.
+        """
+        return self._params[key]
+
     # ------------------------------------------------------------------
     # Getter method: _degree_max.
     # ------------------------------------------------------------------
@@ -322,17 +643,22 @@ class Config:
     # ------------------------------------------------------------------
     # Modify the value of an existing configuration parameter.
     # ------------------------------------------------------------------
-    def set_config_value(self, key: str, value: bool | int | str) -> None:
+    def set_config_value(
+        self, key: str, value: bool | dict[str, float] | float | int | list[int] | str
+    ) -> None:
         """Modify the value of an existing configuration parameter.
 
         Args:
             key (str):
                 The name of the configuration parameter.
-            value (bool | int | str):
+            value (bool | dict[str, float] | float | int | list[int] | str):
                 The new value of the configuration parameter.
         """
         self._check_single_config_param(key, value)
 
+        if key.lower() in self._params:
+            self._check_config_param(key.lower())
+
     # ------------------------------------------------------------------
     # Setter method: _degree_min & _degree_max.
     # ------------------------------------------------------------------
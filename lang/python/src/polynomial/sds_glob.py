@@ -7,19 +7,54 @@ import logging.config
 
 import sds_config
 
+ARG_ACTION_BENCHMARK = "benchmark"
+ARG_ACTION_CALIBRATE = "calibrate"
 ARG_ACTION_GENERATE = "generate"
 ARG_ACTION_MULTIPLY = "multiply"
+ARG_ACTION_STREAM = "stream"
+ARG_FORMAT_BINARY = "binary"
+ARG_FORMAT_JSON = "json"
+ARG_METHOD_AUTO = "auto"
+ARG_METHOD_BATCH = "batch"
 ARG_METHOD_FFT = "fft"
+ARG_METHOD_KARATSUBA = "karatsuba"
+ARG_METHOD_KRONECKER = "kronecker"
+ARG_METHOD_NTT = "ntt"
 ARG_METHOD_NUMPY = "numpy"
+ARG_METHOD_RFFT = "rfft"
 ARG_METHOD_SIMPLE = "simple"
+ARG_METHOD_SPARSE = "sparse"
+ARG_METHOD_TOOM3 = "toom3"
+ARG_VERIFY_ALL = "all"
+ARG_VERIFY_FIRST = "first"
+ARG_VERIFY_PROBABILISTIC = "probabilistic"
+
+# Results of the action 'benchmark', as JSON file and with the suffix
+# '.csv' as CSV file.
+BENCHMARK_FILE = "benchmark.json"
+BENCHMARK_SUFFIX_CSV = ".csv"
 
 # Configuration parameter.
+CONFIG_PARAM_BENCHMARK_COEF_BITS = "benchmark_coef_bits"
+CONFIG_PARAM_BENCHMARK_DEGREES = "benchmark_degrees"
+CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES = "benchmark_method_tolerances"
+CONFIG_PARAM_BENCHMARK_REPETITIONS = "benchmark_repetitions"
+CONFIG_PARAM_BENCHMARK_TOLERANCE = "benchmark_tolerance"
+CONFIG_PARAM_BENCHMARK_WARMUPS = "benchmark_warmups"
+CONFIG_PARAM_CALIBRATE_COEF_BITS = "calibrate_coef_bits"
+CONFIG_PARAM_CALIBRATE_REPETITIONS = "calibrate_repetitions"
+CONFIG_PARAM_CALIBRATE_SIZES = "calibrate_sizes"
 CONFIG_PARAM_COEF_MAX = "coef_max"
 CONFIG_PARAM_COEF_MIN = "coef_min"
+CONFIG_PARAM_CUTOFF_DEGREE = "cutoff_degree"
 CONFIG_PARAM_DEGREE_MAX = "degree_max"
 CONFIG_PARAM_DEGREE_MIN = "degree_min"
+CONFIG_PARAM_DENSITY = "density"
+CONFIG_PARAM_NO_SHARDS = "no_shards"
 CONFIG_PARAM_NO_TASKS = "no_tasks"
+CONFIG_PARAM_SEED = "seed"
 CONFIG_PARAM_VERBOSE = "verbose"
+CONFIG_PARAM_VERIFY_ERROR_BITS = "verify_error_bits"
 
 # Error messages.
 ERROR_00_902 = "ERROR.00.902 The specified JSON file {file_name} does not exist"
@@ -52,6 +87,93 @@ ERROR_00_911 = (
     "ERROR.00.911 Difference in task no. {task_no} degree {degree} "
     + "got {got} instead of {instead}"
 )
+ERROR_00_912 = (
+    "ERROR.00.912 The cutoff degree must be at least 1 and not {cutoff_degree}"
+)
+ERROR_00_913 = (
+    "ERROR.00.913 Illegal entry '{key} = {value}' in the tuning file '{file}'"
+)
+ERROR_00_914 = "ERROR.00.914 The number of workers must be at least 1 and not {workers}"
+ERROR_00_915 = (
+    "ERROR.00.915 Difference in task no. {task_no} "
+    + "got degree {got} instead of {instead}"
+)
+ERROR_00_916 = "ERROR.00.916 {no_differences} difference(s) in {no_tasks} task(s)"
+ERROR_00_917 = (
+    "ERROR.00.917 The number of error bits must be at least 1 "
+    + "and not {verify_error_bits}"
+)
+ERROR_00_918 = (
+    "ERROR.00.918 Difference in task no. {task_no} at the point {point} "
+    + "modulo {prime} got {got} instead of {instead}"
+)
+ERROR_00_919 = (
+    "ERROR.00.919 The file {file_name} is not a binary task file "
+    + "of version {version}"
+)
+ERROR_00_920 = (
+    "ERROR.00.920 The product coefficients up to {coef_bound} exceed "
+    + "the int64 range of the binary task file"
+)
+ERROR_00_921 = "ERROR.00.921 The task selection '{tasks}' is invalid"
+ERROR_00_922 = (
+    "ERROR.00.922 The task no. {task_no} does not exist in the task "
+    + "file {file_name}"
+)
+ERROR_00_923 = (
+    "ERROR.00.923 The number of shards must be at least 1 and not {no_shards}"
+)
+ERROR_00_924 = "ERROR.00.924 The seed must be at least -1 and not {seed}"
+ERROR_00_925 = (
+    "ERROR.00.925 The coefficients from {coef_min} to {coef_max} exceed "
+    + "the int64 range of the generator"
+)
+ERROR_00_926 = (
+    "ERROR.00.926 Illegal configuration parameter value '{value}' - "
+    + "only numbers are allowed"
+)
+ERROR_00_927 = (
+    "ERROR.00.927 The density must be greater than 0 and at most 1 and "
+    + "not {density}"
+)
+ERROR_00_928 = (
+    "ERROR.00.928 Illegal configuration parameter value '{value}' - "
+    + "only comma-separated integers are allowed"
+)
+ERROR_00_929 = (
+    "ERROR.00.929 The benchmark grid needs coefficient bits from 1 to 63 "
+    + "and degrees of at least 1 and not {coef_bits} and {degrees}"
+)
+ERROR_00_930 = (
+    "ERROR.00.930 The number of benchmark repetitions must be at least 1 "
+    + "and not {repetitions}"
+)
+ERROR_00_931 = (
+    "ERROR.00.931 The number of benchmark warmups must be at least 0 "
+    + "and not {warmups}"
+)
+ERROR_00_932 = (
+    "ERROR.00.932 Illegal configuration parameter value '{value}' - only "
+    + "comma-separated 'method=tolerance' or 'method:degree=tolerance' "
+    + "are allowed"
+)
+ERROR_00_933 = (
+    "ERROR.00.933 The benchmark tolerances must be at least 0 "
+    + "and not {tolerance} and {method_tolerances}"
+)
+ERROR_00_934 = "ERROR.00.934 The specified baseline file {file_name} does not exist"
+ERROR_00_935 = (
+    "ERROR.00.935 {no_regressions} regression(s) against the baseline file "
+    + "{file_name}"
+)
+ERROR_00_936 = (
+    "ERROR.00.936 The calibration grid needs coefficient bits from 1 to 63 "
+    + "and sizes of at least 1 and not {coef_bits} and {sizes}"
+)
+ERROR_00_937 = (
+    "ERROR.00.937 The number of calibration repetitions must be at least 1 "
+    + "and not {repetitions}"
+)
 
 # Default file encoding UTF-8.
 FILE_ENCODING_DEFAULT = "utf-8"
@@ -69,19 +191,38 @@ INFO_00_005 = "INFO.00.005 Argument {arg}='{value}'"
 INFO_00_006 = "INFO.00.006 End   Launcher"
 INFO_00_011 = "INFO.00.011 Start Generator"
 INFO_00_012 = "INFO.00.012 End   Generator"
+INFO_00_013 = "INFO.00.013 The tasks are generated with the seed {seed}"
 INFO_00_021 = "INFO.00.021 Start Multiplier - Python - {method}"
 INFO_00_022 = "INFO.00.022 End   Multiplier - Python - {method}"
+INFO_00_031 = "INFO.00.031 Start Calibrator"
+INFO_00_032 = "INFO.00.032 End   Calibrator"
+INFO_00_041 = "INFO.00.041 Start Benchmark"
+INFO_00_042 = "INFO.00.042 End   Benchmark"
 
 INFORMATION_NOT_YET_AVAILABLE = "n/a"
 
+JSON_NAME_COEF_BITS = "coefBits"
 JSON_NAME_COEFFICIENTS = "coefficients"
 JSON_NAME_DEGREE = "degree"
+JSON_NAME_DURATIONS = "durationsNs"
+JSON_NAME_EXPONENTS = "exponents"
+JSON_NAME_FILE_NAME = "fileName"
+JSON_NAME_FORMAT = "format"
+JSON_NAME_MEDIAN = "medianNs"
+JSON_NAME_METHOD = "method"
+JSON_NAME_MIN = "minNs"
 JSON_NAME_NO_TASKS = "moTasks"
+JSON_NAME_P95 = "p95Ns"
 JSON_NAME_POLYNOM_1 = "polynom1"
 JSON_NAME_POLYNOM_2 = "polynom2"
 JSON_NAME_PRODUCT = "product"
+JSON_NAME_REPETITIONS = "repetitions"
+JSON_NAME_RESULTS = "results"
+JSON_NAME_SHARDS = "shards"
 JSON_NAME_TASK_NO = "taskNo"
+JSON_NAME_TASK_NO_FIRST = "firstTaskNo"
 JSON_NAME_TASKS = "tasks"
+JSON_NAME_WARMUPS = "warmups"
 
 # Logging constants.
 LOGGER_END = "End"
@@ -90,6 +231,10 @@ LOGGER_START = "Start"
 
 POLYNOMIAL_FILE_NAME = "POLYNOMIAL_FILE_NAME"
 
+# Crossover table of the method 'auto', located next to 'setup.cfg'.
+TUNING_FILE = "tuning.cfg"
+TUNING_SECTION = "auto"
+
 inst_config: sds_config.Config = sds_config.Config()
 
 # Logger instance.
@@ -7,19 +7,51 @@ import logging.config
 
 import sds_config  # type: ignore
 
+ARG_ACTION_BENCHMARK: str = ...
+ARG_ACTION_CALIBRATE: str = ...
 ARG_ACTION_GENERATE: str = ...
 ARG_ACTION_MULTIPLY: str = ...
+ARG_ACTION_STREAM: str = ...
+ARG_FORMAT_BINARY: str = ...
+ARG_FORMAT_JSON: str = ...
+ARG_METHOD_AUTO: str = ...
+ARG_METHOD_BATCH: str = ...
 ARG_METHOD_FFT: str = ...
+ARG_METHOD_KARATSUBA: str = ...
+ARG_METHOD_KRONECKER: str = ...
+ARG_METHOD_NTT: str = ...
 ARG_METHOD_NUMPY: str = ...
+ARG_METHOD_RFFT: str = ...
 ARG_METHOD_SIMPLE: str = ...
+ARG_METHOD_SPARSE: str = ...
+ARG_METHOD_TOOM3: str = ...
+ARG_VERIFY_ALL: str = ...
+ARG_VERIFY_FIRST: str = ...
+ARG_VERIFY_PROBABILISTIC: str = ...
+BENCHMARK_FILE: str = ...
+BENCHMARK_SUFFIX_CSV: str = ...
 
 # Configuration parameter.
+CONFIG_PARAM_BENCHMARK_COEF_BITS: str = ...
+CONFIG_PARAM_BENCHMARK_DEGREES: str = ...
+CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES: str = ...
+CONFIG_PARAM_BENCHMARK_REPETITIONS: str = ...
+CONFIG_PARAM_BENCHMARK_TOLERANCE: str = ...
+CONFIG_PARAM_BENCHMARK_WARMUPS: str = ...
+CONFIG_PARAM_CALIBRATE_COEF_BITS: str = ...
+CONFIG_PARAM_CALIBRATE_REPETITIONS: str = ...
+CONFIG_PARAM_CALIBRATE_SIZES: str = ...
 CONFIG_PARAM_COEF_MAX: str = ...
 CONFIG_PARAM_COEF_MIN: str = ...
+CONFIG_PARAM_CUTOFF_DEGREE: str = ...
 CONFIG_PARAM_DEGREE_MAX: str = ...
 CONFIG_PARAM_DEGREE_MIN: str = ...
+CONFIG_PARAM_DENSITY: str = ...
+CONFIG_PARAM_NO_SHARDS: str = ...
 CONFIG_PARAM_NO_TASKS: str = ...
+CONFIG_PARAM_SEED: str = ...
 CONFIG_PARAM_VERBOSE: str = ...
+CONFIG_PARAM_VERIFY_ERROR_BITS: str = ...
 
 # Error messages.
 ERROR_00_902: str = ...
@@ -32,6 +64,32 @@ ERROR_00_908: str = ...
 ERROR_00_909: str = ...
 ERROR_00_910: str = ...
 ERROR_00_911: str = ...
+ERROR_00_912: str = ...
+ERROR_00_913: str = ...
+ERROR_00_914: str = ...
+ERROR_00_915: str = ...
+ERROR_00_916: str = ...
+ERROR_00_917: str = ...
+ERROR_00_918: str = ...
+ERROR_00_919: str = ...
+ERROR_00_920: str = ...
+ERROR_00_921: str = ...
+ERROR_00_922: str = ...
+ERROR_00_923: str = ...
+ERROR_00_924: str = ...
+ERROR_00_925: str = ...
+ERROR_00_926: str = ...
+ERROR_00_927: str = ...
+ERROR_00_928: str = ...
+ERROR_00_929: str = ...
+ERROR_00_930: str = ...
+ERROR_00_931: str = ...
+ERROR_00_932: str = ...
+ERROR_00_933: str = ...
+ERROR_00_934: str = ...
+ERROR_00_935: str = ...
+ERROR_00_936: str = ...
+ERROR_00_937: str = ...
 
 FILE_ENCODING_DEFAULT = ...
 
@@ -43,18 +101,37 @@ INFO_00_005: str = ...
 INFO_00_006: str = ...
 INFO_00_011: str = ...
 INFO_00_012: str = ...
+INFO_00_013: str = ...
 INFO_00_021: str = ...
 INFO_00_022: str = ...
+INFO_00_031: str = ...
+INFO_00_032: str = ...
+INFO_00_041: str = ...
+INFO_00_042: str = ...
 INFORMATION_NOT_YET_AVAILABLE: str = ...
 
+JSON_NAME_COEF_BITS: str = ...
 JSON_NAME_COEFFICIENTS: str = ...
 JSON_NAME_DEGREE: str = ...
+JSON_NAME_DURATIONS: str = ...
+JSON_NAME_EXPONENTS: str = ...
+JSON_NAME_FILE_NAME: str = ...
+JSON_NAME_FORMAT: str = ...
+JSON_NAME_MEDIAN: str = ...
+JSON_NAME_METHOD: str = ...
+JSON_NAME_MIN: str = ...
 JSON_NAME_NO_TASKS: str = ...
+JSON_NAME_P95: str = ...
 JSON_NAME_POLYNOM_1: str = ...
 JSON_NAME_POLYNOM_2: str = ...
 JSON_NAME_PRODUCT: str = ...
+JSON_NAME_REPETITIONS: str = ...
+JSON_NAME_RESULTS: str = ...
+JSON_NAME_SHARDS: str = ...
 JSON_NAME_TASK_NO: str = ...
+JSON_NAME_TASK_NO_FIRST: str = ...
 JSON_NAME_TASKS: str = ...
+JSON_NAME_WARMUPS: str = ...
 
 LOGGER_END: str = ...
 LOGGER_NAME: str = ...
@@ -62,6 +139,9 @@ LOGGER_START: str = ...
 
 POLYNOMIAL_FILE_NAME: str = ...
 
+TUNING_FILE: str = ...
+TUNING_SECTION: str = ...
+
 inst_config: sds_config.Config
 
 logger: logging.Logger
@@ -0,0 +1,177 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Exact multiplication of sparse polynomials by their non-zero terms."""
+from __future__ import annotations
+
+import math
+
+import numpy
+import utils  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Maximum number of term products per step of the sparse engine and
+# share of the work N * log2(N) of a transform of size N, below which
+# the term products of the sparse engine are faster.
+_STEP_TERMS = 2**20
+_WORK_SHARE = 0.5
+
+
+# ------------------------------------------------------------------
+# Add the term products of a step of the sparse method.
+# ------------------------------------------------------------------
+def _add_terms(terms: dict[int, int], exponents: ndarray, values: ndarray) -> None:
+    """Add the term products of a step of the sparse method.
+
+    The term products are sorted by their exponent, the like terms are
+    summed up and the sums are merged into the terms.
+
+    Args:
+        terms (dict[int, int]): The coefficients of the product terms so
+            far per exponent.
+        exponents (ndarray): The exponents of the term products.
+        values (ndarray): The coefficients of the term products.
+    """
+    order = numpy.argsort(exponents, kind="stable")
+    exponents = exponents[order]
+    firsts = numpy.flatnonzero(
+        numpy.concatenate(([True], exponents[1:] != exponents[:-1]))
+    )
+
+    for exponent, value in zip(
+        exponents[firsts].tolist(),
+        numpy.add.reduceat(values[order], firsts).tolist(),
+    ):
+        terms[exponent] = terms.get(exponent, 0) + value
+
+
+# ------------------------------------------------------------------
+# Multiply the non-zero terms of two polynomials in steps.
+# ------------------------------------------------------------------
+def _get_terms(
+    terms_1: tuple[ndarray, ndarray], terms_2: tuple[ndarray, ndarray]
+) -> dict[int, int]:
+    """Multiply the non-zero terms of two polynomials in steps.
+
+    Args:
+        terms_1 (tuple[ndarray, ndarray]): The exponents and the
+            coefficients of the non-zero terms of polynomial 1.
+        terms_2 (tuple[ndarray, ndarray]): The exponents and the
+            coefficients of the non-zero terms of polynomial 2.
+
+    Returns:
+        dict[int, int]: The coefficients of the product terms per
+            exponent.
+    """
+    exponents_1, values_1 = terms_1
+    exponents_2, values_2 = terms_2
+
+    terms: dict[int, int] = {}
+
+    rows = max(1, _STEP_TERMS // len(exponents_2))
+
+    for start in range(0, len(exponents_1), rows):
+        end = start + rows
+        _add_terms(
+            terms,
+            (exponents_1[start:end, None] + exponents_2).ravel(),
+            (values_1[start:end, None] * values_2).ravel(),
+        )
+
+    return terms
+
+
+# ------------------------------------------------------------------
+# Decide whether the sparse method is the faster one.
+# ------------------------------------------------------------------
+def is_sparse(coefficients_1, coefficients_2) -> bool:
+    """Decide whether the sparse method is the faster one.
+
+    The sparse method multiplies every non-zero term of polynomial 1
+    with every non-zero term of polynomial 2, a transform of size N
+    costs about N * log2(N) operations for any density. The sparse
+    method is thus the faster one as long as the product of the numbers
+    of non-zero terms stays below the share '_WORK_SHARE' of
+    N * log2(N), i.e. as long as the density of the polynomials falls
+    below a threshold that decreases with their size, e.g. about 0.5%
+    for two polynomials of degree 10**6.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        bool: True if the sparse method is the faster one.
+    """
+    size = len(coefficients_1) + len(coefficients_2) - 1
+
+    return bool(
+        numpy.count_nonzero(coefficients_1) * numpy.count_nonzero(coefficients_2)
+        < _WORK_SHARE * size * math.log2(size)
+    )
+
+
+# ------------------------------------------------------------------
+# Multiply two polynomials exactly by their non-zero terms.
+# ------------------------------------------------------------------
+def multiply_sparse(coefficients_1, coefficients_2) -> ndarray:
+    """Multiply two polynomials exactly by their non-zero terms.
+
+    Only the non-zero terms of both polynomials are multiplied with each
+    other, in steps of at most '_STEP_TERMS' term products. The term
+    products of a step are sorted by their exponent and like terms are
+    summed up, the sums are merged into a table keyed by the exponent.
+    The array of the product coefficients is created from this table
+    only at the end, so that the effort depends on the numbers of
+    non-zero terms and not on the degrees. The sums are accumulated in
+    int64 unless they could overflow, then with Python integers.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        ndarray: The coefficients of the product without leading zero
+            terms, as int64 or as Python integers, no coefficients for a
+            zero polynomial.
+    """
+    coefficients_1 = numpy.asarray(coefficients_1)
+    coefficients_2 = numpy.asarray(coefficients_2)
+
+    exponents_1 = numpy.flatnonzero(coefficients_1)
+    exponents_2 = numpy.flatnonzero(coefficients_2)
+
+    # A zero polynomial has no terms, like the product of every other
+    # method after 'utils.delete_leading_zero_terms'.
+    if len(exponents_1) == 0 or len(exponents_2) == 0:
+        return numpy.zeros(0, dtype=numpy.int64)
+
+    values_1 = coefficients_1[exponents_1]
+    values_2 = coefficients_2[exponents_2]
+
+    # At most min(terms_1, terms_2) term products fall on one exponent.
+    coef_bound = (
+        min(len(exponents_1), len(exponents_2))
+        * utils.get_abs_max(values_1)
+        * utils.get_abs_max(values_2)
+    )
+    dtype = numpy.int64 if coef_bound < 2**63 else object
+
+    terms = _get_terms(
+        (exponents_1, values_1.astype(dtype)), (exponents_2, values_2.astype(dtype))
+    )
+
+    # The highest term product is the only one on its exponent, the
+    # product has thus no leading zero terms.
+    result = numpy.zeros(int(exponents_1[-1] + exponents_2[-1]) + 1, dtype=dtype)
+    result[list(terms)] = list(terms.values())
+
+    return result
@@ -0,0 +1,116 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Decoding and chunking of the polynomial multiplication tasks."""
+from __future__ import annotations
+
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+
+import numpy
+import sds_glob  # type: ignore
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Data of a task: task number and the coefficients and the degree of
+# both polynomials and of the product.
+TaskData = tuple[int, Any, int, Any, int, Any, int]
+
+
+# ------------------------------------------------------------------
+# Provide the coefficients of a polynomial of a task.
+# ------------------------------------------------------------------
+def _get_coefficients(polynom: dict):
+    """Provide the coefficients of a polynomial of a task.
+
+    A polynomial in the sparse encoding lists the exponents of its
+    non-zero terms with their coefficients; its coefficients are
+    expanded into an array up to the degree.
+
+    Args:
+        polynom (dict): The polynomial from the task file.
+
+    Returns:
+        The coefficients of the polynomial, a list or an array.
+    """
+    coefficients = polynom[sds_glob.JSON_NAME_COEFFICIENTS]
+
+    if sds_glob.JSON_NAME_EXPONENTS not in polynom:
+        return coefficients
+
+    # Coefficients beyond the int64 range stay Python integers.
+    values = numpy.array(coefficients)
+    if values.dtype != numpy.int64 and len(values) > 0:
+        values = numpy.array(coefficients, dtype=object)
+
+    result = numpy.zeros(
+        polynom[sds_glob.JSON_NAME_DEGREE] + 1,
+        dtype=object if values.dtype == object else numpy.int64,
+    )
+    result[polynom[sds_glob.JSON_NAME_EXPONENTS]] = values
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Determine the data of a task.
+# ------------------------------------------------------------------
+def get_task_data(task_no: int, task: dict) -> TaskData:
+    """Determine the data of a task.
+
+    Args:
+        task_no (int): The number of the task, starting with zero.
+        task (dict): The task from the task file.
+
+    Returns:
+        TaskData: The task number and the coefficients and the degree of
+            both polynomials and of the product.
+    """
+    return (
+        task_no,
+        _get_coefficients(task[sds_glob.JSON_NAME_POLYNOM_1]),
+        task[sds_glob.JSON_NAME_POLYNOM_1][sds_glob.JSON_NAME_DEGREE],
+        _get_coefficients(task[sds_glob.JSON_NAME_POLYNOM_2]),
+        task[sds_glob.JSON_NAME_POLYNOM_2][sds_glob.JSON_NAME_DEGREE],
+        _get_coefficients(task[sds_glob.JSON_NAME_PRODUCT]),
+        task[sds_glob.JSON_NAME_PRODUCT][sds_glob.JSON_NAME_DEGREE],
+    )
+
+
+# ------------------------------------------------------------------
+# Split the tasks into chunks.
+# ------------------------------------------------------------------
+def split_tasks(
+    tasks: Iterable[tuple[int, dict]], elements_max: int
+) -> Iterator[list[tuple[int, dict]]]:
+    """Split the tasks into chunks.
+
+    Args:
+        tasks (Iterable[tuple[int, dict]]): The numbers of the tasks
+            and the tasks.
+        elements_max (int): The number of coefficients of both
+            polynomials from which on a chunk is complete.
+
+    Yields:
+        list[tuple[int, dict]]: The next chunk of tasks, at least one
+            task.
+    """
+    chunk: list[tuple[int, dict]] = []
+    elements = 0
+
+    for task_no, task in tasks:
+        chunk.append((task_no, task))
+        elements += len(
+            task[sds_glob.JSON_NAME_POLYNOM_1][sds_glob.JSON_NAME_COEFFICIENTS]
+        ) + len(task[sds_glob.JSON_NAME_POLYNOM_2][sds_glob.JSON_NAME_COEFFICIENTS])
+
+        if elements >= elements_max:
+            yield chunk
+            chunk = []
+            elements = 0
+
+    if chunk:
+        yield chunk
@@ -0,0 +1,991 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Incremental and random access reading of the tasks of a task file."""
+from __future__ import annotations
+
+import gzip
+import json
+import lzma
+import os
+import queue
+import threading
+from typing import IO
+from typing import Any
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+from typing import NamedTuple
+from typing import cast
+
+import numpy
+import sds_glob  # type: ignore
+import utils  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Layout of the binary task file, all numbers little-endian: the
+# header, followed by one table entry per task and the coefficient
+# arrays, lowest degree first, as int32 or int64 according to
+# 'coef_bytes'. The offsets are byte positions in the file, the
+# number of coefficients of an array is its degree plus one.
+BINARY_HEADER = numpy.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("coef_bytes", "<u4"),
+        ("no_tasks", "<u8"),
+        ("reserved", "<u8"),
+    ]
+)
+BINARY_MAGIC = b"POLYTASK"
+BINARY_TABLE = numpy.dtype(
+    [
+        ("offset_1", "<u8"),
+        ("degree_1", "<u8"),
+        ("offset_2", "<u8"),
+        ("degree_2", "<u8"),
+        ("offset_product", "<u8"),
+        ("degree_product", "<u8"),
+    ]
+)
+BINARY_VERSION = 1
+
+# Layout of the index file of a JSON file, all numbers little-endian:
+# the header, followed by the byte range of the JSON object of every
+# task. The index is valid as long as the size and the modification
+# time of the JSON file are unchanged.
+INDEX_ENTRY = numpy.dtype([("offset", "<u8"), ("size", "<u8")])
+INDEX_HEADER = numpy.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("reserved", "<u4"),
+        ("file_size", "<u8"),
+        ("file_mtime_ns", "<u8"),
+        ("no_tasks", "<u8"),
+    ]
+)
+INDEX_MAGIC = b"POLYINDX"
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+
+# Task files with one of these extensions are compressed with gzip or
+# xz, e.g. 'polynom_data.json.gz' or 'polynom_data.bin.xz'.
+SUFFIX_GZIP = ".gz"
+SUFFIX_XZ = ".xz"
+
+_DECODER = json.JSONDecoder()
+_GZIP_LEVEL = 6
+_QUEUE_SIZE = 64
+_READ_SIZE = 1 << 20
+_WHITESPACE = " \t\n\r"
+
+
+# pylint: disable=too-few-public-methods
+class _Buffer:
+    """Text buffer over a JSON file, refilled on demand."""
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, file_handle: IO[str]) -> None:
+        """Initialise the instance.
+
+        Args:
+            file_handle (IO[str]): The opened JSON file.
+        """
+        self._file_handle = file_handle
+        self._is_eof = False
+        self._offset = 0
+        self._pos = 0
+        self._text = ""
+
+    # ------------------------------------------------------------------
+    # Read more text into the buffer.
+    # ------------------------------------------------------------------
+    def _fill(self, size: int) -> None:
+        """Read more text into the buffer.
+
+        Args:
+            size (int): The number of characters to read.
+        """
+        text = self._file_handle.read(size)
+
+        if not text:
+            self._is_eof = True
+
+        pos = self._pos
+        self._offset += pos
+        self._text = self._text[pos:] + text
+        self._pos = 0
+
+    # ------------------------------------------------------------------
+    # Decode the next JSON value.
+    # ------------------------------------------------------------------
+    def decode(self):
+        """Decode the next JSON value.
+
+        If the value is not yet completely in the buffer, at least as
+        much text as the buffer already holds is read in addition, so
+        that a large value is decoded with a linear effort.
+
+        Returns:
+            The decoded JSON value.
+        """
+        self.peek()
+
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._pos)
+                # A number at the end of the buffer could continue.
+                if end < len(self._text) or self._is_eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._is_eof:
+                    raise
+
+            self._fill(max(_READ_SIZE, len(self._text)))
+
+    # ------------------------------------------------------------------
+    # Consume the expected structural character.
+    # ------------------------------------------------------------------
+    def expect(self, char: str) -> None:
+        """Consume the expected structural character.
+
+        Args:
+            char (str): The expected character.
+        """
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._text, self._pos)
+
+        self._pos += 1
+
+    # ------------------------------------------------------------------
+    # Provide the next non-whitespace character.
+    # ------------------------------------------------------------------
+    def peek(self) -> str:
+        """Provide the next non-whitespace character.
+
+        Returns:
+            str: The next non-whitespace character, empty at the end of
+                the file.
+        """
+        while True:
+            while self._pos < len(self._text) and self._text[self._pos] in _WHITESPACE:
+                self._pos += 1
+
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+
+            if self._is_eof:
+                return ""
+
+            self._fill(_READ_SIZE)
+
+    # ------------------------------------------------------------------
+    # Provide the position in the file.
+    # ------------------------------------------------------------------
+    def position(self) -> int:
+        """Provide the position in the file.
+
+        Returns:
+            int: The number of characters consumed so far.
+        """
+        return self._offset + self._pos
+
+
+class TaskFile(NamedTuple):
+    """Task file with its format and the selection of its tasks.
+
+    Attributes:
+        file_name (str): The name of the JSON file, binary task file or
+            manifest of shard files.
+        file_format (str): The format of the task file: 'json' or
+            'binary'. A manifest specifies the format of its shard
+            files itself. Defaults to 'json'.
+        tasks (str): The selection of task numbers and ranges of task
+            numbers, e.g. '120-180,500'. Defaults to all tasks.
+    """
+
+    file_name: str
+    file_format: str = sds_glob.ARG_FORMAT_JSON
+    tasks: str = ""
+
+
+class TaskQueue:
+    """Bounded in-memory queue of tasks from a producer to a consumer."""
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, maxsize: int = _QUEUE_SIZE) -> None:
+        """Initialise the instance.
+
+        The producer blocks as soon as the queue holds 'maxsize' tasks,
+        so that the memory requirement does not depend on the number
+        of tasks.
+
+        Args:
+            maxsize (int, optional): The maximum number of tasks in the
+                queue. Defaults to '_QUEUE_SIZE'.
+        """
+        self._is_closed = threading.Event()
+        self._is_finished = False
+        self._queue: queue.Queue = queue.Queue(maxsize)
+
+    # ------------------------------------------------------------------
+    # Close the queue.
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Close the queue.
+
+        The consumer closes the queue when it does not take any further
+        tasks, e.g. after an error. The queued tasks are discarded, so
+        that a blocked producer resumes and then stops.
+        """
+        self._is_closed.set()
+
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                return
+
+    # ------------------------------------------------------------------
+    # Mark the end of the tasks.
+    # ------------------------------------------------------------------
+    def finish(self) -> None:
+        """Mark the end of the tasks.
+
+        The producer marks the end of the tasks once, also if it fails
+        before putting any task, so that the consumer does not wait
+        forever. After the consumer has closed the queue, no end is
+        marked any more.
+        """
+        if self._is_finished or self._is_closed.is_set():
+            return
+
+        self._is_finished = True
+        self._queue.put(None)
+
+    # ------------------------------------------------------------------
+    # Provide the tasks from the queue.
+    # ------------------------------------------------------------------
+    def get_tasks(self) -> Iterator[tuple[int, dict]]:
+        """Provide the tasks from the queue.
+
+        Yields:
+            tuple[int, dict]: The number of the task, starting with zero,
+                and the task, until the producer has finished.
+        """
+        yield from iter(self._queue.get, None)
+
+    # ------------------------------------------------------------------
+    # Put the tasks into the queue.
+    # ------------------------------------------------------------------
+    def put_tasks(self, tasks: Iterable[tuple[int, dict]]) -> None:
+        """Put the tasks into the queue.
+
+        The end of the tasks is marked for the consumer also if the
+        producer fails. The producer stops as soon as the consumer has
+        closed the queue.
+
+        Args:
+            tasks (Iterable[tuple[int, dict]]): The numbers of the tasks,
+                starting with zero, and the tasks.
+        """
+        try:
+            for task in tasks:
+                if self._is_closed.is_set():
+                    return
+                self._queue.put(task)
+        finally:
+            self.finish()
+
+
+# ------------------------------------------------------------------
+# Check the header of a binary task file.
+# ------------------------------------------------------------------
+def _check_binary_header(file_name: str, data) -> ndarray:
+    """Check the header of a binary task file.
+
+    Args:
+        file_name (str): The name of the binary task file.
+        data: The first bytes of the binary task file.
+
+    Returns:
+        ndarray: The header.
+    """
+    # A file too short for the header is checked as an empty header.
+    if len(data) < BINARY_HEADER.itemsize:
+        data = bytes(BINARY_HEADER.itemsize)
+
+    header = numpy.frombuffer(data, dtype=BINARY_HEADER, count=1)[0]
+
+    if (
+        header["magic"] != BINARY_MAGIC
+        or header["version"] != BINARY_VERSION
+        or header["coef_bytes"] not in (4, 8)
+    ):
+        # ERROR.00.919 The file {file_name} is not a binary task file
+        # of version {version}
+        utils.terminate_fatal(
+            sds_glob.ERROR_00_919.replace("{file_name}", file_name).replace(
+                "{version}", str(BINARY_VERSION)
+            )
+        )
+
+    return header
+
+
+# ------------------------------------------------------------------
+# Check that the selected tasks exist.
+# ------------------------------------------------------------------
+def _check_task_nos(file_name: str, task_nos: list[int] | None, no_tasks: int) -> None:
+    """Check that the selected tasks exist.
+
+    Args:
+        file_name (str): The name of the task file.
+        task_nos (list[int], optional): The selected task numbers,
+            starting with one, in ascending order.
+        no_tasks (int): The number of tasks in the task file.
+    """
+    if task_nos and task_nos[-1] > no_tasks:
+        # ERROR.00.922 The task no. {task_no} does not exist in the task
+        # file {file_name}
+        utils.terminate_fatal(
+            sds_glob.ERROR_00_922.replace("{task_no}", str(task_nos[-1])).replace(
+                "{file_name}", file_name
+            )
+        )
+
+
+# ------------------------------------------------------------------
+# Create the index file of a JSON file.
+# ------------------------------------------------------------------
+def _create_index(file_name: str) -> ndarray:
+    """Create the index file of a JSON file.
+
+    The JSON file is decoded once with one character per byte, so that
+    the positions of the tasks are byte positions.
+
+    Args:
+        file_name (str): The name of the JSON file.
+
+    Returns:
+        ndarray: The byte range of every task.
+    """
+    with open_task_file(file_name, "rt", encoding="latin-1", newline="") as file_handle:
+        index = numpy.array(
+            [(start, end - start) for start, end, _ in _scan_json(file_handle)],
+            dtype=INDEX_ENTRY,
+        )
+
+    write_index(file_name, index)
+
+    return index
+
+
+# ------------------------------------------------------------------
+# Provide a task of a binary task file.
+# ------------------------------------------------------------------
+def _get_binary_task(
+    get_coefficients: Callable[[int, int], ndarray], entry, task_no: int
+) -> dict:
+    """Provide a task of a binary task file.
+
+    Args:
+        get_coefficients (Callable[[int, int], ndarray]): Provides the
+            given number of coefficients at the given offset.
+        entry: The table entry of the task.
+        task_no (int): The number of the task, starting with zero.
+
+    Returns:
+        dict: The task.
+    """
+    task: dict[str, Any] = {sds_glob.JSON_NAME_TASK_NO: task_no + 1}
+
+    for name, field in (
+        (sds_glob.JSON_NAME_POLYNOM_1, "1"),
+        (sds_glob.JSON_NAME_POLYNOM_2, "2"),
+        (sds_glob.JSON_NAME_PRODUCT, "product"),
+    ):
+        degree = int(entry["degree_" + field])
+        task[name] = {
+            sds_glob.JSON_NAME_DEGREE: degree,
+            sds_glob.JSON_NAME_COEFFICIENTS: get_coefficients(
+                int(entry["offset_" + field]), degree + 1
+            ),
+        }
+
+    return task
+
+
+# ------------------------------------------------------------------
+# Provide the index of a JSON file.
+# ------------------------------------------------------------------
+def _get_index(file_name: str) -> ndarray:
+    """Provide the index of a JSON file.
+
+    The index file is created if it does not exist or does not match
+    the JSON file any more.
+
+    Args:
+        file_name (str): The name of the JSON file.
+
+    Returns:
+        ndarray: The byte range of every task.
+    """
+    index_file_name = file_name + INDEX_SUFFIX
+
+    if not os.path.isfile(index_file_name):
+        return _create_index(file_name)
+
+    with open(index_file_name, "rb") as file_handle:
+        data = file_handle.read()
+
+    if len(data) < INDEX_HEADER.itemsize:
+        return _create_index(file_name)
+
+    header = numpy.frombuffer(data, dtype=INDEX_HEADER, count=1)[0]
+    stat = os.stat(file_name)
+
+    if (
+        header["magic"] != INDEX_MAGIC
+        or header["version"] != INDEX_VERSION
+        or header["file_size"] != stat.st_size
+        or header["file_mtime_ns"] != stat.st_mtime_ns
+        or len(data)
+        != INDEX_HEADER.itemsize + int(header["no_tasks"]) * INDEX_ENTRY.itemsize
+    ):
+        return _create_index(file_name)
+
+    return numpy.frombuffer(
+        data,
+        dtype=INDEX_ENTRY,
+        count=int(header["no_tasks"]),
+        offset=INDEX_HEADER.itemsize,
+    )
+
+
+# ------------------------------------------------------------------
+# Map a binary task file into memory.
+# ------------------------------------------------------------------
+def _open_binary(file_name: str) -> tuple[Callable[[int, int], ndarray], ndarray]:
+    """Map a binary task file into memory.
+
+    Args:
+        file_name (str): The name of the binary task file.
+
+    Returns:
+        tuple[Callable[[int, int], ndarray], ndarray]: The access to the
+            coefficients on the mapped file and the table of the tasks.
+    """
+    if os.path.getsize(file_name) < BINARY_HEADER.itemsize:
+        data = numpy.zeros(BINARY_HEADER.itemsize, dtype=numpy.uint8)
+    else:
+        data = numpy.memmap(file_name, dtype=numpy.uint8, mode="r")
+
+    header = _check_binary_header(file_name, data)
+    dtype = numpy.dtype(f"<i{header['coef_bytes']}")
+
+    def get_coefficients(offset: int, count: int) -> ndarray:
+        return numpy.frombuffer(data, dtype=dtype, count=count, offset=offset)
+
+    return get_coefficients, numpy.frombuffer(
+        data,
+        dtype=BINARY_TABLE,
+        count=int(header["no_tasks"]),
+        offset=BINARY_HEADER.itemsize,
+    )
+
+
+# ------------------------------------------------------------------
+# Read tasks from a compressed binary task file.
+# ------------------------------------------------------------------
+def _read_binary_stream(
+    file_name: str, task_nos: list[int] | None
+) -> Iterator[tuple[int, dict]]:
+    """Read tasks from a compressed binary task file.
+
+    A compressed file cannot be mapped into memory, it is decompressed
+    front to back instead. The header and the table are read first,
+    then the coefficient arrays of the tasks, skipping the tasks that
+    are not selected.
+
+    Args:
+        file_name (str): The name of the binary task file.
+        task_nos (list[int], optional): The selected task numbers,
+            starting with one, in ascending order, all tasks if None.
+
+    Yields:
+        tuple[int, dict]: The number of the next task, starting with
+            zero, and the task.
+    """
+    with open_task_file(file_name, "rb") as file_handle:
+        header = _check_binary_header(
+            file_name, file_handle.read(BINARY_HEADER.itemsize)
+        )
+        dtype = numpy.dtype(f"<i{header['coef_bytes']}")
+        no_tasks = int(header["no_tasks"])
+        table = numpy.frombuffer(
+            file_handle.read(no_tasks * BINARY_TABLE.itemsize),
+            dtype=BINARY_TABLE,
+            count=no_tasks,
+        )
+
+        _check_task_nos(file_name, task_nos, no_tasks)
+
+        # The offsets of the arrays ascend, seeking only skips forward.
+        def get_coefficients(offset: int, count: int) -> ndarray:
+            file_handle.seek(offset)
+            return numpy.frombuffer(
+                file_handle.read(count * dtype.itemsize), dtype=dtype, count=count
+            )
+
+        for task_no in (
+            range(no_tasks) if task_nos is None else [no - 1 for no in task_nos]
+        ):
+            yield task_no, _get_binary_task(get_coefficients, table[task_no], task_no)
+
+
+# ------------------------------------------------------------------
+# Read the tasks one by one from a binary task file.
+# ------------------------------------------------------------------
+def _read_tasks_binary(file_name: str) -> Iterator[dict]:
+    """Read the tasks one by one from a binary task file.
+
+    The file is mapped into memory and the coefficients are provided as
+    NumPy arrays on the mapped file, so that nothing is parsed or
+    copied. A compressed file is decompressed while reading.
+
+    Args:
+        file_name (str): The name of the binary task file.
+
+    Yields:
+        dict: The next task.
+    """
+    if is_compressed(file_name):
+        for _, task in _read_binary_stream(file_name, None):
+            yield task
+        return
+
+    get_coefficients, table = _open_binary(file_name)
+
+    for task_no, entry in enumerate(table):
+        yield _get_binary_task(get_coefficients, entry, task_no)
+
+
+# ------------------------------------------------------------------
+# Read the tasks one by one from a JSON file.
+# ------------------------------------------------------------------
+def _read_tasks_json(file_name: str) -> Iterator[dict]:
+    """Read the tasks one by one from a JSON file.
+
+    The JSON file is read in blocks and the elements of the array
+    'tasks' are decoded and provided individually, so that only one
+    task at a time is held in memory.
+
+    Args:
+        file_name (str): The name of the JSON file.
+
+    Yields:
+        dict: The next task.
+    """
+    with open_task_file(
+        file_name, "rt", encoding=sds_glob.FILE_ENCODING_DEFAULT
+    ) as file_handle:
+        for _, _, task in _scan_json(file_handle):
+            yield task
+
+
+# ------------------------------------------------------------------
+# Decode the tasks one by one from a JSON file.
+# ------------------------------------------------------------------
+def _scan_json(file_handle: IO[str]) -> Iterator[tuple[int, int, dict]]:
+    """Decode the tasks one by one from a JSON file.
+
+    The elements of the array 'tasks' are decoded individually, all
+    other top-level members are skipped.
+
+    Args:
+        file_handle (IO[str]): The opened JSON file.
+
+    Yields:
+        tuple[int, int, dict]: The start and end position of the next
+            task in the file and the task.
+    """
+    buffer = _Buffer(file_handle)
+
+    buffer.expect("{")
+    if buffer.peek() == "}":
+        return
+
+    while True:
+        key = buffer.decode()
+        buffer.expect(":")
+
+        if key == sds_glob.JSON_NAME_TASKS:
+            buffer.expect("[")
+            if buffer.peek() == "]":
+                buffer.expect("]")
+            else:
+                while True:
+                    buffer.peek()
+                    start = buffer.position()
+                    task = buffer.decode()
+                    yield start, buffer.position(), task
+                    if buffer.peek() != ",":
+                        break
+                    buffer.expect(",")
+                buffer.expect("]")
+        else:
+            buffer.decode()
+
+        if buffer.peek() != ",":
+            break
+        buffer.expect(",")
+
+    buffer.expect("}")
+
+
+# ------------------------------------------------------------------
+# Check whether a task file is compressed.
+# ------------------------------------------------------------------
+def is_compressed(file_name: str) -> bool:
+    """Check whether a task file is compressed.
+
+    Args:
+        file_name (str): The name of the task file.
+
+    Returns:
+        bool: True if the extension of the file is '.gz' or '.xz'.
+    """
+    return os.path.splitext(file_name)[1] in (SUFFIX_GZIP, SUFFIX_XZ)
+
+
+# ------------------------------------------------------------------
+# Check whether a file is a manifest of shard files.
+# ------------------------------------------------------------------
+def is_manifest(file_name: str) -> bool:
+    """Check whether a file is a manifest of shard files.
+
+    A manifest is a JSON file whose first member is 'shards'.
+
+    Args:
+        file_name (str): The name of the file.
+
+    Returns:
+        bool: True if the file is a manifest.
+    """
+    with open_task_file(file_name, "rt", encoding="latin-1") as file_handle:
+        buffer = _Buffer(file_handle)
+
+        try:
+            buffer.expect("{")
+            return buffer.peek() == '"' and buffer.decode() == sds_glob.JSON_NAME_SHARDS
+        except json.JSONDecodeError:
+            return False
+
+
+# ------------------------------------------------------------------
+# Open a task file, compressed according to its extension.
+# ------------------------------------------------------------------
+def open_task_file(
+    file_name: str,
+    mode: str = "rb",
+    encoding: str | None = None,
+    newline: str | None = None,
+) -> IO:
+    """Open a task file, compressed according to its extension.
+
+    A file with the extension '.gz' is compressed with gzip, a file
+    with the extension '.xz' with xz, any other file is not compressed.
+    The data is compressed and decompressed while it is written and
+    read, positions and seeking refer to the uncompressed data.
+
+    Args:
+        file_name (str): The name of the task file.
+        mode (str): The mode as for 'open()', e.g. 'rt' or 'wb'.
+        encoding (str, optional): The encoding in text mode.
+        newline (str, optional): The newline translation in text mode.
+
+    Returns:
+        IO: The opened file.
+    """
+    extension = os.path.splitext(file_name)[1]
+
+    # In binary mode the compressed files are no 'IO' for the type
+    # checker, although they provide its interface.
+    if extension == SUFFIX_GZIP:
+        return cast(
+            IO,
+            gzip.open(
+                file_name,
+                mode,
+                compresslevel=_GZIP_LEVEL,
+                encoding=encoding,
+                newline=newline,
+            ),
+        )
+
+    if extension == SUFFIX_XZ:
+        return cast(IO, lzma.open(file_name, mode, encoding=encoding, newline=newline))
+
+    # pylint: disable=consider-using-with
+    return open(file_name, mode, encoding=encoding, newline=newline)
+
+
+# ------------------------------------------------------------------
+# Parse a selection of tasks.
+# ------------------------------------------------------------------
+def parse_task_selection(tasks: str) -> list[int]:
+    """Parse a selection of tasks.
+
+    The selection consists of task numbers and ranges of task numbers,
+    separated by commas, e.g. '120-180,500'.
+
+    Args:
+        tasks (str): The selection of tasks.
+
+    Returns:
+        list[int]: The selected task numbers, starting with one, in
+            ascending order.
+    """
+    task_nos: set[int] = set()
+
+    for part in tasks.split(","):
+        bounds = part.strip().split("-")
+
+        if len(bounds) > 2 or not all(bound.strip().isdigit() for bound in bounds):
+            task_nos = set()
+            break
+
+        first, last = int(bounds[0]), int(bounds[-1])
+        if first < 1 or last < first:
+            task_nos = set()
+            break
+
+        task_nos.update(range(first, last + 1))
+
+    if not task_nos:
+        # ERROR.00.921 The task selection '{tasks}' is invalid
+        utils.terminate_fatal(sds_glob.ERROR_00_921.replace("{tasks}", tasks))
+
+    return sorted(task_nos)
+
+
+# ------------------------------------------------------------------
+# Read a manifest of shard files.
+# ------------------------------------------------------------------
+def read_manifest(file_name: str) -> tuple[str, list[tuple[str, int, int]]]:
+    """Read a manifest of shard files.
+
+    The manifest created by the 'Generator' class looks as follows:
+
+        {"shards": [{"fileName": "polynom_data.001.json",
+                     "firstTaskNo": 1,
+                     "moTasks": 999},
+                    ...],
+         "format": "json",
+         "moTasks": 999}
+
+    The names of the shard files are relative to the directory of the
+    manifest.
+
+    Args:
+        file_name (str): The name of the manifest.
+
+    Returns:
+        tuple[str, list[tuple[str, int, int]]]: The format of the shard
+            files and per shard file its name, the number of its first
+            task, starting with zero, and its number of tasks.
+    """
+    with open_task_file(
+        file_name, "rt", encoding=sds_glob.FILE_ENCODING_DEFAULT
+    ) as file_handle:
+        manifest = json.load(file_handle)
+
+    shards = []
+
+    for shard in manifest[sds_glob.JSON_NAME_SHARDS]:
+        shard_file_name = os.path.join(
+            os.path.dirname(file_name), shard[sds_glob.JSON_NAME_FILE_NAME]
+        )
+
+        if not os.path.isfile(shard_file_name):
+            # ERROR.00.902 The specified JSON file {file_name} does not exist
+            utils.terminate_fatal(
+                sds_glob.ERROR_00_902.replace("{file_name}", shard_file_name)
+            )
+
+        shards.append(
+            (
+                shard_file_name,
+                shard[sds_glob.JSON_NAME_TASK_NO_FIRST] - 1,
+                shard[sds_glob.JSON_NAME_NO_TASKS],
+            )
+        )
+
+    return manifest[sds_glob.JSON_NAME_FORMAT], shards
+
+
+# ------------------------------------------------------------------
+# Read selected tasks from a task file.
+# ------------------------------------------------------------------
+def read_selected_tasks(
+    file_name: str, file_format: str, task_nos: list[int]
+) -> Iterator[tuple[int, dict]]:
+    """Read selected tasks from a task file.
+
+    The selected tasks are read directly at their position in the file,
+    without reading the other tasks. A binary task file has the
+    positions in its table, for a JSON file they are taken from its
+    index file, which is created on the first use. A compressed file is
+    decompressed up to the last selected task, the other tasks are
+    decompressed but not decoded.
+
+    Args:
+        file_name (str): The name of the task file.
+        file_format (str): The format of the task file, 'json' or
+            'binary'.
+        task_nos (list[int]): The selected task numbers, starting with
+            one, in ascending order.
+
+    Yields:
+        tuple[int, dict]: The number of the next task, starting with
+            zero, and the task.
+    """
+    if file_format == sds_glob.ARG_FORMAT_BINARY:
+        if is_compressed(file_name):
+            yield from _read_binary_stream(file_name, task_nos)
+            return
+
+        get_coefficients, table = _open_binary(file_name)
+        _check_task_nos(file_name, task_nos, len(table))
+
+        for task_no in task_nos:
+            yield task_no - 1, _get_binary_task(
+                get_coefficients, table[task_no - 1], task_no - 1
+            )
+        return
+
+    index = _get_index(file_name)
+    _check_task_nos(file_name, task_nos, len(index))
+
+    with open_task_file(file_name, "rb") as file_handle:
+        for task_no in task_nos:
+            file_handle.seek(int(index[task_no - 1]["offset"]))
+            yield task_no - 1, json.loads(
+                file_handle.read(int(index[task_no - 1]["size"]))
+            )
+
+
+# ------------------------------------------------------------------
+# Read the tasks of shard files one by one.
+# ------------------------------------------------------------------
+def read_shard_tasks(
+    shards: list[tuple[str, int, int]],
+    file_format: str,
+    task_nos: list[int] | None = None,
+) -> Iterator[tuple[int, dict]]:
+    """Read the tasks of shard files one by one.
+
+    The shard files are read one after the other, either completely or
+    only the selected tasks.
+
+    Args:
+        shards (list[tuple[str, int, int]]): The shard files from the
+            manifest.
+        file_format (str): The format of the shard files, 'json' or
+            'binary'.
+        task_nos (list[int], optional): The selected task numbers,
+            starting with one, in ascending order. Defaults to all
+            tasks.
+
+    Yields:
+        tuple[int, dict]: The number of the next task, starting with
+            zero, and the task.
+    """
+    _check_task_nos(
+        ", ".join(file_name for file_name, _, _ in shards),
+        task_nos,
+        sum(shard_no_tasks for _, _, shard_no_tasks in shards),
+    )
+
+    for file_name, task_no_first, shard_no_tasks in shards:
+        if task_nos is None:
+            yield from enumerate(read_tasks(file_name, file_format), task_no_first)
+            continue
+
+        shard_task_nos = [
+            task_no - task_no_first
+            for task_no in task_nos
+            if task_no_first < task_no <= task_no_first + shard_no_tasks
+        ]
+
+        if shard_task_nos:
+            for task_no, task in read_selected_tasks(
+                file_name, file_format, shard_task_nos
+            ):
+                yield task_no_first + task_no, task
+
+
+# ------------------------------------------------------------------
+# Read the tasks one by one from a task file.
+# ------------------------------------------------------------------
+def read_tasks(
+    file_name: str, file_format: str = sds_glob.ARG_FORMAT_JSON
+) -> Iterator[dict]:
+    """Read the tasks one by one from a task file.
+
+    The task file created by the 'Generator' class is either a JSON
+    file or a binary task file. The tasks of both formats have the same
+    structure, except that the coefficients of a binary task file are
+    NumPy arrays instead of lists.
+
+    Args:
+        file_name (str): The name of the task file.
+        file_format (str): The format of the task file, 'json' or
+            'binary'.
+
+    Returns:
+        Iterator[dict]: The tasks.
+    """
+    if file_format == sds_glob.ARG_FORMAT_BINARY:
+        return _read_tasks_binary(file_name)
+
+    return _read_tasks_json(file_name)
+
+
+# ------------------------------------------------------------------
+# Write the index file of a JSON file.
+# ------------------------------------------------------------------
+def write_index(file_name: str, index: ndarray) -> None:
+    """Write the index file of a JSON file.
+
+    The index file gets the name of the JSON file with the suffix
+    '.idx' and records the size and the modification time of the JSON
+    file, which has to be complete.
+
+    Args:
+        file_name (str): The name of the JSON file.
+        index (ndarray): The byte range of every task.
+    """
+    stat = os.stat(file_name)
+
+    header = numpy.zeros(1, dtype=INDEX_HEADER)
+    header["magic"] = INDEX_MAGIC
+    header["version"] = INDEX_VERSION
+    header["file_size"] = stat.st_size
+    header["file_mtime_ns"] = stat.st_mtime_ns
+    header["no_tasks"] = len(index)
+
+    with open(file_name + INDEX_SUFFIX, "wb") as file_handle:
+        file_handle.write(header.tobytes())
+        file_handle.write(numpy.ascontiguousarray(index, dtype=INDEX_ENTRY).tobytes())
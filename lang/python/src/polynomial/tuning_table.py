@@ -0,0 +1,144 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Crossover table of the method 'auto'."""
+from __future__ import annotations
+
+import configparser
+import math
+import os
+
+import sds_glob  # type: ignore
+import utils  # type: ignore
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Candidate methods of the method 'auto'.
+AUTO_METHODS = (
+    sds_glob.ARG_METHOD_FFT,
+    sds_glob.ARG_METHOD_KARATSUBA,
+    sds_glob.ARG_METHOD_KRONECKER,
+    sds_glob.ARG_METHOD_NTT,
+    sds_glob.ARG_METHOD_NUMPY,
+    sds_glob.ARG_METHOD_RFFT,
+    sds_glob.ARG_METHOD_SIMPLE,
+    sds_glob.ARG_METHOD_TOOM3,
+)
+
+# Default crossover table if no tuning file exists: the methods ranked
+# by speed per coefficient bits and (balanced) operand size.
+_TABLE_DEFAULT: dict[tuple[int, int], list[str]] = {
+    (14, 16): ["simple", "karatsuba", "toom3", "kronecker", "numpy", "rfft"],
+    (14, 64): ["simple", "kronecker", "numpy", "rfft", "karatsuba", "toom3"],
+    (14, 256): ["rfft", "numpy", "kronecker", "simple", "karatsuba", "toom3"],
+    (14, 1024): ["rfft", "kronecker", "ntt", "toom3", "karatsuba", "simple"],
+    (31, 16): ["simple", "kronecker", "karatsuba", "toom3", "rfft", "ntt"],
+    (31, 64): ["kronecker", "rfft", "simple", "karatsuba", "toom3", "ntt"],
+    (31, 256): ["rfft", "kronecker", "ntt", "simple", "karatsuba", "toom3"],
+    (63, 16): ["simple", "kronecker", "karatsuba", "toom3", "ntt", "rfft"],
+    (63, 256): ["kronecker", "simple", "karatsuba", "toom3", "ntt", "rfft"],
+}
+
+# Crossover tables per tuning file, loaded once.
+_tables: dict[str, dict[tuple[int, int], list[str]]] = {}
+
+
+# ------------------------------------------------------------------
+# Provide the ranking of the methods for two polynomials.
+# ------------------------------------------------------------------
+def get_ranking(coefficients_1, coefficients_2) -> list[str]:
+    """Provide the ranking of the methods for two polynomials.
+
+    The crossover table is loaded once from the tuning file created by
+    the action 'calibrate'. Without tuning file, the default table is
+    used. The entry is selected with the bit length of the largest
+    coefficient and the balanced operand size, i.e. the geometric mean
+    of both polynomial sizes. Between the calibrated grid points the
+    next larger one applies.
+
+    Args:
+        coefficients_1: The coefficients of polynomial 1, a list or an
+            integer array.
+        coefficients_2: The coefficients of polynomial 2, a list or an
+            integer array.
+
+    Returns:
+        list[str]: The methods, fastest first.
+    """
+    table = _tables.get(sds_glob.TUNING_FILE)
+    if table is None:
+        table = load_tuning_file(sds_glob.TUNING_FILE)
+        _tables[sds_glob.TUNING_FILE] = table
+
+    size = math.isqrt(len(coefficients_1) * len(coefficients_2))
+
+    coef_bits = max(
+        utils.get_abs_max(coefficients_1), utils.get_abs_max(coefficients_2)
+    ).bit_length()
+
+    coef_bits_all = sorted({key[0] for key in table})
+    coef_bits_key = next(
+        (bits for bits in coef_bits_all if bits >= coef_bits), coef_bits_all[-1]
+    )
+
+    sizes_all = sorted(key[1] for key in table if key[0] == coef_bits_key)
+    size_key = next((key for key in sizes_all if key >= size), sizes_all[-1])
+
+    return table[(coef_bits_key, size_key)]
+
+
+# ------------------------------------------------------------------
+# Load the crossover table of the method 'auto'.
+# ------------------------------------------------------------------
+def load_tuning_file(file_name: str) -> dict[tuple[int, int], list[str]]:
+    """Load the crossover table of the method 'auto'.
+
+    The tuning file is created by the action 'calibrate' and must be in
+    the same format as the 'setup.cfg' file. Example:
+
+        [auto]
+        14_256 = kronecker,ntt,rfft,karatsuba,toom3,simple,numpy,fft
+
+    The key consists of the bit length of the largest coefficient and
+    the balanced operand size, the value is the ranking of the methods,
+    fastest first.
+
+    Args:
+        file_name (str): The name of the tuning file.
+
+    Returns:
+        dict[tuple[int, int], list[str]]: The crossover table, the
+            default table if the tuning file does not exist.
+    """
+    if not os.path.isfile(file_name):
+        return _TABLE_DEFAULT
+
+    config_parser = configparser.ConfigParser()
+    config_parser.read(file_name)
+
+    table: dict[tuple[int, int], list[str]] = {}
+
+    if config_parser.has_section(sds_glob.TUNING_SECTION):
+        for key, value in config_parser.items(sds_glob.TUNING_SECTION):
+            methods = [method.strip() for method in value.split(",")]
+            key_parts = key.split("_")
+            if (
+                len(key_parts) != 2
+                or not all(part.isdigit() for part in key_parts)
+                or not all(method in AUTO_METHODS for method in methods)
+            ):
+                # ERROR.00.913 Illegal entry '{key} = {value}' in the
+                # tuning file '{file}'
+                utils.terminate_fatal(
+                    sds_glob.ERROR_00_913.replace("{key}", key)
+                    .replace("{value}", value)
+                    .replace("{file}", file_name)
+                )
+            table[(int(key_parts[0]), int(key_parts[1]))] = methods
+
+    if not table:
+        return _TABLE_DEFAULT
+
+    return table
@@ -7,8 +7,10 @@ import datetime
 import logging
 import logging.config
 
+import numpy
 import sds_glob
 import yaml
+from numpy import ndarray
 from polynomial_error import PolynomialError
 
 # ------------------------------------------------------------------
@@ -20,6 +22,46 @@ _LOGGER_FATAL_TAIL = " <===== FATAL ERROR"
 _LOGGER_PROGRESS_UPDATE = "Progress update "
 
 
+# ------------------------------------------------------------------
+# Eliminate the leading zero terms and determine the final degree
+# of the polynomial product.
+# ------------------------------------------------------------------
+def delete_leading_zero_terms(result) -> ndarray:
+    """Eliminate the leading zero terms and determine the final degree."""
+    zeros = []
+
+    for degree in range(len(result) - 1, -1, -1):
+        if result[degree] == 0:
+            zeros.append(degree)
+        else:
+            break
+
+    if zeros:
+        result = numpy.delete(result, zeros)
+
+    return result
+
+
+# ------------------------------------------------------------------
+# Determine the largest absolute coefficient of a polynomial.
+# ------------------------------------------------------------------
+def get_abs_max(coefficients) -> int:
+    """Determine the largest absolute coefficient of a polynomial.
+
+    Args:
+        coefficients: The coefficients of the polynomial, a list or an
+            array of a binary task file.
+
+    Returns:
+        int: The largest absolute coefficient.
+    """
+    if isinstance(coefficients, ndarray):
+        # Without 'abs', which overflows for the smallest integer.
+        return max(-int(coefficients.min()), int(coefficients.max()))
+
+    return int(max(map(abs, coefficients)))
+
+
 # -----------------------------------------------------------------------------
 # Initialising the logging functionality.
 # -----------------------------------------------------------------------------
@@ -3,7 +3,10 @@
 # PUBLIC LICENSE, that can be found in the LICENSE.md file.
 
 """Module stub file."""
+from numpy import ndarray
 
+def delete_leading_zero_terms(result) -> ndarray: ...
+def get_abs_max(coefficients) -> int: ...
 def initialise_logger() -> None: ...
 def progress_msg(msg: str) -> None: ...
 def progress_msg_core(msg: str) -> None: ...
@@ -0,0 +1,420 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Verification of the products of the polynomial multiplication tasks."""
+from __future__ import annotations
+
+import math
+from typing import Any
+
+import numpy
+import sds_glob  # type: ignore
+import utils  # type: ignore
+from numpy import ndarray
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Maximum number of elements of the power table of the probabilistic
+# verification, which is also the maximum number of coefficients per
+# chunk of its Horner evaluation.
+_CHUNK_ELEMENTS = 2**20
+
+# Range of the random primes of the probabilistic verification: the
+# product of two residues fits into int64. The range contains more than
+# 2**25 primes.
+_NO_PRIMES_LOG2 = 25
+_PRIME_MAX = 2**31
+_PRIME_MIN = 2**30
+
+
+class Verifier:
+    """Verification of the products of the polynomial multiplication
+    tasks."""
+
+    # ------------------------------------------------------------------
+    # Initialise the instance.
+    # ------------------------------------------------------------------
+    def __init__(self, verify: str) -> None:
+        """Initialise the instance.
+
+        The primes and points of the probabilistic verification are
+        drawn on demand, once per instance.
+
+        Args:
+            verify (str): The verification mode: 'first' reports only
+                the first difference of a product, 'all' and
+                'probabilistic' report all differences.
+        """
+        self._points = numpy.zeros(0, dtype=numpy.int64)
+        self._powers = numpy.zeros((0, 0), dtype=numpy.int64)
+        self._primes = numpy.zeros(0, dtype=numpy.int64)
+        self._random_generator = numpy.random.default_rng()
+        self._shifts = numpy.zeros(0, dtype=numpy.int64)
+        self._verify = verify
+
+    # ------------------------------------------------------------------
+    # Evaluate a polynomial in the rounds of the verification.
+    # ------------------------------------------------------------------
+    def _evaluate(self, coefficients: list[int] | ndarray, no_rounds: int) -> ndarray:
+        """Evaluate a polynomial in the rounds of the verification.
+
+        The coefficients are processed in chunks of the width of the
+        power table, from the highest chunk to the lowest one, so that
+        the chunk values are combined by a Horner scheme with the power
+        'width' of the point of every round.
+
+        Args:
+            coefficients (list[int] | ndarray): The coefficients of the
+                polynomial.
+            no_rounds (int): The number of rounds.
+
+        Returns:
+            ndarray: The value of the polynomial in every round.
+        """
+        primes = self._primes[:no_rounds]
+        powers = self._powers[:no_rounds]
+        shifts = self._shifts[:no_rounds]
+        width = powers.shape[1]
+
+        coefficients = numpy.asarray(coefficients)
+        values = numpy.zeros(no_rounds, dtype=numpy.int64)
+
+        for start in range((len(coefficients) - 1) // width * width, -1, -width):
+            end = start + width
+            residues = coefficients[start:end] % primes[:, numpy.newaxis]
+            if residues.dtype == object:
+                residues = residues.astype(numpy.int64)
+            values = (
+                values * shifts
+                + (
+                    powers[:, : residues.shape[1]] * residues % primes[:, numpy.newaxis]
+                ).sum(axis=1)
+            ) % primes
+
+        return values
+
+    # ------------------------------------------------------------------
+    # Provide the primes, points and powers of the verification rounds.
+    # ------------------------------------------------------------------
+    def _set_rounds(self, no_rounds: int) -> None:
+        """Provide the primes, points and powers of the verification rounds.
+
+        The primes and points are drawn once per instance and only
+        extended when a task needs more rounds. The width of the power
+        table is chosen so that the table never exceeds
+        '_CHUNK_ELEMENTS' elements, whatever the degree of the tasks.
+
+        Args:
+            no_rounds (int): The number of rounds of the current task.
+        """
+        available = len(self._primes)
+        if available >= no_rounds:
+            return
+
+        self._primes = numpy.concatenate(
+            (
+                self._primes,
+                _get_primes(self._random_generator, no_rounds - available),
+            )
+        )
+        self._points = self._random_generator.integers(1, self._primes)
+
+        width = max(1, _CHUNK_ELEMENTS // no_rounds)
+        self._powers = _get_powers(self._points, self._primes, width)
+        self._shifts = self._powers[:, -1] * self._points % self._primes
+
+    # ------------------------------------------------------------------
+    # Check the calculated product of a task.
+    # ------------------------------------------------------------------
+    def check_product(
+        self, task_no: int, result, expected: tuple[Any, int]
+    ) -> list[str]:
+        """Check the calculated product of a task.
+
+        The degree and all coefficients are compared with the product
+        in the task file in one comparison. With the verification mode
+        'first' only the first difference is reported.
+
+        Args:
+            task_no (int): The number of the task, starting with zero.
+            result: The calculated coefficients of the product.
+            expected (tuple[Any, int]): The coefficients and the degree
+                of the product in the task file.
+
+        Returns:
+            list[str]: The error messages of the differences.
+        """
+        prod_coeff, prod_degree = expected
+
+        result = numpy.asarray(result)
+
+        # Equal products need just one comparison in C, the arrays are
+        # only compared element by element to locate the differences.
+        if len(result) - 1 == prod_degree and (
+            numpy.array_equal(result, prod_coeff)
+            if isinstance(prod_coeff, ndarray)
+            else result.tolist() == prod_coeff
+        ):
+            return []
+
+        expected_coeff = numpy.asarray(prod_coeff)
+
+        differences = []
+
+        if len(result) - 1 != prod_degree:
+            # ERROR.00.915 Difference in task no. {task_no} got degree {got}
+            # instead of {instead}
+            differences.append(
+                sds_glob.ERROR_00_915.replace("{task_no}", str(task_no + 1))
+                .replace("{got}", str(len(result) - 1))
+                .replace("{instead}", str(prod_degree))
+            )
+
+        size = min(len(result), len(expected_coeff))
+
+        for degree in numpy.flatnonzero(result[:size] != expected_coeff[:size]):
+            # ERROR.00.911 Difference in task no. {task_no} degree {degree}
+            # got {got} instead of {instead}
+            differences.append(
+                sds_glob.ERROR_00_911.replace("{task_no}", str(task_no + 1))
+                .replace("{degree}", str(degree))
+                .replace("{got}", str(result[degree]))
+                .replace("{instead}", str(expected_coeff[degree]))
+            )
+            if self._verify == sds_glob.ARG_VERIFY_FIRST:
+                break
+
+        return differences
+
+    # ------------------------------------------------------------------
+    # Check the product of a task probabilistically.
+    # ------------------------------------------------------------------
+    def check_product_probabilistic(
+        self, task_no: int, operands: tuple[Any, Any], expected: tuple[Any, int]
+    ) -> list[str]:
+        """Check the product of a task probabilistically.
+
+        The product in the task file is checked without calculating it:
+        in every round all three polynomials are evaluated at a random
+        point modulo a random prime, and the product of the first two
+        values is compared with the third one. The primes and the points
+        are drawn once per instance, so that nobody can construct a
+        wrong product which passes. The number of rounds is chosen to
+        keep the error probability below 2**-verify_error_bits, see
+        '_get_no_rounds'. The degree is checked exactly. The check is
+        linear in the number of coefficients and its memory does not
+        depend on the degree.
+
+        Args:
+            task_no (int): The number of the task, starting with zero.
+            operands (tuple[Any, Any]): The coefficients of both
+                polynomials.
+            expected (tuple[Any, int]): The coefficients and the degree
+                of the product in the task file.
+
+        Returns:
+            list[str]: The error messages of the differences.
+        """
+        poly_1, poly_2 = operands
+        prod_coeff, prod_degree = expected
+
+        differences = []
+
+        degree = _get_degree(poly_1) + _get_degree(poly_2)
+        if degree != prod_degree or len(prod_coeff) != degree + 1:
+            # ERROR.00.915 Difference in task no. {task_no} got degree {got}
+            # instead of {instead}
+            differences.append(
+                sds_glob.ERROR_00_915.replace("{task_no}", str(task_no + 1))
+                .replace("{got}", str(degree))
+                .replace(
+                    "{instead}",
+                    str(prod_degree if prod_degree != degree else len(prod_coeff) - 1),
+                )
+            )
+
+        no_rounds = _get_no_rounds(poly_1, poly_2, prod_coeff)
+        self._set_rounds(no_rounds)
+
+        primes = self._primes[:no_rounds]
+
+        values_got = (
+            self._evaluate(poly_1, no_rounds)
+            * self._evaluate(poly_2, no_rounds)
+            % primes
+        )
+        values_prod = self._evaluate(prod_coeff, no_rounds)
+
+        for round_no in numpy.flatnonzero(values_got != values_prod)[:1]:
+            # ERROR.00.918 Difference in task no. {task_no} at the point
+            # {point} modulo {prime} got {got} instead of {instead}
+            differences.append(
+                sds_glob.ERROR_00_918.replace("{task_no}", str(task_no + 1))
+                .replace("{point}", str(self._points[round_no]))
+                .replace("{prime}", str(primes[round_no]))
+                .replace("{got}", str(values_got[round_no]))
+                .replace("{instead}", str(values_prod[round_no]))
+            )
+
+        return differences
+
+
+# ------------------------------------------------------------------
+# Determine the degree of a polynomial.
+# ------------------------------------------------------------------
+def _get_degree(coefficients: list[int] | ndarray) -> int:
+    """Determine the degree of a polynomial.
+
+    Args:
+        coefficients (list[int] | ndarray): The coefficients of the
+            polynomial.
+
+    Returns:
+        int: The degree without leading zero terms.
+    """
+    degree = len(coefficients) - 1
+
+    while degree > 0 and coefficients[degree] == 0:
+        degree -= 1
+
+    return degree
+
+
+# ------------------------------------------------------------------
+# Determine the number of rounds of the verification.
+# ------------------------------------------------------------------
+def _get_no_rounds(poly_1, poly_2, prod_coeff) -> int:
+    """Determine the number of rounds of the verification.
+
+    A wrong product passes a round only if the prime divides every
+    coefficient of the difference to the correct product, or if the
+    point is a root of the difference modulo the prime. A coefficient
+    of 'coef_bits' bits has at most coef_bits / 30 prime factors in the
+    range of the primes, and by the Schwartz-Zippel lemma there are at
+    most 'size' roots, so a round fails with a probability of at most
+    (coef_bits / 30 + 1) / 2**25 + size / 2**30.
+
+    Args:
+        poly_1: The coefficients of the first polynomial.
+        poly_2: The coefficients of the second polynomial.
+        prod_coeff: The coefficients of the product in the task file.
+
+    Returns:
+        int: The number of rounds.
+    """
+    size = max(len(poly_1), len(poly_2), len(prod_coeff))
+    coef_bits = (
+        min(len(poly_1), len(poly_2))
+        * utils.get_abs_max(poly_1)
+        * utils.get_abs_max(poly_2)
+        + utils.get_abs_max(prod_coeff)
+    ).bit_length()
+
+    bits_per_round = max(
+        1,
+        int(-math.log2((coef_bits // 30 + 1) / 2**_NO_PRIMES_LOG2 + size / _PRIME_MIN)),
+    )
+
+    error_bits = sds_glob.inst_config.get_config_value(
+        sds_glob.CONFIG_PARAM_VERIFY_ERROR_BITS
+    )
+
+    return -(-error_bits // bits_per_round)
+
+
+# ------------------------------------------------------------------
+# Calculate the powers of several points modulo their primes.
+# ------------------------------------------------------------------
+def _get_powers(points: ndarray, primes: ndarray, size: int) -> ndarray:
+    """Calculate the powers of several points modulo their primes.
+
+    The table of the powers is doubled in every step, so that the
+    evaluation of a chunk of a polynomial is a single array operation.
+
+    Args:
+        points (ndarray): The points.
+        primes (ndarray): The prime of every point.
+        size (int): The number of powers per point.
+
+    Returns:
+        ndarray: The powers 0 to size - 1 of every point, one row per
+            point.
+    """
+    powers = numpy.ones((len(points), size), dtype=numpy.int64)
+
+    # The power 'length' of every point.
+    factor = points % primes
+    length = 1
+
+    while length < size:
+        count = min(length, size - length)
+        powers[:, length:][:, :count] = (
+            powers[:, :count] * factor[:, numpy.newaxis] % primes[:, numpy.newaxis]
+        )
+        factor = factor * factor % primes
+        length *= 2
+
+    return powers
+
+
+# ------------------------------------------------------------------
+# Draw random primes for the verification.
+# ------------------------------------------------------------------
+def _get_primes(random_generator, count: int) -> ndarray:
+    """Draw random primes for the verification.
+
+    Args:
+        random_generator (Generator): The random number generator.
+        count (int): The number of primes.
+
+    Returns:
+        ndarray: The primes between '_PRIME_MIN' and '_PRIME_MAX'.
+    """
+    primes: list[int] = []
+
+    while len(primes) < count:
+        candidate = int(random_generator.integers(_PRIME_MIN, _PRIME_MAX))
+        if _is_prime(candidate):
+            primes.append(candidate)
+
+    return numpy.array(primes, dtype=numpy.int64)
+
+
+# ------------------------------------------------------------------
+# Test whether a number below 2**32 is a prime.
+# ------------------------------------------------------------------
+def _is_prime(number: int) -> bool:
+    """Test whether a number below 2**32 is a prime.
+
+    The Miller-Rabin test with the bases 2, 7 and 61 is deterministic
+    for all numbers below 4,759,123,141.
+
+    Args:
+        number (int): The number, greater than 61.
+
+    Returns:
+        bool: True if the number is a prime.
+    """
+    if number % 2 == 0:
+        return False
+
+    exponent = number - 1
+    no_squares = 0
+    while exponent % 2 == 0:
+        exponent //= 2
+        no_squares += 1
+
+    for base in (2, 7, 61):
+        value = pow(base, exponent, number)
+        if value in (1, number - 1):
+            continue
+        for _ in range(no_squares - 1):
+            value = value * value % number
+            if value == number - 1:
+                break
+        else:
+            return False
+
+    return True
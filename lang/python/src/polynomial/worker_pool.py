@@ -0,0 +1,139 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""Processing of jobs in chunks with a pool of worker processes."""
+from __future__ import annotations
+
+import collections
+import contextlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable
+from typing import Iterable
+from typing import Iterator
+
+import sds_glob  # type: ignore
+
+# ------------------------------------------------------------------
+# Global constants.
+# ------------------------------------------------------------------
+# Number of coefficients per chunk of tasks of a worker process and
+# number of chunks per worker process submitted ahead of the
+# consumption of the results.
+CHUNK_ELEMENTS = 2**20
+CHUNKS_AHEAD = 2
+
+# Environment variables limiting the threads of the NumPy / BLAS
+# libraries to one per worker process.
+_THREAD_VARS = (
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+)
+
+# Serialises the changes of the environment variables, as the action
+# 'stream' runs two process pools in different threads.
+_THREAD_VARS_LOCK = threading.Lock()
+
+
+# ------------------------------------------------------------------
+# Initialise a worker process.
+# ------------------------------------------------------------------
+def _init_worker(config) -> None:
+    """Initialise a worker process.
+
+    The worker processes are started with the thread limits of
+    '_THREAD_VARS' in their environment and take over the
+    configuration parameters of the parent process.
+
+    Args:
+        config (sds_config.Config): The configuration of the parent
+            process.
+    """
+    sds_glob.inst_config = config
+
+
+# ------------------------------------------------------------------
+# Limit the threads of the worker processes spawned meanwhile.
+# ------------------------------------------------------------------
+@contextlib.contextmanager
+def _limit_threads() -> Iterator[None]:
+    """Limit the threads of the worker processes spawned meanwhile.
+
+    The process pool spawns its worker processes on the submission of
+    the jobs, these inherit the environment variables of
+    '_THREAD_VARS' set to one. Afterwards the environment variables
+    are restored.
+    """
+    with _THREAD_VARS_LOCK:
+        environ_saved = {name: os.environ.get(name) for name in _THREAD_VARS}
+        os.environ.update({name: "1" for name in _THREAD_VARS})
+
+        try:
+            yield
+        finally:
+            for name, value in environ_saved.items():
+                if value is None:
+                    os.environ.pop(name, None)
+                else:
+                    os.environ[name] = value
+
+
+# ------------------------------------------------------------------
+# Process the jobs, with a process pool if requested.
+# ------------------------------------------------------------------
+def map_ordered(function: Callable, jobs: Iterable[tuple], workers: int) -> Iterator:
+    """Process the jobs, with a process pool if requested.
+
+    With one worker process the jobs are processed one after another
+    in this process. With more worker processes the jobs are
+    distributed over a process pool, at most 'CHUNKS_AHEAD' jobs per
+    worker process are submitted ahead, so that the memory stays
+    bounded independent of the number of jobs. The worker processes
+    are spawned with one NumPy / BLAS thread each to avoid the
+    oversubscription of the cores. The results are provided in job
+    order in any case; after an error, the jobs not yet started are
+    cancelled.
+
+    Args:
+        function (Callable): The function processing a job, a
+            module-level function or a static method, called with the
+            arguments of the job.
+        jobs (Iterable[tuple]): The arguments of the jobs.
+        workers (int): The number of worker processes.
+
+    Yields:
+        The results of the jobs in job order.
+    """
+    if workers == 1:
+        for job in jobs:
+            yield function(*job)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(sds_glob.inst_config,),
+    ) as executor:
+        futures: collections.deque = collections.deque()
+
+        try:
+            for job in jobs:
+                with _limit_threads():
+                    futures.append(executor.submit(function, *job))
+
+                if len(futures) >= workers * CHUNKS_AHEAD:
+                    yield futures.popleft().result()
+
+            while futures:
+                yield futures.popleft().result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
@@ -0,0 +1,108 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""benchmark: coverage testing."""
+import csv
+import json
+import os
+
+from polynomial import benchmark
+from polynomial import sds_glob
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test case: Benchmark() - Create an instance.
+# -----------------------------------------------------------------------------
+def test_benchmark(tmp_path):
+    """Test case: Benchmark() - Create an instance."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "benchmark.json")
+
+    inst_config = benchmark.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14, 62])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 3)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 1)
+
+    benchmark.Benchmark(file_name)
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14, 31])
+    inst_config.set_config_value(
+        sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16, 256, 4096]
+    )
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 10)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 2)
+
+    with open(file_name, "r", encoding="utf-8") as file_handle:
+        results = json.load(file_handle)
+
+    assert results["warmups"] == 1
+    assert results["repetitions"] == 3
+
+    methods = {(result["coefBits"], result["method"]) for result in results["results"]}
+    assert (14, "fft") in methods, "float64 method missing at 14 bits"
+    assert (62, "fft") not in methods, "inexact float64 method timed at 62 bits"
+    assert (62, "sparse") in methods, "method sparse missing at 62 bits"
+
+    for result in results["results"]:
+        assert len(result["durationsNs"]) == 3
+        assert result["minNs"] <= result["medianNs"] <= result["p95Ns"]
+
+    with open(
+        os.path.join(tmp_path, "benchmark.csv"), "r", encoding="utf-8", newline=""
+    ) as file_handle:
+        rows = list(csv.DictReader(file_handle))
+
+    assert len(rows) == len(results["results"])
+    assert rows[0]["method"] == "auto"
+    assert "durationsNs" not in rows[0]
+
+
+# -----------------------------------------------------------------------------
+# Test case: Benchmark() - Check the results against a baseline.
+# -----------------------------------------------------------------------------
+def test_benchmark_baseline(tmp_path):
+    """Test case: Benchmark() - Check the results against a baseline."""
+    # -------------------------------------------------------------------------
+    # pylint: disable=protected-access
+    file_name = os.path.join(tmp_path, "benchmark.json")
+
+    inst_config = benchmark.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 3)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 1)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_TOLERANCE, 0.25)
+    inst_config.set_config_value(
+        sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES,
+        {"fft": 0.5, "simple:16": 1.0},
+    )
+
+    assert benchmark.Benchmark._get_tolerance("fft", 16) == 0.5
+    assert benchmark.Benchmark._get_tolerance("simple", 16) == 1.0
+    assert benchmark.Benchmark._get_tolerance("simple", 256) == 0.25
+
+    benchmark.Benchmark(file_name)
+
+    # With 3 repetitions no slowdown is significant, and the baseline
+    # file may also be the result file.
+    benchmark.Benchmark(file_name, baseline=file_name)
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14, 31])
+    inst_config.set_config_value(
+        sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16, 256, 4096]
+    )
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 10)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 2)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_TOLERANCE, 0.25)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES, {})
+
+    assert benchmark.Benchmark._get_p_value([1, 2, 3, 4, 5], [6, 7, 8, 9, 10]) < 0.01
+    assert benchmark.Benchmark._get_p_value([6, 7, 8, 9, 10], [1, 2, 3, 4, 5]) > 0.99
+    assert 0.4 < benchmark.Benchmark._get_p_value([5, 5, 5], [5, 5, 5]) < 0.6
@@ -0,0 +1,78 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""benchmark: fatal testing."""
+
+import json
+import os
+
+import pytest
+
+from polynomial import benchmark
+from polynomial import sds_glob
+from polynomial.polynomial_error import PolynomialError
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# ------------------------------------------------------------------
+# ERROR.00.934 The specified baseline file {file_name} does not exist
+# ------------------------------------------------------------------
+def test_error_00_934(tmp_path):
+    """Test ERROR_00_934."""
+    with pytest.raises(PolynomialError) as expt:
+        benchmark.Benchmark(
+            os.path.join(tmp_path, "benchmark.json"),
+            baseline=os.path.join(tmp_path, "missing.json"),
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.934"
+    assert str(expt.value)[:12] == "ERROR.00.934"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.935 {no_regressions} regression(s) against the baseline
+# file {file_name}
+# ------------------------------------------------------------------
+def test_error_00_935(tmp_path):
+    """Test ERROR_00_935."""
+    baseline = os.path.join(tmp_path, "baseline.json")
+
+    with open(baseline, "w", encoding="utf-8") as file_handle:
+        json.dump(
+            {
+                "results": [
+                    {
+                        "method": sds_glob.ARG_METHOD_SIMPLE,
+                        "coefBits": 14,
+                        "degree": 16,
+                        "medianNs": 1,
+                        "durationsNs": [1] * 5,
+                    }
+                ]
+            },
+            file_handle,
+        )
+
+    inst_config = benchmark.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 5)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 0)
+
+    with pytest.raises(PolynomialError) as expt:
+        benchmark.Benchmark(os.path.join(tmp_path, "benchmark.json"), baseline=baseline)
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14, 31])
+    inst_config.set_config_value(
+        sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16, 256, 4096]
+    )
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 10)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 2)
+
+    assert expt.type == PolynomialError, "ERROR.00.935"
+    assert str(expt.value)[:12] == "ERROR.00.935"
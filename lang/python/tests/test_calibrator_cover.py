@@ -0,0 +1,68 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""calibrator: coverage testing."""
+import os
+
+from polynomial import calibrator
+from polynomial import sds_glob
+from polynomial import tuning_table
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test case: Calibrator() - Create an instance.
+# -----------------------------------------------------------------------------
+def test_calibrator(tmp_path):
+    """Test case: Calibrator() - Create an instance."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "tuning.cfg")
+
+    inst_config = calibrator.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_CALIBRATE_COEF_BITS, [14, 31])
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_CALIBRATE_SIZES, "16,256")
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_CALIBRATE_REPETITIONS, 1)
+
+    calibrator.Calibrator(file_name)
+
+    inst_config.set_config_value(
+        sds_glob.CONFIG_PARAM_CALIBRATE_SIZES, [16, 64, 256, 1024, 4096, 16384]
+    )
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_CALIBRATE_REPETITIONS, 3)
+
+    table = tuning_table.load_tuning_file(file_name)
+
+    assert (14, 16) in table, "calibration grid point (14, 16) missing"
+    assert table[(14, 16)], "ranking of calibration grid point (14, 16) empty"
+    assert (31, 256) in table, "calibration grid point (31, 256) missing"
+    assert (14, 64) not in table, "calibration grid point (14, 64) not configured"
+
+
+# -----------------------------------------------------------------------------
+# Test case: _prune_methods() - Keep methods that catch up with the size.
+# -----------------------------------------------------------------------------
+def test_calibrator_prune_methods():
+    """Test case: _prune_methods() - Keep methods that catch up with the size."""
+    # -------------------------------------------------------------------------
+    # pylint: disable=protected-access
+    prune_methods = calibrator.Calibrator._prune_methods
+
+    # At the first size no method is dropped.
+    methods, slowdowns = prune_methods(
+        {"fft": 1, "ntt": 25, "simple": 30}, ["fft", "ntt", "simple"], {}
+    )
+
+    assert methods == ["fft", "ntt", "simple"]
+
+    # The method 'ntt' catches up, the method 'simple' falls behind.
+    methods, slowdowns = prune_methods(
+        {"fft": 10, "ntt": 220, "simple": 900}, ["fft", "ntt", "simple"], slowdowns
+    )
+
+    assert methods == ["fft", "ntt"]
+    assert slowdowns["ntt"] == 22
@@ -3,10 +3,17 @@
 # PUBLIC LICENSE, that can be found in the LICENSE.md file.
 
 """generator: coverage testing."""
+import json
 import os
 
+import numpy
+import pytest
+
 from polynomial import generator
+from polynomial import kronecker_engine
+from polynomial import multiplier
 from polynomial import sds_glob
+from polynomial import task_reader
 
 # -----------------------------------------------------------------------------
 # Constants & Globals.
@@ -21,3 +28,372 @@ def test_generator():
     """Test case: Generator() - Create an instance."""
     # -------------------------------------------------------------------------
     generator.Generator(os.environ[sds_glob.POLYNOMIAL_FILE_NAME])
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - Multiply the generated tasks.
+# -----------------------------------------------------------------------------
+def test_generator_multiplier(tmp_path):
+    """Test case: Generator() - Multiply the generated tasks."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.json")
+
+    generator.Generator(file_name)
+
+    with open(file_name, "r", encoding=sds_glob.FILE_ENCODING_DEFAULT) as file_handle:
+        json_data = json.load(file_handle)
+
+    assert json_data[sds_glob.JSON_NAME_NO_TASKS] == len(
+        json_data[sds_glob.JSON_NAME_TASKS]
+    )
+
+    # The index file of the generator points to the tasks.
+    assert list(
+        task_reader.read_selected_tasks(
+            file_name,
+            sds_glob.ARG_FORMAT_JSON,
+            list(range(1, json_data[sds_glob.JSON_NAME_NO_TASKS] + 1)),
+        )
+    ) == list(enumerate(json_data[sds_glob.JSON_NAME_TASKS]))
+
+    multiplier.Multiplier(
+        task_reader.TaskFile(file_name), sds_glob.ARG_METHOD_KRONECKER
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - Multiply the tasks of a binary task file.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "method",
+    [
+        sds_glob.ARG_METHOD_BATCH,
+        sds_glob.ARG_METHOD_FFT,
+        sds_glob.ARG_METHOD_KRONECKER,
+        sds_glob.ARG_METHOD_NUMPY,
+    ],
+)
+def test_generator_multiplier_binary(method: str, tmp_path):
+    """Test case: Generator() - Multiply the tasks of a binary task file."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.bin")
+
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, 4711)
+
+    generator.Generator(file_name, file_format=sds_glob.ARG_FORMAT_BINARY)
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, -1)
+
+    tasks = list(task_reader.read_tasks(file_name, sds_glob.ARG_FORMAT_BINARY))
+
+    assert len(tasks) == sds_glob.inst_config.get_no_tasks()
+
+    for task in tasks:
+        coefficients = [
+            task[name][sds_glob.JSON_NAME_COEFFICIENTS]
+            for name in (
+                sds_glob.JSON_NAME_POLYNOM_1,
+                sds_glob.JSON_NAME_POLYNOM_2,
+                sds_glob.JSON_NAME_PRODUCT,
+            )
+        ]
+
+        assert coefficients[2].dtype in (numpy.dtype("<i4"), numpy.dtype("<i8"))
+        assert (
+            len(coefficients[2]) - 1
+            == task[sds_glob.JSON_NAME_PRODUCT][sds_glob.JSON_NAME_DEGREE]
+        )
+        assert len(coefficients[2]) == len(coefficients[0]) + len(coefficients[1]) - 1
+        assert numpy.array_equal(
+            numpy.convolve(coefficients[0], coefficients[1]), coefficients[2]
+        )
+
+    multiplier.Multiplier(
+        task_reader.TaskFile(file_name, sds_glob.ARG_FORMAT_BINARY), method
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - Multiply the tasks of shard files.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "file_format", [sds_glob.ARG_FORMAT_BINARY, sds_glob.ARG_FORMAT_JSON]
+)
+def test_generator_shards(file_format: str, tmp_path):
+    """Test case: Generator() - Multiply the tasks of shard files."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.json")
+
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_NO_SHARDS, 3)
+
+    generator.Generator(file_name, file_format=file_format)
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_NO_SHARDS, 1)
+
+    assert task_reader.is_manifest(file_name)
+
+    manifest_format, shards = task_reader.read_manifest(file_name)
+
+    assert manifest_format == file_format
+    assert [task_no_first for _, task_no_first, _ in shards] == [
+        shard_no * inst_config.get_no_tasks() // 3 for shard_no in range(3)
+    ]
+    assert [
+        task_no for task_no, _ in task_reader.read_shard_tasks(shards, file_format)
+    ] == list(range(inst_config.get_no_tasks()))
+
+    for workers in (1, 2):
+        multiplier.Multiplier(
+            task_reader.TaskFile(file_name),
+            sds_glob.ARG_METHOD_KRONECKER,
+            workers=workers,
+        )
+
+    multiplier.Multiplier(
+        task_reader.TaskFile(file_name, sds_glob.ARG_FORMAT_JSON, "1,3-4"),
+        sds_glob.ARG_METHOD_BATCH,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - Multiply the tasks of a compressed task file.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("suffix", [task_reader.SUFFIX_GZIP, task_reader.SUFFIX_XZ])
+@pytest.mark.parametrize(
+    "file_format", [sds_glob.ARG_FORMAT_BINARY, sds_glob.ARG_FORMAT_JSON]
+)
+def test_generator_compressed(file_format: str, suffix: str, tmp_path):
+    """Test case: Generator() - Multiply the tasks of a compressed task file."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data." + file_format + suffix)
+
+    generator.Generator(file_name, file_format=file_format)
+
+    # The file starts with the magic number of the compression format.
+    magic = b"\x1f\x8b" if suffix == task_reader.SUFFIX_GZIP else b"\xfd7zXZ\x00"
+
+    with open(file_name, "rb") as file_handle:
+        assert file_handle.read(len(magic)) == magic
+
+    tasks = list(task_reader.read_tasks(file_name, file_format))
+
+    assert len(tasks) == sds_glob.inst_config.get_no_tasks()
+    assert [
+        task[sds_glob.JSON_NAME_TASK_NO]
+        for _, task in task_reader.read_selected_tasks(file_name, file_format, [2, 3])
+    ] == [2, 3]
+
+    multiplier.Multiplier(
+        task_reader.TaskFile(file_name, file_format), sds_glob.ARG_METHOD_BATCH
+    )
+    multiplier.Multiplier(
+        task_reader.TaskFile(file_name, file_format, "1,3"),
+        sds_glob.ARG_METHOD_KRONECKER,
+        workers=2,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - The same seed produces the same task file.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "file_format", [sds_glob.ARG_FORMAT_BINARY, sds_glob.ARG_FORMAT_JSON]
+)
+def test_generator_seed(file_format: str, tmp_path):
+    """Test case: Generator() - The same seed produces the same task file."""
+    # -------------------------------------------------------------------------
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+
+    contents = []
+
+    for seed in (4711, 4711, 4712):
+        file_name = os.path.join(tmp_path, f"polynom_data_{len(contents)}.data")
+
+        inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, seed)
+        generator.Generator(file_name, file_format=file_format)
+
+        with open(file_name, "rb") as file_handle:
+            contents.append(file_handle.read())
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, -1)
+
+    assert contents[0] == contents[1]
+    assert contents[0] != contents[2]
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - The same task file with any number of workers.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "file_format", [sds_glob.ARG_FORMAT_BINARY, sds_glob.ARG_FORMAT_JSON]
+)
+def test_generator_workers(file_format: str, tmp_path):
+    """Test case: Generator() - The same task file with any number of workers."""
+    # -------------------------------------------------------------------------
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, 4711)
+
+    contents = []
+
+    for workers in (1, 2, 3):
+        file_name = os.path.join(tmp_path, f"polynom_data_{workers}.data")
+
+        generator.Generator(file_name, file_format=file_format, workers=workers)
+
+        with open(file_name, "rb") as file_handle:
+            contents.append(file_handle.read())
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, -1)
+
+    assert contents[0] == contents[1] == contents[2]
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - The tasks of the task queue and the task file.
+# -----------------------------------------------------------------------------
+def test_generator_stream(tmp_path):
+    """Test case: Generator() - The tasks of the task queue and the task file."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.bin")
+
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, 4711)
+
+    # An unbounded queue, the tasks are taken after the generation.
+    task_queue = task_reader.TaskQueue(0)
+
+    generator.Generator("", task_queue=task_queue)
+    generator.Generator(file_name, file_format=sds_glob.ARG_FORMAT_BINARY)
+
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, -1)
+
+    for (task_no, task), expected in zip(
+        task_queue.get_tasks(),
+        enumerate(task_reader.read_tasks(file_name, sds_glob.ARG_FORMAT_BINARY)),
+        strict=True,
+    ):
+        assert task_no == expected[0]
+        assert task[sds_glob.JSON_NAME_TASK_NO] == task_no + 1
+
+        for name in (
+            sds_glob.JSON_NAME_POLYNOM_1,
+            sds_glob.JSON_NAME_POLYNOM_2,
+            sds_glob.JSON_NAME_PRODUCT,
+        ):
+            assert (
+                task[name][sds_glob.JSON_NAME_DEGREE]
+                == expected[1][name][sds_glob.JSON_NAME_DEGREE]
+            )
+            assert numpy.array_equal(
+                task[name][sds_glob.JSON_NAME_COEFFICIENTS],
+                expected[1][name][sds_glob.JSON_NAME_COEFFICIENTS],
+            )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - Sparse polynomials in the sparse encoding.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "method",
+    [sds_glob.ARG_METHOD_AUTO, sds_glob.ARG_METHOD_RFFT, sds_glob.ARG_METHOD_SPARSE],
+)
+def test_generator_sparse(method: str, tmp_path):
+    """Test case: Generator() - Sparse polynomials in the sparse encoding."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.json")
+
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+    degree_min, degree_max = inst_config.get_degree_min(), inst_config.get_degree_max()
+
+    inst_config.set_degree(2000, 4000)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_DENSITY, 0.01)
+
+    generator.Generator(file_name)
+
+    inst_config.set_degree(degree_min, degree_max)
+    inst_config.set_config_value(sds_glob.CONFIG_PARAM_DENSITY, 1.0)
+
+    for task in task_reader.read_tasks(file_name):
+        coefficients = []
+
+        for name in (
+            sds_glob.JSON_NAME_POLYNOM_1,
+            sds_glob.JSON_NAME_POLYNOM_2,
+            sds_glob.JSON_NAME_PRODUCT,
+        ):
+            polynom = task[name]
+            assert sds_glob.JSON_NAME_EXPONENTS in polynom
+
+            dense = [0] * (polynom[sds_glob.JSON_NAME_DEGREE] + 1)
+            for exponent, coefficient in zip(
+                polynom[sds_glob.JSON_NAME_EXPONENTS],
+                polynom[sds_glob.JSON_NAME_COEFFICIENTS],
+                strict=True,
+            ):
+                assert coefficient != 0
+                dense[exponent] = coefficient
+            coefficients.append(dense)
+
+        assert (
+            kronecker_engine.multiply_kronecker(
+                coefficients[0], coefficients[1]
+            ).tolist()
+            == coefficients[2]
+        )
+
+    multiplier.Multiplier(task_reader.TaskFile(file_name), method)
+
+
+# -----------------------------------------------------------------------------
+# Test case: Generator() - Exact products beyond float64 and int64.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("coef_bits", [20, 30, 40])
+def test_generator_exact(coef_bits: int, tmp_path):
+    """Test case: Generator() - Exact products beyond float64 and int64."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.json")
+
+    # The configuration as seen by the generator.
+    inst_config = generator.sds_glob.inst_config
+    coef = (inst_config.get_coef_min(), inst_config.get_coef_max())
+    degree = (inst_config.get_degree_min(), inst_config.get_degree_max())
+
+    inst_config.set_coef(-(2**coef_bits), 2**coef_bits)
+    inst_config.set_degree(20, 40)
+
+    generator.Generator(file_name)
+
+    inst_config.set_coef(*coef)
+    inst_config.set_degree(*degree)
+
+    for task in task_reader.read_tasks(file_name):
+        coefficients_1 = task[sds_glob.JSON_NAME_POLYNOM_1][
+            sds_glob.JSON_NAME_COEFFICIENTS
+        ]
+        coefficients_2 = task[sds_glob.JSON_NAME_POLYNOM_2][
+            sds_glob.JSON_NAME_COEFFICIENTS
+        ]
+
+        expected = [0] * (len(coefficients_1) + len(coefficients_2) - 1)
+        for pos_1, coeff_1 in enumerate(coefficients_1):
+            for pos_2, coeff_2 in enumerate(coefficients_2):
+                expected[pos_1 + pos_2] += coeff_1 * coeff_2
+        while len(expected) > 1 and expected[-1] == 0:
+            expected.pop()
+
+        assert task[sds_glob.JSON_NAME_PRODUCT] == {
+            sds_glob.JSON_NAME_DEGREE: len(expected) - 1,
+            sds_glob.JSON_NAME_COEFFICIENTS: expected,
+        }
+
+    multiplier.Multiplier(
+        task_reader.TaskFile(file_name), sds_glob.ARG_METHOD_KRONECKER
+    )
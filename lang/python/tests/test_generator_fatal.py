@@ -0,0 +1,55 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""generator: fatal testing."""
+
+import os
+
+import pytest
+
+from polynomial import generator
+from polynomial import sds_glob
+from polynomial.polynomial_error import PolynomialError
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# ------------------------------------------------------------------
+# ERROR.00.920 The product coefficients up to {coef_bound} exceed
+# the int64 range of the binary task file
+# ------------------------------------------------------------------
+def test_error_00_920(tmp_path):
+    """Test ERROR_00_920."""
+    sds_glob.inst_config.set_coef(-(2**31), 2**31)
+
+    with pytest.raises(PolynomialError) as expt:
+        generator.Generator(
+            os.path.join(tmp_path, "polynom_data.bin"),
+            file_format=sds_glob.ARG_FORMAT_BINARY,
+        )
+
+    pytest.helpers.set_sds_config()
+
+    assert expt.type == PolynomialError, "ERROR.00.920"
+    assert str(expt.value)[:12] == "ERROR.00.920"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.925 The coefficients from {coef_min} to {coef_max} exceed
+# the int64 range of the generator
+# ------------------------------------------------------------------
+def test_error_00_925(tmp_path):
+    """Test ERROR_00_925."""
+    sds_glob.inst_config.set_coef(-(2**63), 2**64)
+
+    with pytest.raises(PolynomialError) as expt:
+        generator.Generator(os.path.join(tmp_path, "polynom_data.json"))
+
+    pytest.helpers.set_sds_config()
+
+    assert expt.type == PolynomialError, "ERROR.00.925"
+    assert str(expt.value)[:12] == "ERROR.00.925"
@@ -6,6 +6,11 @@
 import os
 import platform
 
+import pytest
+
+from polynomial import launcher
+from polynomial import sds_glob
+
 # -----------------------------------------------------------------------------
 # Constants & Globals.
 # -----------------------------------------------------------------------------
@@ -34,3 +39,32 @@ def test_launcher_multiply_numpy():
         os.system("src\\polynomial\\launcher.py -a multiply -m numpy")
     elif platform.system() == "Linux":
         os.system("src/polynomial/launcher.py -a multiply -m numpy")
+
+
+# -----------------------------------------------------------------------------
+# Test case: launcher() - -a stream -m fft.
+# -----------------------------------------------------------------------------
+def test_launcher_stream_fft():
+    """Test case: launcher() - Stream - fft."""
+    # -------------------------------------------------------------------------
+    if platform.system() == "Windows":
+        os.system("src\\polynomial\\launcher.py -a stream -m fft")
+    elif platform.system() == "Linux":
+        os.system("src/polynomial/launcher.py -a stream -m fft")
+
+
+# -----------------------------------------------------------------------------
+# Test case: _stream() - The Generator fails before putting any task.
+# -----------------------------------------------------------------------------
+def test_launcher_stream_generator_error(monkeypatch):
+    """Test case: _stream() - The Generator fails before putting any task."""
+
+    # -------------------------------------------------------------------------
+    def init_failing(*_args, **_kwargs):
+        raise RuntimeError("generator failed")
+
+    monkeypatch.setattr(launcher.generator.Generator, "__init__", init_failing)
+
+    with pytest.raises(RuntimeError, match="generator failed"):
+        # pylint: disable=protected-access
+        launcher._stream(sds_glob.ARG_METHOD_FFT, 1, sds_glob.ARG_VERIFY_FIRST)
@@ -4,11 +4,16 @@
 
 """multiplier: coverage testing."""
 import os
+import shutil
 
 import pytest
 
+from polynomial import kronecker_engine
 from polynomial import multiplier
 from polynomial import sds_glob
+from polynomial import sparse_engine
+from polynomial import task_reader
+from polynomial import verifier
 
 # -----------------------------------------------------------------------------
 # Constants & Globals.
@@ -16,6 +21,38 @@ from polynomial import sds_glob
 # @pytest.mark.issue
 
 
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'auto'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_auto(file_name: str):
+    """Test case: Multiplier() - Create an instance - Method 'auto'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_AUTO,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'batch'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_batch(file_name: str):
+    """Test case: Multiplier() - Create an instance - Method 'batch'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_BATCH,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Test case: Multiplier() - Create an instance - Method 'fft'.
 # -----------------------------------------------------------------------------
@@ -26,7 +63,7 @@ def test_cover_multiplier_fft_01():
 
     # -------------------------------------------------------------------------
     multiplier.Multiplier(
-        file_name=os.environ[sds_glob.POLYNOMIAL_FILE_NAME],
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
         method=sds_glob.ARG_METHOD_FFT,
     )
 
@@ -41,11 +78,78 @@ def test_cover_multiplier_fft_02():
 
     # -------------------------------------------------------------------------
     multiplier.Multiplier(
-        file_name=os.environ[sds_glob.POLYNOMIAL_FILE_NAME],
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
         method=sds_glob.ARG_METHOD_FFT,
     )
 
 
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'karatsuba'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_karatsuba(file_name: str):
+    """Test case: Multiplier() - Create an instance - Method 'karatsuba'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_CUTOFF_DEGREE, 1)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_KARATSUBA,
+    )
+
+    pytest.helpers.set_sds_config()
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'kronecker'.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_kronecker_01():
+    """Test case: Multiplier() - Create an instance - Method 'kronecker'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_01.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_KRONECKER,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'kronecker' - large coef.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_kronecker_03():
+    """Test case: Multiplier() - Create an instance - Method 'kronecker' -
+    large coef."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_03.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_KRONECKER,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'ntt'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_ntt(file_name: str):
+    """Test case: Multiplier() - Create an instance - Method 'ntt'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_NTT,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Test case: Multiplier() - Create an instance - Method 'numpy'.
 # -----------------------------------------------------------------------------
@@ -56,7 +160,7 @@ def test_cover_multiplier_numpy():
 
     # -------------------------------------------------------------------------
     multiplier.Multiplier(
-        file_name=os.environ[sds_glob.POLYNOMIAL_FILE_NAME],
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
         method=sds_glob.ARG_METHOD_NUMPY,
     )
 
@@ -71,6 +175,292 @@ def test_cover_multiplier_simple():
 
     # -------------------------------------------------------------------------
     multiplier.Multiplier(
-        file_name=os.environ[sds_glob.POLYNOMIAL_FILE_NAME],
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
         method=sds_glob.ARG_METHOD_SIMPLE,
     )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'rfft'.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_rfft_01():
+    """Test case: Multiplier() - Create an instance - Method 'rfft'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_01.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_RFFT,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'rfft' - large coef.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_rfft_03():
+    """Test case: Multiplier() - Create an instance - Method 'rfft' - large
+    coef."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_03.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_RFFT,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'rfft' - int64 edges.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "method", [sds_glob.ARG_METHOD_BATCH, sds_glob.ARG_METHOD_RFFT]
+)
+def test_cover_multiplier_rfft_04(method: str):
+    """Test case: Multiplier() - Create an instance - Method 'rfft' - int64
+    edges."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_04.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=method,
+        verify=sds_glob.ARG_VERIFY_ALL,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'simple' - large coef.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_simple_03():
+    """Test case: Multiplier() - Create an instance - Method 'simple' - large
+    coef."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_03.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_SIMPLE,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'sparse'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_sparse(file_name: str):
+    """Test case: Multiplier() - Create an instance - Method 'sparse'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_SPARSE,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: multiply_sparse() - A zero polynomial has no product terms.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_sparse_zero():
+    """Test case: multiply_sparse() - A zero polynomial has no product terms."""
+    # -------------------------------------------------------------------------
+    assert len(sparse_engine.multiply_sparse([0, 0, 0], [1, 2])) == 0
+    assert len(sparse_engine.multiply_sparse([1, 2], [0])) == 0
+
+    # pylint: disable=protected-access
+    instance = multiplier.Multiplier.__new__(multiplier.Multiplier)
+    instance._init_task_data(sds_glob.ARG_METHOD_SPARSE, sds_glob.ARG_VERIFY_FIRST)
+    instance._poly_1_coeff = [0, 0, 0]
+    instance._poly_2_coeff = [1, 2]
+
+    assert len(instance._multiply(sds_glob.ARG_METHOD_SPARSE)) == 0
+    assert len(instance._multiply(sds_glob.ARG_METHOD_SIMPLE)) == 0
+
+
+# -----------------------------------------------------------------------------
+# Test case: multiply_sparse() - Like terms merged over several steps.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("coef_max", [7, 2**40])
+def test_cover_multiplier_sparse_steps(coef_max: int, monkeypatch):
+    """Test case: multiply_sparse() - Like terms merged over several steps."""
+    # -------------------------------------------------------------------------
+    monkeypatch.setattr(sparse_engine, "_STEP_TERMS", 3)
+
+    coefficients_1 = [coef_max, 0, -coef_max, 0, 0, 3, 0, -coef_max]
+    coefficients_2 = [coef_max, 0, 0, coef_max, -5, 0, coef_max]
+
+    assert (
+        sparse_engine.multiply_sparse(coefficients_1, coefficients_2).tolist()
+        == kronecker_engine.multiply_kronecker(coefficients_1, coefficients_2).tolist()
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Phases and throughput.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "method,verify",
+    [
+        (sds_glob.ARG_METHOD_BATCH, sds_glob.ARG_VERIFY_FIRST),
+        (sds_glob.ARG_METHOD_SIMPLE, sds_glob.ARG_VERIFY_FIRST),
+        (sds_glob.ARG_METHOD_SIMPLE, sds_glob.ARG_VERIFY_PROBABILISTIC),
+    ],
+)
+def test_cover_multiplier_statistics(method: str, verify: str, capsys):
+    """Test case: Multiplier() - Create an instance - Phases and throughput."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_03.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=method,
+        verify=verify,
+    )
+
+    output = capsys.readouterr().out
+
+    for phase in ("task", "parse", "convert", "multiply", "verify"):
+        assert f"Total time phase {phase:8s} (p50: " in output, f"phase {phase}"
+    assert "tasks/s - " in output, "throughput missing"
+    assert " GFLOP/s effective" in output, "GFLOP estimate missing"
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Selected tasks.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("workers", [1, 2])
+@pytest.mark.parametrize(
+    "method", [sds_glob.ARG_METHOD_BATCH, sds_glob.ARG_METHOD_SIMPLE]
+)
+def test_cover_multiplier_tasks(method: str, workers: int, tmp_path):
+    """Test case: Multiplier() - Create an instance - Selected tasks."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "polynom_data.json")
+
+    shutil.copy(
+        pytest.helpers.get_full_name_from_components(
+            pytest.helpers.get_test_files_source_directory_name(),
+            "polynom_data_03.json",
+        ),
+        file_name,
+    )
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(file_name, sds_glob.ARG_FORMAT_JSON, "2"),
+        method=method,
+        workers=workers,
+    )
+
+    assert os.path.isfile(file_name + task_reader.INDEX_SUFFIX)
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Method 'toom3'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_toom3(file_name: str):
+    """Test case: Multiplier() - Create an instance - Method 'toom3'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_CUTOFF_DEGREE, 1)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_TOOM3,
+    )
+
+    pytest.helpers.set_sds_config()
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Worker processes.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "method", [sds_glob.ARG_METHOD_BATCH, sds_glob.ARG_METHOD_KRONECKER]
+)
+def test_cover_multiplier_workers(method: str):
+    """Test case: Multiplier() - Create an instance - Worker processes."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_01.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=method,
+        workers=2,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Verification 'all'.
+# -----------------------------------------------------------------------------
+def test_cover_multiplier_verify_all():
+    """Test case: Multiplier() - Create an instance - Verification 'all'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest("polynom_data_03.json")
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_KRONECKER,
+        verify=sds_glob.ARG_VERIFY_ALL,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Multiplier() - Create an instance - Verification 'probabilistic'.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_cover_multiplier_verify_probabilistic(file_name: str):
+    """Test case: Multiplier() - Create an instance - Verification 'probabilistic'."""
+    # -------------------------------------------------------------------------
+    pytest.helpers.copy_file_4_pytest(file_name)
+
+    # -------------------------------------------------------------------------
+    multiplier.Multiplier(
+        source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+        method=sds_glob.ARG_METHOD_BATCH,
+        verify=sds_glob.ARG_VERIFY_PROBABILISTIC,
+    )
+
+
+# -----------------------------------------------------------------------------
+# Test case: Verification 'probabilistic' - Random primes and chunks.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("coef_max", [7, 2**40])
+def test_cover_multiplier_verify_probabilistic_chunks(coef_max: int, monkeypatch):
+    """Test case: Verification 'probabilistic' - Random primes and chunks."""
+    # -------------------------------------------------------------------------
+    monkeypatch.setattr(verifier, "_CHUNK_ELEMENTS", 16)
+
+    coefficients_1 = [coef_max - index for index in range(37)]
+    coefficients_2 = [index - coef_max for index in range(23)]
+
+    prod_coeff = kronecker_engine.multiply_kronecker(
+        coefficients_1, coefficients_2
+    ).tolist()
+
+    instance = verifier.Verifier(sds_glob.ARG_VERIFY_PROBABILISTIC)
+
+    assert not instance.check_product_probabilistic(
+        0, (coefficients_1, coefficients_2), (prod_coeff, len(prod_coeff) - 1)
+    )
+
+    # A difference divisible by a fixed prime must not pass.
+    prod_coeff[30] += 2**31 - 1
+
+    differences = instance.check_product_probabilistic(
+        0, (coefficients_1, coefficients_2), (prod_coeff, len(prod_coeff) - 1)
+    )
+
+    assert len(differences) == 1
+    assert "ERROR.00.918" in differences[0]
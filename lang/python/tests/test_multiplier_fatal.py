@@ -4,10 +4,15 @@
 
 """multiplier: fatal testing."""
 
+import os
+import shutil
+
 import pytest
 
 from polynomial import multiplier
 from polynomial import sds_glob
+from polynomial import task_reader
+from polynomial import tuning_table
 from polynomial.polynomial_error import PolynomialError
 
 # -----------------------------------------------------------------------------
@@ -24,9 +29,199 @@ def test_error_00_902():
     """Test ERROR_00_902."""
     with pytest.raises(PolynomialError) as expt:
         multiplier.Multiplier(
-            file_name=sds_glob.INFORMATION_NOT_YET_AVAILABLE,
+            source=task_reader.TaskFile(sds_glob.INFORMATION_NOT_YET_AVAILABLE),
             method=sds_glob.INFORMATION_NOT_YET_AVAILABLE,
         )
 
     assert expt.type == PolynomialError, "ERROR.00.902"
     assert str(expt.value)[:12] == "ERROR.00.902"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.911 Difference in task no. {task_no} degree {degree}
+# got {got} instead of {instead}
+# ------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "method",
+    [
+        sds_glob.ARG_METHOD_BATCH,
+        sds_glob.ARG_METHOD_FFT,
+        sds_glob.ARG_METHOD_NUMPY,
+        sds_glob.ARG_METHOD_SIMPLE,
+    ],
+)
+def test_error_00_911(method: str):
+    """Test ERROR_00_911."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_911.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+            method=method,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.911"
+    assert str(expt.value)[:12] == "ERROR.00.911"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.913 Illegal entry '{key} = {value}' in the tuning file
+# '{file}'
+# ------------------------------------------------------------------
+def test_error_00_913():
+    """Test ERROR_00_913."""
+    with pytest.raises(PolynomialError) as expt:
+        tuning_table.load_tuning_file(
+            pytest.helpers.get_full_name_from_components(
+                pytest.helpers.get_test_files_source_directory_name(),
+                "tuning_913.cfg",
+            )
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.913"
+    assert str(expt.value)[:12] == "ERROR.00.913"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.914 The number of workers must be at least 1 and not
+# {workers}
+# ------------------------------------------------------------------
+def test_error_00_914():
+    """Test ERROR_00_914."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_01.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+            method=sds_glob.ARG_METHOD_SIMPLE,
+            workers=0,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.914"
+    assert str(expt.value)[:12] == "ERROR.00.914"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.915 Difference in task no. {task_no} got degree {got}
+# instead of {instead}
+# ------------------------------------------------------------------
+def test_error_00_915():
+    """Test ERROR_00_915."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_915.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+            method=sds_glob.ARG_METHOD_SIMPLE,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.915"
+    assert str(expt.value)[:12] == "ERROR.00.915"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.916 {no_differences} difference(s) in {no_tasks} task(s)
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("workers", [1, 2])
+def test_error_00_916(workers: int):
+    """Test ERROR_00_916."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_911.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+            method=sds_glob.ARG_METHOD_KRONECKER,
+            workers=workers,
+            verify=sds_glob.ARG_VERIFY_ALL,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.916"
+    assert str(expt.value) == "ERROR.00.916 2 difference(s) in 2 task(s)"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.918 Difference in task no. {task_no} at the point {point}
+# modulo {prime} got {got} instead of {instead}
+# ------------------------------------------------------------------
+def test_error_00_918(capsys):
+    """Test ERROR_00_918."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_911.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(os.environ[sds_glob.POLYNOMIAL_FILE_NAME]),
+            method=sds_glob.ARG_METHOD_SIMPLE,
+            verify=sds_glob.ARG_VERIFY_PROBABILISTIC,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.918"
+    assert str(expt.value) == "ERROR.00.916 3 difference(s) in 2 task(s)"
+    assert "ERROR.00.918 Difference in task no. 1 " in capsys.readouterr().out
+
+
+# ------------------------------------------------------------------
+# ERROR.00.919 The file {file_name} is not a binary task file
+# of version {version}
+# ------------------------------------------------------------------
+def test_error_00_919():
+    """Test ERROR_00_919."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_01.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(
+                os.environ[sds_glob.POLYNOMIAL_FILE_NAME], sds_glob.ARG_FORMAT_BINARY
+            ),
+            method=sds_glob.ARG_METHOD_SIMPLE,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.919"
+    assert str(expt.value)[:12] == "ERROR.00.919"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.921 The task selection '{tasks}' is invalid
+# ------------------------------------------------------------------
+@pytest.mark.parametrize("tasks", ["0", "2-1", "1,,2", "a"])
+def test_error_00_921(tasks: str):
+    """Test ERROR_00_921."""
+    pytest.helpers.copy_file_4_pytest("polynom_data_01.json")
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(
+                os.environ[sds_glob.POLYNOMIAL_FILE_NAME],
+                sds_glob.ARG_FORMAT_JSON,
+                tasks,
+            ),
+            method=sds_glob.ARG_METHOD_SIMPLE,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.921"
+    assert str(expt.value)[:12] == "ERROR.00.921"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.922 The task no. {task_no} does not exist in the task
+# file {file_name}
+# ------------------------------------------------------------------
+def test_error_00_922(tmp_path):
+    """Test ERROR_00_922."""
+    file_name = os.path.join(tmp_path, "polynom_data.json")
+
+    shutil.copy(
+        pytest.helpers.get_full_name_from_components(
+            pytest.helpers.get_test_files_source_directory_name(),
+            "polynom_data_01.json",
+        ),
+        file_name,
+    )
+
+    with pytest.raises(PolynomialError) as expt:
+        multiplier.Multiplier(
+            source=task_reader.TaskFile(file_name, sds_glob.ARG_FORMAT_JSON, "1,3"),
+            method=sds_glob.ARG_METHOD_SIMPLE,
+        )
+
+    assert expt.type == PolynomialError, "ERROR.00.922"
+    assert str(expt.value)[:12] == "ERROR.00.922"
@@ -20,9 +20,39 @@ def test_exists():
     """Test case: exists() - Check the object existence."""
     my_instance = sds_config.Config()
 
+    my_instance.set_config_value(
+        sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, "14, 62"
+    )
+    my_instance.set_config_value(
+        sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, [16, 256]
+    )
+    my_instance.set_config_value(
+        sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, "5"
+    )
+    my_instance.set_config_value(
+        sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES,
+        "fft=0.5, Simple:4096=1",
+    )
+    my_instance.set_config_value(
+        sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES, {"ntt": 0.1}
+    )
+    my_instance.set_config_value(
+        sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_TOLERANCE, "0.5"
+    )
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, 0)
+
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_DENSITY, "0.05")
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_DENSITY, 1)
+
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_NO_SHARDS, "4")
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_NO_SHARDS, 1)
+
     my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_NO_TASKS, "4711")
     my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_NO_TASKS, 1)
 
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_SEED, "4711")
+    my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_SEED, -1)
+
     my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_VERBOSE, "FaLse")
     my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_VERBOSE, "trUE")
     my_instance.set_config_value(sds_config.sds_glob.CONFIG_PARAM_VERBOSE, True)
@@ -150,3 +150,231 @@ def test_error_00_910():
 
     assert expt.type == polynomial_error.PolynomialError, "ERROR.00.910"
     assert str(expt.value)[:12] == "ERROR.00.910"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.912 The cutoff degree must be at least 1 and
+# not {cutoff_degree}
+# ------------------------------------------------------------------
+def test_error_00_912():
+    """Test ERROR_00_912."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_CUTOFF_DEGREE, 0)
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.912"
+    assert str(expt.value)[:12] == "ERROR.00.912"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.917 The number of error bits must be at least 1 and
+# not {verify_error_bits}
+# ------------------------------------------------------------------
+def test_error_00_917():
+    """Test ERROR_00_917."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_VERIFY_ERROR_BITS, 0
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.917"
+    assert str(expt.value)[:12] == "ERROR.00.917"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.923 The number of shards must be at least 1 and
+# not {no_shards}
+# ------------------------------------------------------------------
+def test_error_00_923():
+    """Test ERROR_00_923."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_NO_SHARDS, 0)
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.923"
+    assert str(expt.value)[:12] == "ERROR.00.923"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.924 The seed must be at least -1 and not {seed}
+# ------------------------------------------------------------------
+def test_error_00_924():
+    """Test ERROR_00_924."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_SEED, -2)
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.924"
+    assert str(expt.value)[:12] == "ERROR.00.924"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.926 Illegal configuration parameter value '{value}' -
+# only numbers are allowed
+# ------------------------------------------------------------------
+def test_error_00_926():
+    """Test ERROR_00_926."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_DENSITY, "dense")
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.926"
+    assert str(expt.value)[:12] == "ERROR.00.926"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.927 The density must be greater than 0 and at most 1 and
+# not {density}
+# ------------------------------------------------------------------
+def test_error_00_927():
+    """Test ERROR_00_927."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(sds_glob.CONFIG_PARAM_DENSITY, 0)
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.927"
+    assert str(expt.value)[:12] == "ERROR.00.927"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.928 Illegal configuration parameter value '{value}' -
+# only comma-separated integers are allowed
+# ------------------------------------------------------------------
+def test_error_00_928():
+    """Test ERROR_00_928."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_DEGREES, "16,many"
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.928"
+    assert str(expt.value)[:12] == "ERROR.00.928"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.929 The benchmark grid needs coefficient bits from 1 to 63
+# and degrees of at least 1 and not {coef_bits} and {degrees}
+# ------------------------------------------------------------------
+def test_error_00_929():
+    """Test ERROR_00_929."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_COEF_BITS, [14, 64]
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.929"
+    assert str(expt.value)[:12] == "ERROR.00.929"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.930 The number of benchmark repetitions must be at least 1
+# and not {repetitions}
+# ------------------------------------------------------------------
+def test_error_00_930():
+    """Test ERROR_00_930."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_REPETITIONS, 0
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.930"
+    assert str(expt.value)[:12] == "ERROR.00.930"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.931 The number of benchmark warmups must be at least 0 and
+# not {warmups}
+# ------------------------------------------------------------------
+def test_error_00_931():
+    """Test ERROR_00_931."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_WARMUPS, -1
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.931"
+    assert str(expt.value)[:12] == "ERROR.00.931"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.932 Illegal configuration parameter value '{value}' - only
+# comma-separated 'method=tolerance' or 'method:degree=tolerance' are
+# allowed
+# ------------------------------------------------------------------
+def test_error_00_932():
+    """Test ERROR_00_932."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES, "fft:large=0.5"
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.932"
+    assert str(expt.value)[:12] == "ERROR.00.932"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.933 The benchmark tolerances must be at least 0 and not
+# {tolerance} and {method_tolerances}
+# ------------------------------------------------------------------
+def test_error_00_933():
+    """Test ERROR_00_933."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_BENCHMARK_METHOD_TOLERANCES, {"fft": -0.5}
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.933"
+    assert str(expt.value)[:12] == "ERROR.00.933"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.936 The calibration grid needs coefficient bits from 1 to 63
+# and sizes of at least 1 and not {coef_bits} and {sizes}
+# ------------------------------------------------------------------
+def test_error_00_936():
+    """Test ERROR_00_936."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_CALIBRATE_SIZES, "16,0"
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.936"
+    assert str(expt.value)[:12] == "ERROR.00.936"
+
+
+# ------------------------------------------------------------------
+# ERROR.00.937 The number of calibration repetitions must be at least 1
+# and not {repetitions}
+# ------------------------------------------------------------------
+def test_error_00_937():
+    """Test ERROR_00_937."""
+    sds_glob.inst_config = sds_config.Config()
+
+    with pytest.raises(polynomial_error.PolynomialError) as expt:
+        sds_glob.inst_config.set_config_value(
+            sds_glob.CONFIG_PARAM_CALIBRATE_REPETITIONS, 0
+        )
+
+    assert expt.type == polynomial_error.PolynomialError, "ERROR.00.937"
+    assert str(expt.value)[:12] == "ERROR.00.937"
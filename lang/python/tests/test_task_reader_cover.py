@@ -0,0 +1,187 @@
+# Copyright (c) 2022 FAA-VAIL-Project. All rights reserved.
+# Use of this source code is governed by the GNU LESSER GENERAL
+# PUBLIC LICENSE, that can be found in the LICENSE.md file.
+
+"""task_reader: coverage testing."""
+import json
+import os
+import shutil
+import threading
+
+import pytest
+
+from polynomial import task_reader
+
+# -----------------------------------------------------------------------------
+# Constants & Globals.
+# -----------------------------------------------------------------------------
+# @pytest.mark.issue
+
+
+# -----------------------------------------------------------------------------
+# Test case: read_tasks() - Compare with json.load().
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("read_size", [1, 7, 1 << 20])
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_read_tasks(file_name: str, read_size: int, monkeypatch):
+    """Test case: read_tasks() - Compare with json.load()."""
+    # -------------------------------------------------------------------------
+    full_name = pytest.helpers.get_full_name_from_components(
+        pytest.helpers.get_test_files_source_directory_name(), file_name
+    )
+
+    with open(full_name, "r", encoding="utf-8") as file_handle:
+        expected = json.load(file_handle)["tasks"]
+
+    monkeypatch.setattr(task_reader, "_READ_SIZE", read_size)
+
+    assert list(task_reader.read_tasks(full_name)) == expected
+
+
+# -----------------------------------------------------------------------------
+# Test case: read_tasks() - Compact file with further members.
+# -----------------------------------------------------------------------------
+def test_read_tasks_compact(tmp_path):
+    """Test case: read_tasks() - Compact file with further members."""
+    # -------------------------------------------------------------------------
+    file_name = os.path.join(tmp_path, "compact.json")
+
+    with open(file_name, "w", encoding="utf-8") as file_handle:
+        file_handle.write('{"tasks":[{"taskNo":1},{"taskNo":2}],"moTasks":2}')
+
+    assert list(task_reader.read_tasks(file_name)) == [{"taskNo": 1}, {"taskNo": 2}]
+
+    with open(file_name, "w", encoding="utf-8") as file_handle:
+        file_handle.write('{"moTasks": 0, "tasks": [ ]}')
+
+    assert not list(task_reader.read_tasks(file_name))
+
+
+# -----------------------------------------------------------------------------
+# Test case: is_manifest() - Task files are no manifests.
+# -----------------------------------------------------------------------------
+def test_is_manifest(tmp_path):
+    """Test case: is_manifest() - Task files are no manifests."""
+    # -------------------------------------------------------------------------
+    assert not task_reader.is_manifest(
+        pytest.helpers.get_full_name_from_components(
+            pytest.helpers.get_test_files_source_directory_name(),
+            "polynom_data_01.json",
+        )
+    )
+
+    file_name = os.path.join(tmp_path, "polynom_data.bin")
+
+    with open(file_name, "wb") as file_handle:
+        file_handle.write(task_reader.BINARY_MAGIC)
+
+    assert not task_reader.is_manifest(file_name)
+
+
+# -----------------------------------------------------------------------------
+# Test case: parse_task_selection() - Task numbers and ranges.
+# -----------------------------------------------------------------------------
+def test_parse_task_selection():
+    """Test case: parse_task_selection() - Task numbers and ranges."""
+    # -------------------------------------------------------------------------
+    assert task_reader.parse_task_selection("120-122,5") == [5, 120, 121, 122]
+    assert task_reader.parse_task_selection(" 3 , 1-3 ") == [1, 2, 3]
+
+
+# -----------------------------------------------------------------------------
+# Test case: read_selected_tasks() - Compare with read_tasks().
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("file_name", ["polynom_data_01.json", "polynom_data_03.json"])
+def test_read_selected_tasks(file_name: str, tmp_path):
+    """Test case: read_selected_tasks() - Compare with read_tasks()."""
+    # -------------------------------------------------------------------------
+    full_name = os.path.join(tmp_path, file_name)
+
+    shutil.copy(
+        pytest.helpers.get_full_name_from_components(
+            pytest.helpers.get_test_files_source_directory_name(), file_name
+        ),
+        full_name,
+    )
+
+    expected = list(enumerate(task_reader.read_tasks(full_name)))
+
+    # The index file is created, then used and finally replaced if it
+    # does not match the JSON file any more.
+    for _ in range(2):
+        assert (
+            list(task_reader.read_selected_tasks(full_name, "json", [1, 2])) == expected
+        )
+        assert os.path.isfile(full_name + task_reader.INDEX_SUFFIX)
+
+    with open(full_name + task_reader.INDEX_SUFFIX, "wb") as file_handle:
+        file_handle.write(b"stale")
+
+    assert list(task_reader.read_selected_tasks(full_name, "json", [2])) == [
+        expected[1]
+    ]
+
+
+# -----------------------------------------------------------------------------
+# Test case: open_task_file() - Read compressed JSON files.
+# -----------------------------------------------------------------------------
+@pytest.mark.parametrize("suffix", [task_reader.SUFFIX_GZIP, task_reader.SUFFIX_XZ])
+def test_open_task_file(suffix: str, tmp_path):
+    """Test case: open_task_file() - Read compressed JSON files."""
+    # -------------------------------------------------------------------------
+    source_name = pytest.helpers.get_full_name_from_components(
+        pytest.helpers.get_test_files_source_directory_name(), "polynom_data_03.json"
+    )
+    file_name = os.path.join(tmp_path, "polynom_data_03.json" + suffix)
+
+    with open(source_name, "rb") as source_handle, task_reader.open_task_file(
+        file_name, "wb"
+    ) as file_handle:
+        shutil.copyfileobj(source_handle, file_handle)
+
+    assert task_reader.is_compressed(file_name)
+    assert not task_reader.is_compressed(source_name)
+    assert not task_reader.is_manifest(file_name)
+
+    expected = list(task_reader.read_tasks(source_name))
+
+    assert list(task_reader.read_tasks(file_name)) == expected
+    assert list(task_reader.read_selected_tasks(file_name, "json", [2])) == [
+        (1, expected[1])
+    ]
+
+
+# -----------------------------------------------------------------------------
+# Test case: TaskQueue() - The consumer stops the blocked producer.
+# -----------------------------------------------------------------------------
+def test_task_queue_close():
+    """Test case: TaskQueue() - The consumer stops the blocked producer."""
+    # -------------------------------------------------------------------------
+    task_queue = task_reader.TaskQueue(2)
+    produced = []
+
+    def tasks():
+        for task_no in range(1000):
+            produced.append(task_no)
+            yield task_no, {}
+
+    thread = threading.Thread(target=task_queue.put_tasks, args=(tasks(),))
+    thread.start()
+
+    consumed = []
+    for task_no, _ in task_queue.get_tasks():
+        consumed.append(task_no)
+        if task_no == 4:
+            break
+
+    task_queue.close()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert consumed == [0, 1, 2, 3, 4]
+    assert len(produced) < 10
+
+    task_queue = task_reader.TaskQueue()
+    task_queue.put_tasks(enumerate([{}, {}]))
+
+    assert list(task_queue.get_tasks()) == [(0, {}), (1, {})]